@@ -23,6 +23,16 @@ CREATE TABLE departments (
     FOREIGN KEY (manager_id) REFERENCES employees (id)
 );
 
+-- 부서 계층 클로저 테이블 (조상-자손 전체 쌍, 자기 자신 depth=0 포함)
+CREATE TABLE department_closure (
+    ancestor_id INTEGER NOT NULL,
+    descendant_id INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES departments (id),
+    FOREIGN KEY (descendant_id) REFERENCES departments (id)
+);
+
 -- 직원 테이블
 CREATE TABLE employees (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -114,6 +124,50 @@ CREATE TABLE annual_leave_requests (
     FOREIGN KEY (approved_by) REFERENCES employees (id)
 );
 
+-- 연차 잔여 원장 테이블 (직원별 연도별 부여/사용/대기 합계)
+CREATE TABLE annual_leave_balances (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    granted_days REAL NOT NULL DEFAULT 0,
+    used_days REAL NOT NULL DEFAULT 0,
+    pending_days REAL NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (id),
+    UNIQUE(employee_id, year)
+);
+
+-- 월별 출퇴근 집계 테이블 (직원별 월별 상태 일수/근무시간 합계)
+CREATE TABLE attendance_monthly_summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    total_days INTEGER NOT NULL DEFAULT 0,
+    present_days INTEGER NOT NULL DEFAULT 0,
+    late_days INTEGER NOT NULL DEFAULT 0,
+    early_leave_days INTEGER NOT NULL DEFAULT 0,
+    absent_days INTEGER NOT NULL DEFAULT 0,
+    on_leave_days INTEGER NOT NULL DEFAULT 0,
+    work_hours REAL NOT NULL DEFAULT 0,
+    work_hours_days INTEGER NOT NULL DEFAULT 0,
+    overtime_hours REAL NOT NULL DEFAULT 0,
+    late_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (id),
+    UNIQUE(employee_id, year, month)
+);
+
+-- 공휴일 테이블 (영업일 계산)
+CREATE TABLE holidays (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date DATE NOT NULL UNIQUE,
+    name VARCHAR(100) NOT NULL,
+    type VARCHAR(20) DEFAULT 'public',
+    is_working_day BOOLEAN DEFAULT FALSE,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- 급여 기록 테이블
 CREATE TABLE payroll_records (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -228,16 +282,21 @@ CREATE TABLE audit_logs (
 -- 인덱스 생성
 CREATE INDEX idx_employees_user_id ON employees(user_id);
 CREATE INDEX idx_employees_department_id ON employees(department_id);
+CREATE INDEX idx_department_closure_descendant ON department_closure(descendant_id);
 CREATE INDEX idx_employees_employee_number ON employees(employee_number);
 CREATE INDEX idx_attendance_employee_date ON attendance_records(employee_id, date);
+CREATE INDEX idx_attendance_summary_year_month ON attendance_monthly_summaries(year, month);
+CREATE INDEX idx_attendance_date_status ON attendance_records(date, status);
 CREATE INDEX idx_annual_leave_grants_employee_year ON annual_leave_grants(employee_id, year);
 CREATE INDEX idx_annual_leave_usage_employee ON annual_leave_usage(employee_id);
 CREATE INDEX idx_annual_leave_requests_employee ON annual_leave_requests(employee_id);
+CREATE INDEX idx_annual_leave_requests_employee_dates ON annual_leave_requests(employee_id, start_date, end_date);
 CREATE INDEX idx_payroll_employee_year_month ON payroll_records(employee_id, year, month);
 CREATE INDEX idx_bonus_distributions_calculation ON bonus_distributions(calculation_id);
 CREATE INDEX idx_evaluations_employee ON evaluations(employee_id);
-CREATE INDEX idx_audit_logs_user_id ON audit_logs(user_id);
 CREATE INDEX idx_audit_logs_created_at ON audit_logs(created_at);
+CREATE INDEX idx_audit_logs_user_created ON audit_logs(user_id, created_at);
+CREATE INDEX idx_audit_logs_entity_created ON audit_logs(entity_type, created_at);
 
 -- 기본 데이터 삽입
 
@@ -248,6 +307,9 @@ INSERT INTO departments (id, name, description) VALUES
 (3, '영업팀', '영업 및 마케팅 부서'),
 (4, '인사팀', '인사 관리 부서');
 
+INSERT INTO department_closure (ancestor_id, descendant_id, depth) VALUES 
+(1, 1, 0), (2, 2, 0), (3, 3, 0), (4, 4, 0);
+
 -- 관리자 계정 생성
 INSERT INTO users (id, username, password_hash, role) VALUES 
 (1, 'admin', '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj6hsIpx7QBG', 'admin');
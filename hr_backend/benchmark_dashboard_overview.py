@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+대시보드 개요 통계 응답 시간 측정 (기존 extract() 쿼리 vs 도메인별 집계 vs 캐시 적중)
+사용법: python benchmark_dashboard_overview.py [직원 수] [출근 기록 수] [--db PATH]
+       (기본 5000명, 2,000,000건 / --db 지정 시 기존 측정 DB가 있으면 재사용)
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask
+from sqlalchemy import func, extract
+
+import src.main  # noqa: F401  (모델 등록)
+from src.database import db
+from src.models.employee import Employee
+from src.models.department import Department
+from src.models.attendance import AttendanceRecord
+from src.models.annual_leave_usage import AnnualLeaveUsage
+from src.models.evaluation_simple import Evaluation
+from src.models.payroll import Payroll
+from src.utils.dashboard_overview import overview_engine
+
+DEPARTMENT_COUNT = 20
+LEAVE_USAGE_COUNT = 50000
+START_DATE = date(2025, 1, 1)
+STATUSES = ['present'] * 8 + ['late', 'absent', '지각', '결근']
+
+def create_app(path):
+    """측정용 앱 (별도 SQLite 파일)"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    return app
+
+def seed(path, employee_count, attendance_count):
+    """측정용 데이터 생성 (ORM 대신 sqlite3 executemany)"""
+    rnd = random.Random(1)
+    now = datetime.now().isoformat(' ')
+    days = max(1, attendance_count // employee_count)
+    connection = sqlite3.connect(path)
+    connection.executemany(
+        "INSERT INTO departments (id, name, code, is_active, created_at) VALUES (?, ?, ?, 1, ?)",
+        [(i, f'부서{i}', f'D{i}', now) for i in range(1, DEPARTMENT_COUNT + 1)]
+    )
+    connection.executemany(
+        "INSERT INTO employees (id, user_id, employee_number, name, email, department_id, hire_date, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, '2020-01-01', 'active', ?)",
+        [(i, i, f'E{i:05d}', f'직원{i}', f'e{i}@company.com', i % DEPARTMENT_COUNT + 1, now)
+         for i in range(1, employee_count + 1)]
+    )
+    connection.executemany(
+        "INSERT INTO attendance_records (employee_id, date, work_hours, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ((k % employee_count + 1, (START_DATE + timedelta(days=k // employee_count)).isoformat(),
+          rnd.random() * 10, rnd.choice(STATUSES), now, now) for k in range(attendance_count))
+    )
+    connection.executemany(
+        "INSERT INTO annual_leave_usages (employee_id, usage_date, used_days, leave_type, created_by) "
+        "VALUES (?, ?, 1, 'full', 1)",
+        [(i % employee_count + 1, (START_DATE + timedelta(days=i % days)).isoformat())
+         for i in range(LEAVE_USAGE_COUNT)]
+    )
+    connection.executemany(
+        "INSERT INTO payrolls (employee_id, year, month, base_salary, total_payment, total_deductions, net_pay) "
+        "VALUES (?, ?, ?, 3000000, 3000000, 300000, 2700000)",
+        [(e, 2025, m) for e in range(1, employee_count + 1) for m in range(1, 13)]
+    )
+    connection.commit()
+    connection.close()
+
+def legacy_overview(year, month):
+    """기존 방식: 통계별 개별 쿼리 + extract() 날짜 조건"""
+    same_month = (extract('year', AttendanceRecord.date) == year, extract('month', AttendanceRecord.date) == month)
+    Employee.query.count()
+    Department.query.count()
+    AttendanceRecord.query.filter(*same_month).count()
+    AttendanceRecord.query.filter(*same_month, AttendanceRecord.status == '지각').count()
+    AttendanceRecord.query.filter(*same_month, AttendanceRecord.status == '결근').count()
+    db.session.query(func.avg(AttendanceRecord.work_hours)).filter(*same_month).scalar()
+    db.session.query(func.sum(AnnualLeaveUsage.used_days), func.count(AnnualLeaveUsage.id)).filter(
+        extract('year', AnnualLeaveUsage.usage_date) == year
+    ).first()
+    Evaluation.query.filter(extract('year', Evaluation.created_at) == year).count()
+    Evaluation.query.filter(extract('year', Evaluation.created_at) == year, Evaluation.status == 'completed').count()
+    db.session.query(func.count(Payroll.id), func.sum(Payroll.net_pay)).filter(
+        Payroll.year == year, Payroll.month == month
+    ).first()
+
+def measure(label, func, repeat=5):
+    best = min(_elapsed(func) for _ in range(repeat))
+    print(f"{label:<28} {best * 1000:10.3f} ms (최소 {repeat}회)")
+
+def _elapsed(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    employee_count = int(args[0]) if len(args) > 0 else 5000
+    attendance_count = int(args[1]) if len(args) > 1 else 2000000
+    path = sys.argv[sys.argv.index('--db') + 1] if '--db' in sys.argv else \
+        os.path.join(tempfile.mkdtemp(), 'benchmark_dashboard.db')
+
+    reuse = os.path.exists(path)
+    app = create_app(path)
+    if not reuse:
+        started = time.perf_counter()
+        seed(path, employee_count, attendance_count)
+        print(f"데이터 생성: 직원 {employee_count}명, 출근 기록 {attendance_count}건 ({time.perf_counter() - started:.1f}초)")
+
+    year, month = 2025, 6
+    with app.test_request_context():
+        measure('기존 방식 (extract)', lambda: legacy_overview(year, month))
+        measure('도메인별 집계 (캐시 미사용)', lambda: overview_engine.compute(year, month))
+        overview_engine.get_overview(year, month)
+        measure('캐시 적중', lambda: overview_engine.get_overview(year, month), repeat=1000)
+
+if __name__ == "__main__":
+    main()
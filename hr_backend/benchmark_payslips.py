@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+급여명세서 일괄 PDF 생성 처리량 측정 (초당 급여명세서 수)
+사용법: python benchmark_payslips.py [건수] [워커 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.utils.pdf_generator import PayrollPDFGenerator
+from src.utils.payslip_bulk import (
+    PAYSLIP_FIELD_MAP, PAYSLIP_ZERO_FIELDS, payslip_view, render_payslips_pdf, render_payslips_zip
+)
+
+def make_records(count):
+    """측정용 급여명세서 데이터 생성"""
+    records = []
+    for index in range(count):
+        record = {field: 0.0 for field in PAYSLIP_FIELD_MAP}
+        record.update({field: 0 for field in PAYSLIP_ZERO_FIELDS})
+        record.update(
+            basic_salary=3000000 + index * 1000,
+            overtime_allowance=150000,
+            gross_pay=3150000 + index * 1000,
+            national_pension=141750,
+            income_tax=120000,
+            total_deductions=261750,
+            net_pay=2888250 + index * 1000,
+            overtime_hours=10.0,
+            period='2025-01',
+            work_days=21,
+            memo=None,
+            is_final=False,
+            employee={
+                'name': f'직원{index}',
+                'employee_number': f'EMP{index:05d}',
+                'position': '사원',
+                'department': {'name': '개발팀'}
+            }
+        )
+        records.append(record)
+    return records
+
+def measure(label, count, func):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {count:>6}건  {elapsed:7.2f}초  {count / elapsed:8.1f}건/초")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else min(4, os.cpu_count() or 1)
+    records = make_records(count)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        measure('직원별 생성기 생성 (기존 방식)', count, lambda: [
+            PayrollPDFGenerator().generate_payroll_pdf(payslip_view(record)) for record in records
+        ])
+        measure('단일 PDF (공용 생성기)', count, lambda: render_payslips_pdf(
+            records, os.path.join(workdir, 'payslips.pdf')
+        ))
+        measure('ZIP (현재 프로세스)', count, lambda: render_payslips_zip(
+            records, os.path.join(workdir, 'payslips_1.zip'), workers=1
+        ))
+        if workers > 1:
+            measure(f'ZIP (프로세스 풀 {workers}개)', count, lambda: render_payslips_zip(
+                records, os.path.join(workdir, 'payslips_n.zip'), workers=workers
+            ))
+
+if __name__ == "__main__":
+    main()
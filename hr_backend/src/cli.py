@@ -0,0 +1,143 @@
+"""
+관리용 CLI 명령
+사용법: FLASK_APP=src.main flask ensure-indexes [--dry-run]
+       FLASK_APP=src.main flask audit-rollup
+       FLASK_APP=src.main flask audit-archive [--before YYYY-MM-DD]
+       FLASK_APP=src.main flask leave-balances [--repair]
+       FLASK_APP=src.main flask grant-annual-leave [--year YYYY] [--user-id ID]
+       FLASK_APP=src.main flask import-attendance FILE [--format csv|jsonl] [--chunk-size N]
+       FLASK_APP=src.main flask close-attendance [--date YYYY-MM-DD]
+       FLASK_APP=src.main flask attendance-summaries [--year YYYY]
+       FLASK_APP=src.main flask department-closure
+"""
+
+from datetime import datetime
+
+import click
+from flask import current_app
+
+from src.utils.schema_migration import ensure_indexes, missing_indexes, ensure_autoincrement, missing_autoincrement
+from src.utils.audit_rollup import refresh_audit_rollups
+from src.utils.audit_archive import archive_audit_logs
+from src.utils.leave_ledger import reconcile_leave_balances
+from src.utils.attendance_import import import_attendance, detect_format, FORMATS as IMPORT_FORMATS
+from src.utils.attendance_close import close_attendance_day, default_close_date
+from src.utils.attendance_summary import rebuild_attendance_summaries
+from src.utils.department_tree import rebuild_department_closure
+
+
+def register_commands(app):
+    """Flask CLI 명령 등록"""
+
+    @app.cli.command('ensure-indexes')
+    @click.option('--dry-run', is_flag=True, help='생성하지 않고 누락된 인덱스만 출력')
+    def ensure_indexes_command(dry_run):
+        """모델/스키마에 선언된 인덱스 중 누락된 것을 생성 (AUTOINCREMENT 없는 기존 테이블은 먼저 재생성)"""
+        if dry_run:
+            for table_name in missing_autoincrement():
+                click.echo(f"재생성 필요(AUTOINCREMENT): {table_name}")
+            missing = missing_indexes()
+            for table_name, index_name in missing:
+                click.echo(f"누락: {table_name}.{index_name}")
+            click.echo(f"누락된 인덱스 {len(missing)}개")
+            return
+
+        for table_name in ensure_autoincrement():
+            click.echo(f"재생성: {table_name}")
+        created = ensure_indexes()
+        for index_name in created:
+            click.echo(f"생성: {index_name}")
+        click.echo(f"인덱스 {len(created)}개 생성 완료")
+
+    @app.cli.command('audit-rollup')
+    def audit_rollup_command():
+        """감사 로그 일별 집계 갱신 (최초 실행 시 전체 로그 집계)"""
+        processed = refresh_audit_rollups()
+        click.echo(f"감사 로그 {processed}건 집계 반영")
+
+    @app.cli.command('audit-archive')
+    @click.option('--before', help='이 날짜(YYYY-MM-DD) 이전 로그 보관 (기본: AUDIT_ARCHIVE_RETENTION_DAYS 기준)')
+    def audit_archive_command(before):
+        """오래된 감사 로그를 월별 압축 세그먼트로 이동"""
+        cutoff = datetime.strptime(before, '%Y-%m-%d').date() if before else None
+        archived = archive_audit_logs(current_app, cutoff)
+        for month, count in archived.items():
+            click.echo(f"{month}: {count}건 보관")
+        click.echo(f"감사 로그 {sum(archived.values())}건 보관 완료")
+
+    @app.cli.command('leave-balances')
+    @click.option('--repair', is_flag=True, help='불일치 원장을 부여/사용/신청 내역 기준으로 보정')
+    def leave_balances_command(repair):
+        """연차 원장과 원본 내역 대사 (불일치 탐지/보정)"""
+        drift = reconcile_leave_balances(repair=repair)
+        for item in drift:
+            click.echo(f"불일치: 직원 {item['employee_id']} {item['year']}년 "
+                       f"원장={item['actual']} 기준={item['expected']}")
+        click.echo(f"불일치 {len(drift)}건" + (" 보정 완료" if repair and drift else ""))
+
+    @app.cli.command('grant-annual-leave')
+    @click.option('--year', type=int, help='부여 연도 (기본: 올해)')
+    @click.option('--user-id', type=int, help='부여자 사용자 ID (기본: admin 계정)')
+    def grant_annual_leave_command(year, user_id):
+        """연초 전사 연차 일괄 부여 (회계연도 기준)"""
+        from src.models.user import User
+        from src.routes.annual_leave import batch_grant_annual_leave_for_year
+
+        if user_id is None:
+            admin = User.query.filter_by(role='admin').order_by(User.id).first()
+            if admin is None:
+                raise click.ClickException('관리자 계정이 없습니다. --user-id를 지정하세요.')
+            user_id = admin.id
+
+        result = batch_grant_annual_leave_for_year(year or datetime.now().year, user_id)
+        click.echo(f"{result['year']}년 연차 부여: {result['granted_count']}명, {result['total_granted_days']}일 "
+                   f"(기부여 {result['skipped_existing']}명, 대상 외 {result['skipped_ineligible']}명)")
+
+    @app.cli.command('import-attendance')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--format', 'fmt', type=click.Choice(IMPORT_FORMATS), help='입력 형식 (기본: 확장자로 판단)')
+    @click.option('--chunk-size', type=int, help='청크 크기 (기본: ATTENDANCE_IMPORT_CHUNK_SIZE)')
+    def import_attendance_command(path, fmt, chunk_size):
+        """출입통제 장비 CSV/JSONL 출퇴근 기록 가져오기 ((employee_id, date) 기준 upsert)"""
+        from src.utils.attendance_import import DEFAULT_CHUNK_SIZE
+        from src.utils.dashboard_overview import invalidate_dashboard_overview
+
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            result = import_attendance(
+                f, fmt or detect_format(path),
+                chunk_size=chunk_size or current_app.config.get('ATTENDANCE_IMPORT_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+            )
+        if result['created'] or result['updated']:
+            invalidate_dashboard_overview()
+        for error in result['errors']:
+            click.echo(f"{error['line']}행: {error['error']}")
+        click.echo(f"처리 {result['processed']}행: 생성 {result['created']}건, 갱신 {result['updated']}건, 실패 {result['failed']}건")
+
+    @app.cli.command('close-attendance')
+    @click.option('--date', 'target_date', help='마감 날짜 YYYY-MM-DD (기본: 전날)')
+    def close_attendance_command(target_date):
+        """일일 출퇴근 마감: 미기록 근무 예정자 결근/휴가 기록 생성 (업무 종료 후 매일 실행)"""
+        from src.utils.dashboard_overview import invalidate_dashboard_overview
+
+        day = datetime.strptime(target_date, '%Y-%m-%d').date() if target_date else default_close_date()
+        try:
+            result = close_attendance_day(day)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        if result['created']:
+            invalidate_dashboard_overview()
+        click.echo(f"{result['date']} 마감: 근무 예정 {result['expected_count']}명, 기록 {result['recorded_count']}명, "
+                   f"결근 {result['absent_count']}건, 휴가 {result['on_leave_count']}건 생성")
+
+    @app.cli.command('attendance-summaries')
+    @click.option('--year', type=int, help='재집계 연도 (기본: 전체)')
+    def attendance_summaries_command(year):
+        """월별 출퇴근 집계를 출퇴근 기록 원본으로 재생성"""
+        built = rebuild_attendance_summaries(year)
+        click.echo(f"월별 출퇴근 집계 {built}건 생성")
+
+    @app.cli.command('department-closure')
+    def department_closure_command():
+        """부서 계층 클로저 테이블을 departments.parent_id 기준으로 재생성"""
+        built = rebuild_department_closure()
+        click.echo(f"부서 클로저 {built}건 생성")
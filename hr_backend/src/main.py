@@ -14,7 +14,7 @@ from flask_cors import CORS
 from src.database import db
 from src.models.user import User
 from src.models.employee import Employee
-from src.models.department import Department
+from src.models.department import Department, DepartmentClosure
 from src.models.audit_log import AuditLog
 from src.models.evaluation_criteria import EvaluationCriteria, EvaluationItem, EvaluationTemplate, TemplateCriteria
 from src.models.bonus_policy import BonusPolicy, BonusCalculation, BonusDistribution
@@ -33,6 +33,9 @@ from src.routes.annual_leave import annual_leave_bp
 from src.routes.bonus_policy import bonus_policy_bp
 from src.routes.user_api import user_api_bp
 from src.models.annual_leave_request import AnnualLeaveRequest
+from src.models.annual_leave_balance import AnnualLeaveBalance
+from src.models.holiday import Holiday
+from src.models.attendance_monthly_summary import AttendanceMonthlySummary
 from src.routes.annual_leave_request import annual_leave_request_bp
 from src.routes.evaluation import evaluation_bp
 from src.routes.monthly_evaluation import monthly_evaluation_bp
@@ -67,10 +70,18 @@ def internal_error(error):
 # 데이터베이스 초기화
 db.init_app(app)
 
+# 원시 SQL 공용 연결 풀 설정
+from src.utils.db_connection import init_app as init_db_connection
+init_db_connection(app)
+
 # 라우트 등록
 from src.routes import register_blueprints
 register_blueprints(app)
 
+# 관리용 CLI 명령 등록
+from src.cli import register_commands
+register_commands(app)
+
 # 데이터베이스 초기화 및 초기 데이터
 def init_database():
     """데이터베이스 초기화 및 기본 데이터 생성"""
@@ -78,6 +89,32 @@ def init_database():
         # 테이블 생성
         db.create_all()
         
+        # AUTOINCREMENT 없이 생성된 기존 테이블 재생성 및 누락된 인덱스 생성
+        from src.utils.schema_migration import ensure_autoincrement, ensure_indexes
+        rebuilt_tables = ensure_autoincrement()
+        if rebuilt_tables:
+            print(f"AUTOINCREMENT 테이블 재생성: {', '.join(rebuilt_tables)}")
+        created_indexes = ensure_indexes()
+        if created_indexes:
+            print(f"인덱스 생성: {', '.join(created_indexes)}")
+        
+        # 연차 원장이 비어 있으면 기존 부여/사용/신청 내역으로 생성
+        if AnnualLeaveBalance.query.first() is None:
+            from src.utils.leave_ledger import reconcile_leave_balances
+            built = reconcile_leave_balances(repair=True)
+            if built:
+                print(f"연차 원장 생성: {len(built)}건")
+        
+        # 월별 출퇴근 집계가 비어 있으면 기존 출퇴근 기록으로 생성
+        if AttendanceMonthlySummary.query.first() is None and AttendanceRecord.query.first() is not None:
+            from src.utils.attendance_summary import rebuild_attendance_summaries
+            print(f"월별 출퇴근 집계 생성: {rebuild_attendance_summaries()}건")
+        
+        # 부서 클로저 테이블이 비어 있으면 기존 부서 계층으로 생성
+        if DepartmentClosure.query.first() is None and Department.query.first() is not None:
+            from src.utils.department_tree import rebuild_department_closure
+            print(f"부서 클로저 생성: {rebuild_department_closure()}건")
+        
         # 기본 관리자 계정 확인 및 생성
         admin_user = User.query.filter_by(username='admin').first()
         if not admin_user:
@@ -99,6 +136,8 @@ def init_database():
             )
             db.session.add(root_dept)
             db.session.flush()
+            from src.utils.department_tree import insert_department_node
+            insert_department_node(root_dept.id)
             
             # 관리자 직원 정보 생성
             admin_employee = Employee(
@@ -3,14 +3,17 @@
 
 from .user import User
 from .employee import Employee
-from .department import Department
+from .department import Department, DepartmentClosure
 from .audit_log import AuditLog
 from .evaluation_criteria import EvaluationCriteria
 from .bonus_policy import BonusPolicy, BonusCalculation, BonusDistribution
 from .attendance_record import AttendanceRecord
 from .annual_leave_grant import AnnualLeaveGrant
 from .annual_leave_usage import AnnualLeaveUsage
+from .annual_leave_balance import AnnualLeaveBalance
 from .leave_request import LeaveRequest
+from .holiday import Holiday
+from .attendance_monthly_summary import AttendanceMonthlySummary
 from .evaluation_simple import Evaluation, EvaluationResult, EvaluationScore
 # from .bonus_calculation_advanced import BonusCalculation, BonusDistribution, BonusPaymentHistory  # 중복으로 주석 처리
 from .payroll_record import PayrollRecord
@@ -0,0 +1,34 @@
+from datetime import datetime
+from ..database import db
+
+class AnnualLeaveBalance(db.Model):
+    """직원별 연도별 연차 잔여 원장 (부여/사용/대기 합계를 미리 집계)"""
+    __tablename__ = 'annual_leave_balances'
+    __table_args__ = (
+        db.UniqueConstraint('employee_id', 'year', name='uq_annual_leave_balance_employee_year'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+    granted_days = db.Column(db.Float, nullable=False, default=0.0)  # 부여 합계 (annual_leave_grants.year 기준)
+    used_days = db.Column(db.Float, nullable=False, default=0.0)  # 사용 합계 (usage_date 연도 기준)
+    pending_days = db.Column(db.Float, nullable=False, default=0.0)  # 대기중 신청 합계 (start_date 연도 기준)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @property
+    def remaining_days(self):
+        """잔여일수 (대기중 신청 차감)"""
+        return self.granted_days - self.used_days - self.pending_days
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'employee_id': self.employee_id,
+            'year': self.year,
+            'granted_days': self.granted_days,
+            'used_days': self.used_days,
+            'pending_days': self.pending_days,
+            'remaining_days': self.remaining_days,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
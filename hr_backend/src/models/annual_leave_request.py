@@ -4,6 +4,10 @@ from ..database import db
 class AnnualLeaveRequest(db.Model):
     """연차 신청 모델"""
     __tablename__ = 'annual_leave_requests'
+    __table_args__ = (
+        # 직원별 기간 겹침 확인 (start_date <= :end AND end_date >= :start)
+        db.Index('idx_annual_leave_requests_employee_dates', 'employee_id', 'start_date', 'end_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
@@ -91,14 +95,14 @@ class AnnualLeaveRequest(db.Model):
         if not self.start_date or not self.end_date:
             return 0.0
         
-        # 날짜 차이 계산 (종료일 포함)
-        delta = self.end_date - self.start_date
-        total_calendar_days = delta.days + 1
+        # 영업일 수 계산 (종료일 포함, 주말/공휴일 제외)
+        from ..utils.business_calendar import business_days_between
+        working_days = business_days_between(self.start_date, self.end_date)
         
         # 연차 유형별 일수 적용
         daily_leave = self.get_leave_days_by_type()
         
-        return total_calendar_days * daily_leave
+        return working_days * daily_leave
     
     @staticmethod
     def get_pending_requests_count(employee_id=None):
@@ -4,6 +4,10 @@ from ..database import db
 class AnnualLeaveUsage(db.Model):
     """연차 사용 모델"""
     __tablename__ = 'annual_leave_usages'
+    __table_args__ = (
+        db.Index('idx_annual_leave_usages_employee_date', 'employee_id', 'usage_date'),
+        db.Index('idx_annual_leave_usages_usage_date', 'usage_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
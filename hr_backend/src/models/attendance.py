@@ -4,7 +4,11 @@ from ..database import db
 class AttendanceRecord(db.Model):
     """출퇴근 기록 모델"""
     __tablename__ = 'attendance_records'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        db.Index('idx_attendance_employee_date', 'employee_id', 'date'),
+        db.Index('idx_attendance_date_status', 'date', 'status'),
+        {'extend_existing': True}
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
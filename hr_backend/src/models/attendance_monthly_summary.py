@@ -0,0 +1,50 @@
+from datetime import datetime
+from ..database import db
+
+class AttendanceMonthlySummary(db.Model):
+    """직원별 월별 출퇴근 집계 (attendance_records를 미리 집계)"""
+    __tablename__ = 'attendance_monthly_summaries'
+    __table_args__ = (
+        db.UniqueConstraint('employee_id', 'year', 'month', name='uq_attendance_summary_employee_month'),
+        db.Index('idx_attendance_summary_year_month', 'year', 'month'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    total_days = db.Column(db.Integer, nullable=False, default=0)  # 기록 일수
+    present_days = db.Column(db.Integer, nullable=False, default=0)  # present, 출근
+    late_days = db.Column(db.Integer, nullable=False, default=0)  # late, 지각
+    early_leave_days = db.Column(db.Integer, nullable=False, default=0)  # early_leave, 조퇴
+    absent_days = db.Column(db.Integer, nullable=False, default=0)  # absent, 결근
+    on_leave_days = db.Column(db.Integer, nullable=False, default=0)  # on_leave, 휴가
+    work_hours = db.Column(db.Float, nullable=False, default=0.0)  # 근무시간 합계
+    work_hours_days = db.Column(db.Integer, nullable=False, default=0)  # 근무시간이 기록된 일수 (평균 계산용)
+    overtime_hours = db.Column(db.Float, nullable=False, default=0.0)  # 연장근무시간 합계
+    late_minutes = db.Column(db.Integer, nullable=False, default=0)  # 지각 시간 합계 (근무 시작시각 기준, 분)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def worked_days(self):
+        """출근 일수 (정상/지각/조퇴)"""
+        return self.present_days + self.late_days + self.early_leave_days
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'employee_id': self.employee_id,
+            'year': self.year,
+            'month': self.month,
+            'total_days': self.total_days,
+            'present_days': self.present_days,
+            'late_days': self.late_days,
+            'early_leave_days': self.early_leave_days,
+            'absent_days': self.absent_days,
+            'on_leave_days': self.on_leave_days,
+            'worked_days': self.worked_days,
+            'work_hours': self.work_hours,
+            'overtime_hours': self.overtime_hours,
+            'late_minutes': self.late_minutes,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -4,6 +4,13 @@ import json
 
 class AuditLog(db.Model):
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        db.Index('idx_audit_logs_created_at', 'created_at'),
+        db.Index('idx_audit_logs_user_created', 'user_id', 'created_at'),
+        db.Index('idx_audit_logs_entity_created', 'entity_type', 'created_at'),
+        # 아카이브로 삭제된 ID 재사용 방지 (감사 로그 집계 워터마크 / 보관본 ID 중복)
+        {'sqlite_autoincrement': True},
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -83,3 +90,22 @@ class AuditLog(db.Model):
         db.session.add(log)
         return log
 
+
+class AuditLogDailyRollup(db.Model):
+    """감사 로그 일별 집계 (일자/액션/엔티티/사용자별 건수)"""
+    __tablename__ = 'audit_log_daily_rollups'
+    
+    date = db.Column(db.Date, primary_key=True)  # created_at 기준 일자 (UTC)
+    action_type = db.Column(db.String(50), primary_key=True)
+    entity_type = db.Column(db.String(50), primary_key=True)
+    user_id = db.Column(db.Integer, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class AuditRollupState(db.Model):
+    """감사 로그 집계 진행 상태 (집계에 반영된 마지막 로그 ID)"""
+    __tablename__ = 'audit_rollup_state'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    last_log_id = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,7 @@
 from datetime import datetime
-from sqlalchemy import func, and_
+from sqlalchemy import func
 from ..database import db
+from ..utils.bulk_write import bulk_insert
 
 class BonusCalculation(db.Model):
     """성과급 계산 모델"""
@@ -198,6 +199,9 @@ class BonusPaymentHistory(db.Model):
 class BonusCalculationEngine:
     """성과급 계산 엔진"""
     
+    # 평가 완료로 간주하는 상태
+    COMPLETED_STATUSES = ['완료', '승인']
+    
     @staticmethod
     def calculate_bonus_distribution(calculation_id):
         """성과급 분배 계산 실행"""
@@ -213,37 +217,46 @@ class BonusCalculationEngine:
         
         # 해당 기간의 직원 및 평가 결과 가져오기
         from .employee import Employee
-        from .evaluation_simple import EvaluationResult
+        from ..utils.department_tree import subtree_filter
+        
+        employee_query = db.session.query(
+            Employee.id, Employee.salary, Employee.position, Employee.department_id
+        ).filter_by(status='active')
         
-        employees = Employee.query.filter_by(status='active').all()
+        # 정책 대상 부서(부서 ID)가 지정되면 하위 부서 포함 소속 직원만 대상
+        target_departments = [dept_id for dept_id in policy.get_target_departments() if str(dept_id).isdigit()]
+        if target_departments:
+            employee_query = employee_query.filter(subtree_filter(Employee.department_id, target_departments))
+        
+        employees = employee_query.order_by(Employee.id).all()
+        
+        # 계산에 필요한 데이터 1회 선조회
+        first_results, company_score = BonusCalculationEngine._load_evaluation_results()
+        team_scores = BonusCalculationEngine._calculate_team_scores(first_results)
+        team_sizes = BonusCalculationEngine._get_team_sizes()
         
         # 기존 분배 결과 삭제
         BonusDistribution.query.filter_by(calculation_id=calculation_id).delete()
         
+        # 가중치 적용
+        individual_weight = policy.ratio_personal / 100.0
+        team_weight = policy.ratio_team / 100.0
+        company_weight = policy.ratio_base / 100.0
+        
         total_distributed = 0.0
-        distributions = []
+        rows = []
+        now = datetime.utcnow()
         
         for employee in employees:
-            # 해당 기간의 평가 결과 찾기
-            evaluation_result = EvaluationResult.query.filter(
-                and_(
-                    EvaluationResult.employee_id == employee.id,
-                    EvaluationResult.status.in_(['완료', '승인'])
-                )
-            ).first()
+            # 해당 기간의 평가 결과 (직원별 첫 번째 완료 평가)
+            evaluation_result = first_results.get(employee.id)
             
             # 기본 정보 설정
-            base_salary = getattr(employee, 'salary', 50000000)  # 기본급 (임시값)
+            base_salary = employee.salary
             
             # 성과 점수 계산
-            individual_score = evaluation_result.weighted_score if evaluation_result else 70.0
-            team_score = BonusCalculationEngine._calculate_team_score(employee.department_id, calculation.start_date, calculation.end_date)
-            company_score = BonusCalculationEngine._calculate_company_score(calculation.start_date, calculation.end_date)
-            
-            # 가중치 적용
-            individual_weight = policy.ratio_personal / 100.0
-            team_weight = policy.ratio_team / 100.0
-            company_weight = policy.ratio_base / 100.0
+            individual_score = evaluation_result[1] if evaluation_result else 70.0
+            team_score = team_scores.get(employee.department_id, 70.0)
             
             # 성과급 계산
             base_bonus = calculation.total_amount * 0.3 / len(employees)  # 기본 분배
@@ -254,39 +267,38 @@ class BonusCalculationEngine:
             ) / 100.0
             
             performance_bonus = base_bonus * performance_multiplier
-            team_bonus = calculation.total_amount * 0.2 * (team_score / 100.0) / BonusCalculationEngine._get_team_size(employee.department_id)
+            team_bonus = calculation.total_amount * 0.2 * (team_score / 100.0) / team_sizes[employee.department_id]
             
             final_bonus = base_bonus + performance_bonus + team_bonus
             contribution_ratio = final_bonus / calculation.total_amount * 100.0
             
             # 분배 결과 생성
-            distribution = BonusDistribution(
-                calculation_id=calculation_id,
-                employee_id=employee.id,
-                evaluation_result_id=evaluation_result.id if evaluation_result else None,
-                base_salary=base_salary,
-                position_level=employee.position,
-                department_id=employee.department_id,
-                individual_score=individual_score,
-                team_score=team_score,
-                company_score=company_score,
-                individual_weight=individual_weight,
-                team_weight=team_weight,
-                company_weight=company_weight,
-                base_bonus=base_bonus,
-                performance_bonus=performance_bonus,
-                team_bonus=team_bonus,
-                final_bonus=final_bonus,
-                contribution_ratio=contribution_ratio,
-                status='계산완료'
-            )
-            
-            distributions.append(distribution)
+            rows.append({
+                'calculation_id': calculation_id,
+                'employee_id': employee.id,
+                'evaluation_result_id': evaluation_result[0] if evaluation_result else None,
+                'base_salary': base_salary,
+                'position_level': employee.position,
+                'department_id': employee.department_id,
+                'individual_score': individual_score,
+                'team_score': team_score,
+                'company_score': company_score,
+                'individual_weight': individual_weight,
+                'team_weight': team_weight,
+                'company_weight': company_weight,
+                'base_bonus': base_bonus,
+                'performance_bonus': performance_bonus,
+                'team_bonus': team_bonus,
+                'final_bonus': final_bonus,
+                'contribution_ratio': contribution_ratio,
+                'status': '계산완료',
+                'created_at': now,
+                'updated_at': now
+            })
             total_distributed += final_bonus
         
-        # 분배 결과 저장
-        for distribution in distributions:
-            db.session.add(distribution)
+        # 분배 결과 일괄 저장
+        bulk_insert(BonusDistribution, rows)
         
         # 계산 결과 업데이트
         calculation.total_employees = len(employees)
@@ -296,6 +308,10 @@ class BonusCalculationEngine:
         
         db.session.commit()
         
+        distributions = BonusDistribution.query.filter_by(
+            calculation_id=calculation_id
+        ).order_by(BonusDistribution.id).all()
+        
         return {
             'total_employees': len(employees),
             'total_distributed': total_distributed,
@@ -304,52 +320,60 @@ class BonusCalculationEngine:
         }
     
     @staticmethod
-    def _calculate_team_score(department_id, start_date, end_date):
-        """팀 성과 점수 계산"""
-        # 팀 평균 성과 점수 계산 (임시 구현)
+    def _load_evaluation_results():
+        """완료 평가 결과 선조회 (직원별 첫 결과, 전사 점수)"""
         from .evaluation_simple import EvaluationResult
-        from .employee import Employee
         
-        team_employees = Employee.query.filter_by(department_id=department_id).all()
-        if not team_employees:
-            return 70.0
+        results = db.session.query(
+            EvaluationResult.id, EvaluationResult.employee_id, EvaluationResult.weighted_score
+        ).filter(
+            EvaluationResult.status.in_(BonusCalculationEngine.COMPLETED_STATUSES)
+        ).order_by(EvaluationResult.id).all()
         
-        total_score = 0.0
-        count = 0
+        # 직원별 첫 번째 완료 평가 (id, weighted_score)
+        first_results = {}
+        for result in results:
+            if result.employee_id not in first_results:
+                first_results[result.employee_id] = (result.id, result.weighted_score)
         
-        for employee in team_employees:
-            result = EvaluationResult.query.filter(
-                and_(
-                    EvaluationResult.employee_id == employee.id,
-                    EvaluationResult.status.in_(['완료', '승인'])
-                )
-            ).first()
-            
-            if result and result.weighted_score:
-                total_score += result.weighted_score
-                count += 1
+        return first_results, BonusCalculationEngine._calculate_company_score(results)
+    
+    @staticmethod
+    def _calculate_team_scores(first_results):
+        """부서별 팀 성과 점수 계산 (전 직원 1회 조회)"""
+        # 팀 평균 성과 점수 계산 (임시 구현)
+        from .employee import Employee
+        
+        totals = {}
+        for employee in db.session.query(Employee.id, Employee.department_id).order_by(Employee.id):
+            entry = totals.setdefault(employee.department_id, [0.0, 0])
+            result = first_results.get(employee.id)
+            if result and result[1]:
+                entry[0] += result[1]
+                entry[1] += 1
         
-        return total_score / count if count > 0 else 70.0
+        return {
+            department_id: total_score / count if count > 0 else 70.0
+            for department_id, (total_score, count) in totals.items()
+        }
     
     @staticmethod
-    def _calculate_company_score(start_date, end_date):
+    def _calculate_company_score(results):
         """전사 성과 점수 계산"""
         # 전사 평균 성과 점수 계산 (임시 구현)
-        from .evaluation_simple import EvaluationResult
-        
-        results = EvaluationResult.query.filter(
-            EvaluationResult.status.in_(['완료', '승인'])
-        ).all()
-        
         if not results:
             return 75.0
         
         total_score = sum(r.weighted_score for r in results if r.weighted_score)
-        return total_score / len(results) if results else 75.0
+        return total_score / len(results)
     
     @staticmethod
-    def _get_team_size(department_id):
-        """팀 크기 계산"""
+    def _get_team_sizes():
+        """부서별 재직 인원 수"""
         from .employee import Employee
-        return Employee.query.filter_by(department_id=department_id, status='active').count()
-
+        return dict(
+            db.session.query(Employee.department_id, func.count(Employee.id))
+            .filter_by(status='active')
+            .group_by(Employee.department_id)
+            .all()
+        )
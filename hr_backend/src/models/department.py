@@ -26,7 +26,10 @@ class Department(db.Model):
     def __repr__(self):
         return f'<Department {self.code}: {self.name}>'
     
-    def to_dict(self):
+    def to_dict(self, employee_count=None):
+        """employee_count: 미리 집계한 소속 직원 수 (없으면 employees 관계 로딩)"""
+        if employee_count is None:
+            employee_count = len(self.employees) if self.employees else 0
         return {
             'id': self.id,
             'name': self.name,
@@ -37,7 +40,7 @@ class Department(db.Model):
             'is_active': self.is_active,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'employee_count': len(self.employees) if self.employees else 0
+            'employee_count': employee_count
         }
     
     def to_tree_dict(self):
@@ -52,3 +55,14 @@ class Department(db.Model):
             'children': [child.to_tree_dict() for child in self.children if child.is_active]
         }
 
+
+class DepartmentClosure(db.Model):
+    """부서 계층 클로저 테이블 (조상-자손 전체 쌍, 자기 자신 depth=0 포함)"""
+    __tablename__ = 'department_closure'
+    __table_args__ = (
+        db.Index('idx_department_closure_descendant', 'descendant_id'),
+    )
+    
+    ancestor_id = db.Column(db.Integer, db.ForeignKey('departments.id'), primary_key=True)
+    descendant_id = db.Column(db.Integer, db.ForeignKey('departments.id'), primary_key=True)
+    depth = db.Column(db.Integer, nullable=False)  # 조상에서 자손까지 단계 수
@@ -0,0 +1,24 @@
+from datetime import datetime
+from ..database import db
+
+class Holiday(db.Model):
+    """공휴일 모델 (add_attendance_to_main_db.py의 holidays 테이블)"""
+    __tablename__ = 'holidays'
+
+    id = db.Column(db.Integer, primary_key=True)
+    date = db.Column(db.Date, nullable=False, unique=True)
+    name = db.Column(db.String(100), nullable=False)
+    type = db.Column(db.String(20), default='public')  # public, company
+    is_working_day = db.Column(db.Boolean, default=False)  # 대체 근무일 등 휴일이지만 근무하는 날
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'date': self.date.isoformat() if self.date else None,
+            'name': self.name,
+            'type': self.type,
+            'is_working_day': self.is_working_day,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
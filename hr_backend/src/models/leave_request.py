@@ -4,6 +4,10 @@ from ..database import db
 class LeaveRequest(db.Model):
     """휴가 신청 모델"""
     __tablename__ = 'leave_requests'
+    __table_args__ = (
+        # 직원별 기간 겹침 확인 (start_date <= :end AND end_date >= :start)
+        db.Index('idx_leave_requests_employee_dates', 'employee_id', 'start_date', 'end_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
@@ -20,19 +24,12 @@ class LeaveRequest(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def calculate_days(self):
-        """휴가 일수 계산 (주말 제외)"""
+        """휴가 일수 계산 (주말/공휴일 제외)"""
         if not self.start_date or not self.end_date:
             return 0
         
-        current_date = self.start_date
-        days = 0
-        
-        while current_date <= self.end_date:
-            # 주말(토요일=5, 일요일=6) 제외
-            if current_date.weekday() < 5:
-                days += 1
-            from datetime import timedelta
-            current_date = current_date + timedelta(days=1)
+        from ..utils.business_calendar import business_days_between
+        days = business_days_between(self.start_date, self.end_date)
         
         self.days_requested = days
         return days
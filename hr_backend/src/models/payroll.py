@@ -4,6 +4,9 @@ from ..database import db
 class Payroll(db.Model):
     """급여명세서 모델"""
     __tablename__ = 'payrolls'
+    __table_args__ = (
+        db.Index('idx_payrolls_year_month', 'year', 'month'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
@@ -99,32 +102,24 @@ class Payroll(db.Model):
             'created_by': self.created_by
         }
     
+    # 지급 항목 / 공제 항목
+    PAYMENT_FIELDS = (
+        'base_salary', 'position_allowance', 'meal_allowance', 'transport_allowance',
+        'overtime_pay', 'night_pay', 'holiday_pay', 'bonus', 'other_allowances'
+    )
+    DEDUCTION_FIELDS = (
+        'income_tax', 'resident_tax', 'national_pension', 'health_insurance',
+        'employment_insurance', 'long_term_care', 'other_deductions'
+    )
+    
+    @classmethod
+    def compute_totals(cls, values):
+        """항목 값(dict)으로 총 지급액, 총 공제액, 실수령액 계산"""
+        total_payment = sum((values.get(field) or 0) for field in cls.PAYMENT_FIELDS)
+        total_deductions = sum((values.get(field) or 0) for field in cls.DEDUCTION_FIELDS)
+        return total_payment, total_deductions, total_payment - total_deductions
+    
     def calculate_totals(self):
         """총 지급액, 총 공제액, 실수령액 계산"""
-        # 총 지급액 계산
-        self.total_payment = (
-            (self.base_salary or 0) +
-            (self.position_allowance or 0) +
-            (self.meal_allowance or 0) +
-            (self.transport_allowance or 0) +
-            (self.overtime_pay or 0) +
-            (self.night_pay or 0) +
-            (self.holiday_pay or 0) +
-            (self.bonus or 0) +
-            (self.other_allowances or 0)
-        )
-        
-        # 총 공제액 계산
-        self.total_deductions = (
-            (self.income_tax or 0) +
-            (self.resident_tax or 0) +
-            (self.national_pension or 0) +
-            (self.health_insurance or 0) +
-            (self.employment_insurance or 0) +
-            (self.long_term_care or 0) +
-            (self.other_deductions or 0)
-        )
-        
-        # 실수령액 계산
-        self.net_pay = self.total_payment - self.total_deductions
-
+        values = {field: getattr(self, field) for field in self.PAYMENT_FIELDS + self.DEDUCTION_FIELDS}
+        self.total_payment, self.total_deductions, self.net_pay = self.compute_totals(values)
@@ -109,33 +109,11 @@ class PayrollRecord(db.Model):
     
     def calculate_tax_and_insurance(self):
         """세금 및 보험료 자동 계산 (간단한 계산식)"""
-        # 국민연금 (4.5%, 상한액 적용)
-        pension_base = min(self.basic_salary + self.total_allowances, 5530000)  # 2025년 기준 상한액
-        self.national_pension = pension_base * 0.045
-        
-        # 건강보험 (3.545%)
-        health_base = self.basic_salary + self.total_allowances
-        self.health_insurance = health_base * 0.03545
-        
-        # 장기요양보험 (건강보험료의 12.95%)
-        self.long_term_care = self.health_insurance * 0.1295
-        
-        # 고용보험 (0.9%)
-        self.employment_insurance = (self.basic_salary + self.total_allowances) * 0.009
-        
-        # 소득세 (간단한 계산 - 실제로는 더 복잡)
-        taxable_income = self.gross_pay - (self.national_pension + self.health_insurance + self.employment_insurance)
-        if taxable_income <= 1200000:
-            self.income_tax = taxable_income * 0.06
-        elif taxable_income <= 4600000:
-            self.income_tax = 72000 + (taxable_income - 1200000) * 0.15
-        elif taxable_income <= 8800000:
-            self.income_tax = 582000 + (taxable_income - 4600000) * 0.24
-        else:
-            self.income_tax = 1590000 + (taxable_income - 8800000) * 0.35
-        
-        # 지방소득세 (소득세의 10%)
-        self.local_tax = self.income_tax * 0.1
+        amounts = calculate_tax_and_insurance_amounts(
+            self.basic_salary, self.total_allowances, self.gross_pay
+        )
+        for field, value in amounts.items():
+            setattr(self, field, value)
     
     def to_dict(self):
         """딕셔너리로 변환"""
@@ -231,3 +209,42 @@ class PayrollRecord(db.Model):
     def __repr__(self):
         return f'<PayrollRecord {self.employee.name if self.employee else "Unknown"} - {self.period}>'
 
+
+def calculate_tax_and_insurance_amounts(basic_salary, total_allowances, gross_pay):
+    """세금 및 보험료 계산 (순수 함수, 배치 계산 프로세스에서도 사용)"""
+    # 국민연금 (4.5%, 상한액 적용)
+    pension_base = min(basic_salary + total_allowances, 5530000)  # 2025년 기준 상한액
+    national_pension = pension_base * 0.045
+    
+    # 건강보험 (3.545%)
+    health_base = basic_salary + total_allowances
+    health_insurance = health_base * 0.03545
+    
+    # 장기요양보험 (건강보험료의 12.95%)
+    long_term_care = health_insurance * 0.1295
+    
+    # 고용보험 (0.9%)
+    employment_insurance = (basic_salary + total_allowances) * 0.009
+    
+    # 소득세 (간단한 계산 - 실제로는 더 복잡)
+    taxable_income = gross_pay - (national_pension + health_insurance + employment_insurance)
+    if taxable_income <= 1200000:
+        income_tax = taxable_income * 0.06
+    elif taxable_income <= 4600000:
+        income_tax = 72000 + (taxable_income - 1200000) * 0.15
+    elif taxable_income <= 8800000:
+        income_tax = 582000 + (taxable_income - 4600000) * 0.24
+    else:
+        income_tax = 1590000 + (taxable_income - 8800000) * 0.35
+    
+    # 지방소득세 (소득세의 10%)
+    local_tax = income_tax * 0.1
+    
+    return {
+        'national_pension': national_pension,
+        'health_insurance': health_insurance,
+        'long_term_care': long_term_care,
+        'employment_insurance': employment_insurance,
+        'income_tax': income_tax,
+        'local_tax': local_tax
+    }
@@ -48,10 +48,16 @@ def register_blueprints(app):
     from .dashboard import dashboard_bp
     app.register_blueprint(dashboard_bp, url_prefix='/api')
     
+    from .report_jobs import report_jobs_bp
+    app.register_blueprint(report_jobs_bp, url_prefix='/api')
+    
     # 근무시간 설정
     from .work_schedule import work_schedule_bp
     app.register_blueprint(work_schedule_bp, url_prefix='/api')
     
+    from .holiday import holiday_bp
+    app.register_blueprint(holiday_bp, url_prefix='/api')
+    
     # 사용자 API
     from .user_api import user_api_bp
     app.register_blueprint(user_api_bp, url_prefix='/api')
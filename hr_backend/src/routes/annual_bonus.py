@@ -8,13 +8,13 @@
 
 from flask import Blueprint, request, jsonify
 from src.models.user import db
-import sqlite3
+from src.utils.db_connection import get_db_connection
 from datetime import datetime, date
 import json
+from src.utils.business_calendar import working_months_in_year as calculate_working_months_in_year
 
 annual_bonus_bp = Blueprint('annual_bonus', __name__)
 
-DB_PATH = 'src/database/app.db'
 
 @annual_bonus_bp.route('/api/annual-bonus/calculate/<int:year>', methods=['POST'])
 def calculate_annual_bonus(year):
@@ -23,7 +23,7 @@ def calculate_annual_bonus(year):
         data = request.get_json()
         policy_id = data.get('policy_id')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 성과급 정책 조회
@@ -45,131 +45,14 @@ def calculate_annual_bonus(year):
         if not budget_info:
             return jsonify({'success': False, 'error': f'{year}년 성과급 예산이 설정되지 않았습니다.'}), 404
         
-        # 모든 직원 조회
-        cursor.execute('''
-        SELECT employee_number, name, position, hire_date, department_id
-        FROM employees WHERE employee_number != 'EMP001'
-        ''')
-        employees = cursor.fetchall()
-        
-        calculations = []
-        total_calculated_bonus = 0
-        
-        for emp in employees:
-            employee_id = emp[0]
-            employee_name = emp[1]
-            hire_date = datetime.strptime(emp[3], '%Y-%m-%d').date() if emp[3] else None
-            
-            # 월별 평가 조회
-            cursor.execute('''
-            SELECT month, company_score, team_score, individual_score, total_score
-            FROM monthly_evaluations 
-            WHERE employee_id = ? AND year = ? AND status = 'completed'
-            ORDER BY month
-            ''', (employee_id, year))
-            
-            monthly_scores = cursor.fetchall()
-            
-            # 평가 제외 월 조회
-            cursor.execute('''
-            SELECT month FROM evaluation_exclusions 
-            WHERE employee_id = ? AND year = ?
-            ''', (employee_id, year))
-            excluded_months = [row[0] for row in cursor.fetchall()]
-            
-            # 신규입사자 근무개월 수 계산
-            working_months = calculate_working_months_in_year(hire_date, year)
-            expected_evaluations = working_months - len(excluded_months)
-            
-            if len(monthly_scores) == 0 or expected_evaluations <= 0:
-                # 평가 데이터가 없거나 근무개월이 없는 경우
-                calculation = {
-                    'employee_id': employee_id,
-                    'employee_name': employee_name,
-                    'working_months': working_months,
-                    'excluded_months': len(excluded_months),
-                    'evaluated_months': 0,
-                    'annual_score': 0,
-                    'calculated_bonus': 0,
-                    'final_bonus': 0,
-                    'reason': '평가 데이터 없음 또는 근무개월 부족'
-                }
-            else:
-                # 연도별 평균 점수 계산
-                total_company = sum(score[1] for score in monthly_scores)
-                total_team = sum(score[2] for score in monthly_scores)
-                total_individual = sum(score[3] for score in monthly_scores)
-                total_overall = sum(score[4] for score in monthly_scores)
-                
-                evaluated_months = len(monthly_scores)
-                
-                avg_company = total_company / evaluated_months
-                avg_team = total_team / evaluated_months
-                avg_individual = total_individual / evaluated_months
-                avg_total = total_overall / evaluated_months
-                
-                # 성과급 정책 적용 - 정확한 필드 인덱스
-                ratio_base = float(policy[4]) / 100 if policy[4] else 0  # ratio_base
-                ratio_team = float(policy[5]) / 100 if policy[5] else 0  # ratio_team  
-                ratio_personal = float(policy[6]) / 100 if policy[6] else 0  # ratio_personal
-                ratio_company = float(policy[7]) / 100 if policy[7] else 0  # ratio_company
-                
-                # 가중 평균 점수 계산
-                weighted_score = (
-                    avg_company * ratio_company +
-                    avg_team * ratio_team +
-                    avg_individual * ratio_personal
-                ) + (ratio_base * 100)  # 기본 점수
-                
-                # 최소 성과 점수 확인 - 정확한 필드 인덱스
-                min_score = float(policy[9]) if policy[9] else 0  # min_performance_score
-                max_multiplier = float(policy[10]) if policy[10] else 2.0  # max_bonus_multiplier
-                if weighted_score < min_score:
-                    calculated_bonus = 0
-                    reason = f'최소 성과 점수({min_score}) 미달'
-                else:
-                    # 기본 성과급 계산 (임시로 100만원 기준)
-                    base_bonus = 1000000
-                    
-                    # 성과 배수 적용
-                    performance_multiplier = min(weighted_score / 100, max_multiplier)
-                    calculated_bonus = base_bonus * performance_multiplier
-                    
-                    # 신규입사자 근무개월 수 반영
-                    if working_months < 12:
-                        calculated_bonus = calculated_bonus * (working_months / 12)
-                        reason = f'신규입사자 근무개월 수 반영 ({working_months}개월)'
-                    else:
-                        reason = '정상 계산'
-                
-                calculation = {
-                    'employee_id': employee_id,
-                    'employee_name': employee_name,
-                    'working_months': working_months,
-                    'excluded_months': len(excluded_months),
-                    'evaluated_months': evaluated_months,
-                    'monthly_scores': {
-                        'avg_company': round(avg_company, 1),
-                        'avg_team': round(avg_team, 1),
-                        'avg_individual': round(avg_individual, 1),
-                        'avg_total': round(avg_total, 1)
-                    },
-                    'weighted_score': round(weighted_score, 1),
-                    'annual_score': round(avg_total, 1),
-                    'calculated_bonus': round(calculated_bonus),
-                    'final_bonus': round(calculated_bonus),
-                    'reason': reason
-                }
-            
-            calculations.append(calculation)
-            total_calculated_bonus += calculation['final_bonus']
+        # 직원별 성과급 일괄 계산
+        calculations = build_annual_bonus_calculations(cursor, year, policy)
+        total_calculated_bonus = sum(calc['final_bonus'] for calc in calculations)
         
         # 예산 대비 계산 결과 확인
         available_budget = budget_info[1] - budget_info[2]  # allocated - used
         budget_ratio = total_calculated_bonus / available_budget if available_budget > 0 else 0
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'data': {
@@ -199,7 +82,7 @@ def save_annual_bonus_calculations():
         calculations = data['calculations']
         approved_by = data.get('approved_by', 'EMP001')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         for calc in calculations:
@@ -220,7 +103,6 @@ def save_annual_bonus_calculations():
             ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'message': '성과급 계산 결과가 저장되었습니다.'})
         
@@ -231,7 +113,7 @@ def save_annual_bonus_calculations():
 def get_annual_bonus_calculations(year):
     """연도별 성과급 계산 결과 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -270,8 +152,6 @@ def get_annual_bonus_calculations(year):
         # 총합 계산
         total_bonus = sum(calc['final_bonus'] for calc in calculations)
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'data': {
@@ -291,7 +171,7 @@ def get_annual_bonus_calculations(year):
 def get_bonus_budgets():
     """성과급 예산 목록 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -319,8 +199,6 @@ def get_bonus_budgets():
             }
             budgets.append(budget)
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'data': budgets
@@ -335,7 +213,7 @@ def create_bonus_budget():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         department_allocations_json = json.dumps(data.get('department_allocations', {}))
@@ -352,24 +230,139 @@ def create_bonus_budget():
         ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'message': '성과급 예산이 생성되었습니다.'})
         
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def calculate_working_months_in_year(hire_date, year):
-    """연도별 총 근무개월 수 계산"""
-    if not hire_date:
-        return 12
+def load_monthly_score_totals(cursor, year):
+    """직원별 완료된 월별 평가 합계/개수 조회 (단일 쿼리)"""
+    # 기존 계산과 동일한 부동소수 결과를 위해 월 순서대로 합산
+    cursor.execute('''
+    SELECT employee_id, company_score, team_score, individual_score, total_score
+    FROM monthly_evaluations
+    WHERE year = ? AND status = 'completed'
+    ORDER BY employee_id, month
+    ''', (year,))
+    
+    # 컬럼 타입 친화성(숫자형 사번 등)과 무관하게 문자열 키로 매칭
+    totals = {}
+    for row in cursor.fetchall():
+        entry = totals.setdefault(str(row[0]), [0, 0, 0, 0, 0])
+        entry[0] += row[1]
+        entry[1] += row[2]
+        entry[2] += row[3]
+        entry[3] += row[4]
+        entry[4] += 1
+    return totals
+
+def load_exclusion_counts(cursor, year):
+    """직원별 평가 제외 월 수 조회 (단일 그룹 쿼리)"""
+    cursor.execute('''
+    SELECT employee_id, COUNT(*) FROM evaluation_exclusions
+    WHERE year = ?
+    GROUP BY employee_id
+    ''', (year,))
+    return {str(row[0]): row[1] for row in cursor.fetchall()}
+
+def build_annual_bonus_calculations(cursor, year, policy):
+    """전 직원 연도별 성과급 계산 (직원 수와 무관하게 쿼리 3회)"""
+    # 성과급 정책 적용 - 정확한 필드 인덱스
+    ratio_base = float(policy[4]) / 100 if policy[4] else 0  # ratio_base
+    ratio_team = float(policy[5]) / 100 if policy[5] else 0  # ratio_team
+    ratio_personal = float(policy[6]) / 100 if policy[6] else 0  # ratio_personal
+    ratio_company = float(policy[7]) / 100 if policy[7] else 0  # ratio_company
+    min_score = float(policy[9]) if policy[9] else 0  # min_performance_score
+    max_multiplier = float(policy[10]) if policy[10] else 2.0  # max_bonus_multiplier
     
-    if hire_date.year > year:
-        return 0
+    # 기본 성과급 계산 (임시로 100만원 기준)
+    base_bonus = 1000000
     
-    if hire_date.year < year:
-        return 12
+    cursor.execute('''
+    SELECT employee_number, name, position, hire_date, department_id
+    FROM employees WHERE employee_number != 'EMP001'
+    ''')
+    employees = cursor.fetchall()
     
-    # 입사년도와 같은 경우
-    return 12 - hire_date.month + 1
-
+    score_totals = load_monthly_score_totals(cursor, year)
+    exclusion_counts = load_exclusion_counts(cursor, year)
+    
+    calculations = []
+    for emp in employees:
+        employee_id = emp[0]
+        employee_name = emp[1]
+        hire_date = datetime.strptime(emp[3], '%Y-%m-%d').date() if emp[3] else None
+        
+        totals = score_totals.get(str(employee_id))
+        excluded_count = exclusion_counts.get(str(employee_id), 0)
+        
+        # 신규입사자 근무개월 수 계산
+        working_months = calculate_working_months_in_year(hire_date, year)
+        expected_evaluations = working_months - excluded_count
+        
+        if totals is None or expected_evaluations <= 0:
+            # 평가 데이터가 없거나 근무개월이 없는 경우
+            calculations.append({
+                'employee_id': employee_id,
+                'employee_name': employee_name,
+                'working_months': working_months,
+                'excluded_months': excluded_count,
+                'evaluated_months': 0,
+                'annual_score': 0,
+                'calculated_bonus': 0,
+                'final_bonus': 0,
+                'reason': '평가 데이터 없음 또는 근무개월 부족'
+            })
+            continue
+        
+        total_company, total_team, total_individual, total_overall, evaluated_months = totals
+        
+        # 연도별 평균 점수 계산
+        avg_company = total_company / evaluated_months
+        avg_team = total_team / evaluated_months
+        avg_individual = total_individual / evaluated_months
+        avg_total = total_overall / evaluated_months
+        
+        # 가중 평균 점수 계산
+        weighted_score = (
+            avg_company * ratio_company +
+            avg_team * ratio_team +
+            avg_individual * ratio_personal
+        ) + (ratio_base * 100)  # 기본 점수
+        
+        if weighted_score < min_score:
+            calculated_bonus = 0
+            reason = f'최소 성과 점수({min_score}) 미달'
+        else:
+            # 성과 배수 적용
+            performance_multiplier = min(weighted_score / 100, max_multiplier)
+            calculated_bonus = base_bonus * performance_multiplier
+            
+            # 신규입사자 근무개월 수 반영
+            if working_months < 12:
+                calculated_bonus = calculated_bonus * (working_months / 12)
+                reason = f'신규입사자 근무개월 수 반영 ({working_months}개월)'
+            else:
+                reason = '정상 계산'
+        
+        calculations.append({
+            'employee_id': employee_id,
+            'employee_name': employee_name,
+            'working_months': working_months,
+            'excluded_months': excluded_count,
+            'evaluated_months': evaluated_months,
+            'monthly_scores': {
+                'avg_company': round(avg_company, 1),
+                'avg_team': round(avg_team, 1),
+                'avg_individual': round(avg_individual, 1),
+                'avg_total': round(avg_total, 1)
+            },
+            'weighted_score': round(weighted_score, 1),
+            'annual_score': round(avg_total, 1),
+            'calculated_bonus': round(calculated_bonus),
+            'final_bonus': round(calculated_bonus),
+            'reason': reason
+        })
+    
+    return calculations
@@ -1,7 +1,8 @@
 from flask import Blueprint, request, jsonify
 from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin
 from datetime import datetime, date
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, case
+import threading
 from src.models.user import db
 from src.models.annual_leave_grant import AnnualLeaveGrant
 from src.models.annual_leave_usage import AnnualLeaveUsage
@@ -9,9 +10,15 @@ from src.models.leave_request import LeaveRequest
 from src.models.employee import Employee
 from src.utils.auth import admin_required
 from src.utils.audit import log_action
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.period import month_range, year_range, in_range
+from src.utils.leave_ledger import record_grant, record_usage, get_leave_balance, adjust_leave_balances
+from src.utils.bulk_write import bulk_insert
 
 annual_leave_bp = Blueprint('annual_leave', __name__)
 
+_batch_grant_lock = threading.Lock()
+
 @annual_leave_bp.route('/annual-leave/grants', methods=['GET'])
 @jwt_required
 def get_annual_leave_grants():
@@ -113,6 +120,7 @@ def create_annual_leave_grant():
         )
         
         db.session.add(grant)
+        record_grant(grant)
         db.session.commit()
         
         # 감사 로그 기록
@@ -227,14 +235,10 @@ def get_annual_leave_balance(employee_id):
             year=year
         ).first()
         
-        total_granted = grant.total_days if grant else 0
-        
-        # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == employee_id,
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        # 부여/사용 합계는 연차 원장에서 조회
+        balance = get_leave_balance(employee_id, year)
+        total_granted = balance['granted_days']
+        total_used = balance['used_days']
         
         # 잔여 연차 계산
         remaining = total_granted - total_used
@@ -272,14 +276,10 @@ def get_my_annual_leave_balance():
             year=year
         ).first()
         
-        total_granted = grant.total_days if grant else 0
-        
-        # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == employee.id,
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        # 부여/사용 합계는 연차 원장에서 조회
+        balance = get_leave_balance(employee.id, year)
+        total_granted = balance['granted_days']
+        total_used = balance['used_days']
         
         # 잔여 연차 계산
         remaining = total_granted - total_used
@@ -332,12 +332,8 @@ def use_annual_leave():
         if not grant:
             return jsonify({'error': f'{year}년도 연차가 부여되지 않았습니다.'}), 400
         
-        # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == data['employee_id'],
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        # 부여/사용 합계는 연차 원장에서 조회
+        balance = get_leave_balance(data['employee_id'], year)
         
         # 휴가 유형 처리
         leave_type = data.get('leave_type', 'full')
@@ -353,7 +349,7 @@ def use_annual_leave():
             return jsonify({'error': f'{leave_type} 유형은 {type_days}일이어야 합니다.'}), 400
         
         # 잔여 연차 확인
-        remaining = grant.total_days - total_used
+        remaining = balance['granted_days'] - balance['used_days']
         if used_days > remaining:
             return jsonify({'error': f'연차 잔여일수가 부족합니다. (잔여: {remaining}일)'}), 400
         
@@ -369,7 +365,9 @@ def use_annual_leave():
         )
         
         db.session.add(usage)
+        record_usage(usage)
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그 기록
         leave_type_names = {'full': '연차', 'half': '반차', 'quarter': '반반차'}
@@ -448,6 +446,30 @@ def auto_grant_annual_leave():
         return jsonify({'error': f'자동 연차 부여 중 오류가 발생했습니다: {str(e)}'}), 500
 
 
+@annual_leave_bp.route('/annual-leave/batch-grant', methods=['POST'])
+@jwt_required
+def batch_grant_annual_leave():
+    """연초 전사 연차 일괄 부여 (관리자 전용, 회계연도 기준 단일 트랜잭션)"""
+    try:
+        admin_check = require_admin()
+        if admin_check:
+            return admin_check
+        
+        data = request.get_json() or {}
+        year = int(data.get('year', datetime.now().year))
+        
+        result = batch_grant_annual_leave_for_year(year, get_current_user_id())
+        
+        return jsonify({
+            'message': f'{year}년 연차 일괄 부여가 완료되었습니다.',
+            **result
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'연차 일괄 부여 중 오류가 발생했습니다: {str(e)}'}), 500
+
+
 def grant_annual_leave_by_hire_date(employee, year):
     """입사일 기준 연차 부여"""
     try:
@@ -510,6 +532,7 @@ def grant_monthly_leave(employee, year):
                 )
                 
                 db.session.add(grant)
+                record_grant(grant)
                 granted_count += 1
                 granted_days += 1.0
                 
@@ -570,6 +593,7 @@ def grant_annual_leave_on_hire_anniversary(employee, year):
             )
             
             db.session.add(grant)
+            record_grant(grant)
             
             # 감사 로그
             log_action(
@@ -629,6 +653,7 @@ def grant_annual_leave_by_fiscal_year(employee, year):
             )
             
             db.session.add(grant)
+            record_grant(grant)
             
             # 감사 로그
             log_action(
@@ -648,22 +673,110 @@ def grant_annual_leave_by_fiscal_year(employee, year):
         return {'count': 0, 'days': 0}
 
 
+def batch_grant_annual_leave_for_year(year, created_by):
+    """재직 중인 전 직원에게 회계연도(1월 1일) 기준 연차를 일괄 부여하고 결과 요약 반환
+    
+    grant_annual_leave_by_fiscal_year와 같은 규칙(전년도 말 근속연수, 전년도 출근율)을
+    직원별 조회 대신 집계 쿼리로 계산, 부여/원장/감사 로그를 한 번에 기록
+    """
+    from src.models.attendance import AttendanceRecord as Attendance
+    
+    with _batch_grant_lock:
+        employees = db.session.query(Employee.id, Employee.hire_date).filter(
+            Employee.status == 'active'
+        ).all()
+        
+        # 해당 연도 연간 연차가 이미 있는 직원 (기준 무관)
+        granted_ids = {employee_id for (employee_id,) in db.session.query(
+            AnnualLeaveGrant.employee_id
+        ).filter(
+            AnnualLeaveGrant.year == year,
+            AnnualLeaveGrant.grant_type == 'annual'
+        ).distinct()}
+        
+        # 전년도 직원별 출근율 (calculate_attendance_rate와 동일 기준)
+        attendance_rows = db.session.query(
+            Attendance.employee_id,
+            func.count(Attendance.id),
+            func.sum(case((Attendance.status.in_(['출근', '지각']), 1), else_=0))
+        ).filter(
+            in_range(Attendance.date, *year_range(year - 1))
+        ).group_by(Attendance.employee_id).all()
+        attendance_rates = {
+            employee_id: attended / total * 100
+            for employee_id, total, attended in attendance_rows if total
+        }
+        
+        grant_date = date(year, 1, 1)
+        end_of_year = date(year - 1, 12, 31)
+        grants = []
+        skipped_ineligible = 0
+        for employee_id, hire_date in employees:
+            if employee_id in granted_ids:
+                continue
+            
+            # 1년 미만 근무자는 월별 개근 연차 대상
+            years_of_service = (end_of_year - hire_date).days / 365.25 if hire_date else 0
+            attendance_rate = attendance_rates.get(employee_id, 0.0)
+            annual_leave_days = calculate_annual_leave_days_by_service_years(years_of_service, attendance_rate)
+            if years_of_service < 1.0 or annual_leave_days <= 0:
+                skipped_ineligible += 1
+                continue
+            
+            grants.append({
+                'employee_id': employee_id,
+                'year': year,
+                'total_days': annual_leave_days,
+                'grant_date': grant_date,
+                'grant_type': 'annual',
+                'grant_basis': 'fiscal_year',
+                'grant_period': None,
+                'is_perfect_attendance': attendance_rate >= 80.0,
+                'note': f"회계연도 연차 ({annual_leave_days}일, 근속: {years_of_service:.1f}년, 출근율: {attendance_rate:.1f}%)",
+                'created_by': created_by
+            })
+        
+        try:
+            bulk_insert(AnnualLeaveGrant, grants)
+            adjust_leave_balances(
+                {'employee_id': grant['employee_id'], 'year': year, 'granted': grant['total_days']}
+                for grant in grants
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    
+    result = {
+        'year': year,
+        'granted_count': len(grants),
+        'total_granted_days': sum(grant['total_days'] for grant in grants),
+        'skipped_existing': len(granted_ids & {employee_id for employee_id, _ in employees}),
+        'skipped_ineligible': skipped_ineligible
+    }
+    
+    # 직원별 로그 대신 요약 감사 로그 1건
+    log_action(
+        user_id=created_by,
+        action_type='CREATE',
+        entity_type='annual_leave_grant',
+        entity_id=None,
+        message=f"{year}년 연차 일괄 부여: {result['granted_count']}명, {result['total_granted_days']}일 "
+                f"(기부여 {result['skipped_existing']}명, 대상 외 {result['skipped_ineligible']}명)"
+    )
+    
+    return result
+
+
 def check_monthly_perfect_attendance(employee_id, year, month):
     """월별 개근 여부 확인"""
     try:
-        from src.models.attendance import Attendance
-        from calendar import monthrange
-        
-        # 해당 월의 총 근무일수 (주말 제외)
-        _, last_day = monthrange(year, month)
-        start_date = datetime(year, month, 1).date()
-        end_date = datetime(year, month, last_day).date()
+        from src.models.attendance import AttendanceRecord as Attendance
         
         # 출근 기록 조회
         attendance_records = Attendance.query.filter(
             Attendance.employee_id == employee_id,
-            Attendance.date >= start_date,
-            Attendance.date <= end_date
+            in_range(Attendance.date, *month_range(year, month))
         ).all()
         
         if not attendance_records:
@@ -719,17 +832,12 @@ def calculate_annual_leave_days_by_service_years(years_of_service, attendance_ra
 def calculate_attendance_rate(employee_id, year):
     """출근율 계산"""
     try:
-        from src.models.attendance import Attendance
-        
-        # 해당 연도의 총 근무일수 (주말 제외)
-        start_date = datetime(year, 1, 1).date()
-        end_date = datetime(year, 12, 31).date()
+        from src.models.attendance import AttendanceRecord as Attendance
         
         # 출근 기록 조회
         attendance_records = Attendance.query.filter(
             Attendance.employee_id == employee_id,
-            Attendance.date >= start_date,
-            Attendance.date <= end_date
+            in_range(Attendance.date, *year_range(year))
         ).all()
         
         if not attendance_records:
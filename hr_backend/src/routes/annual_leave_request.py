@@ -4,9 +4,12 @@ from src.models.user import db
 from src.models.employee import Employee
 from src.models.annual_leave_request import AnnualLeaveRequest
 from src.models.annual_leave_usage import AnnualLeaveUsage
-from src.models.annual_leave_grant import AnnualLeaveGrant
 from src.utils.jwt_helper import jwt_required, admin_required
 from src.utils.audit import log_action
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.leave_ledger import record_usage, record_pending, get_total_remaining_days
+from src.utils.leave_index import leave_index, interval_dict
+from src.utils.pagination import flag_arg
 
 annual_leave_request_bp = Blueprint('annual_leave_request', __name__)
 
@@ -100,6 +103,8 @@ def create_leave_request():
         
         # 총 연차 일수 계산
         leave_request.total_days = leave_request.calculate_total_days()
+        if leave_request.total_days <= 0:
+            return jsonify({'success': False, 'error': '선택한 기간에 근무일이 없습니다.'}), 400
         
         # 연차 잔여일수 확인
         remaining_days = get_employee_remaining_leave_days(data['employee_id'])
@@ -109,20 +114,15 @@ def create_leave_request():
                 'error': f'연차 잔여일수가 부족합니다. (신청: {leave_request.total_days}일, 잔여: {remaining_days}일)'
             }), 400
         
-        # 중복 신청 확인
-        overlapping_requests = AnnualLeaveRequest.query.filter(
-            AnnualLeaveRequest.employee_id == data['employee_id'],
-            AnnualLeaveRequest.status.in_(['pending', 'approved']),
-            AnnualLeaveRequest.start_date <= end_date,
-            AnnualLeaveRequest.end_date >= start_date
-        ).first()
-        
-        if overlapping_requests:
+        # 중복 신청 확인 (대기/승인 휴가 구간 인덱스 + DB 재확인)
+        if leave_index.find_overlap_for_write(data['employee_id'], start_date, end_date):
             return jsonify({'success': False, 'error': '해당 기간에 이미 신청된 연차가 있습니다.'}), 400
         
         # 데이터베이스 저장
         db.session.add(leave_request)
+        record_pending(leave_request)
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그
         log_action(
@@ -160,8 +160,8 @@ def approve_leave_request(request_id):
         if leave_request.status != 'pending':
             return jsonify({'success': False, 'error': '이미 처리된 연차 신청입니다.'}), 400
         
-        # 연차 잔여일수 재확인
-        remaining_days = get_employee_remaining_leave_days(leave_request.employee_id)
+        # 연차 잔여일수 재확인 (이 신청의 대기 차감분은 제외)
+        remaining_days = get_employee_remaining_leave_days(leave_request.employee_id) + leave_request.total_days
         if remaining_days < leave_request.total_days:
             return jsonify({
                 'success': False, 
@@ -169,18 +169,23 @@ def approve_leave_request(request_id):
             }), 400
         
         # 연차 사용 기록 생성
+        usage_types = {'annual': 'full', 'half': 'half', 'quarter': 'quarter'}
         annual_leave_usage = AnnualLeaveUsage(
             employee_id=leave_request.employee_id,
-            used_date=leave_request.start_date,
+            usage_date=leave_request.start_date,
             used_days=leave_request.total_days,
-            leave_type=leave_request.leave_type,
-            reason=leave_request.reason or '연차 신청 승인',
-            approved_by=request.current_user_id
+            leave_type=usage_types.get(leave_request.leave_type, 'full'),
+            note=leave_request.reason or '연차 신청 승인',
+            created_by=request.current_user_id
         )
         
         db.session.add(annual_leave_usage)
         db.session.flush()  # ID 생성을 위해 flush
         
+        # 원장: 대기 해제 후 사용 반영
+        record_pending(leave_request, sign=-1)
+        record_usage(annual_leave_usage)
+        
         # 연차 신청 상태 업데이트
         leave_request.status = 'approved'
         leave_request.approved_by = request.current_user_id
@@ -189,6 +194,8 @@ def approve_leave_request(request_id):
         leave_request.annual_leave_usage_id = annual_leave_usage.id
         
         db.session.commit()
+        leave_index.sync(leave_request)
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(
@@ -229,8 +236,10 @@ def reject_leave_request(request_id):
         leave_request.approved_by = request.current_user_id
         leave_request.approved_at = datetime.utcnow()
         leave_request.approval_notes = data.get('notes', '')
+        record_pending(leave_request, sign=-1)
         
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그
         log_action(
@@ -265,13 +274,16 @@ def delete_leave_request(request_id):
             return jsonify({'success': False, 'error': '대기중인 연차 신청만 삭제할 수 있습니다.'}), 400
         
         # 연차 신청 삭제
+        employee_id = leave_request.employee_id
         employee_name = leave_request.employee.name
         start_date = leave_request.start_date
         end_date = leave_request.end_date
         total_days = leave_request.total_days
         
+        record_pending(leave_request, sign=-1)
         db.session.delete(leave_request)
         db.session.commit()
+        leave_index.discard(employee_id, 'annual', request_id)
         
         # 감사 로그
         log_action(
@@ -334,27 +346,78 @@ def get_leave_request_statistics():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@annual_leave_request_bp.route('/api/annual-leave/whos-out', methods=['GET'])
+@jwt_required
+def get_whos_out():
+    """기간별 부서 휴가자 조회 (대기/승인 휴가 구간 인덱스 기반)"""
+    try:
+        current_user_id = request.current_user_id
+        user_role = request.current_user_role
+        
+        # 기간 (기본: 오늘)
+        try:
+            start_date = datetime.strptime(request.args['start_date'], '%Y-%m-%d').date() if request.args.get('start_date') else date.today()
+            end_date = datetime.strptime(request.args['end_date'], '%Y-%m-%d').date() if request.args.get('end_date') else start_date
+        except ValueError:
+            return jsonify({'success': False, 'error': '날짜 형식이 올바르지 않습니다.'}), 400
+        
+        if start_date > end_date:
+            return jsonify({'success': False, 'error': '시작 날짜가 종료 날짜보다 늦을 수 없습니다.'}), 400
+        
+        department_id = request.args.get('department_id', type=int)
+        include_pending = flag_arg(request.args.get('include_pending'), default=True)
+        
+        # 일반 사용자는 본인 부서만 조회
+        if user_role != 'admin':
+            employee = Employee.query.filter_by(user_id=current_user_id).first()
+            if not employee:
+                return jsonify({'success': False, 'error': '직원 정보를 찾을 수 없습니다.'}), 404
+            if department_id and department_id != employee.department_id:
+                return jsonify({'success': False, 'error': '조회 권한이 없습니다.'}), 403
+            department_id = employee.department_id
+        
+        members = db.session.query(Employee.id, Employee.name, Employee.department_id).filter(
+            Employee.status == 'active'
+        )
+        if department_id:
+            members = members.filter(Employee.department_id == department_id)
+        members = {member.id: member for member in members}
+        
+        out = leave_index.employees_out(start_date, end_date, members.keys())
+        
+        employees = []
+        for employee_id, leaves in out.items():
+            if not include_pending:
+                leaves = [leave for leave in leaves if leave.status in ('approved', '승인')]
+            if not leaves:
+                continue
+            member = members[employee_id]
+            employees.append({
+                'employee_id': employee_id,
+                'employee_name': member.name,
+                'department_id': member.department_id,
+                'leaves': [interval_dict(leave) for leave in leaves]
+            })
+        employees.sort(key=lambda item: item['employee_name'])
+        
+        return jsonify({
+            'success': True,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'department_id': department_id,
+            'total_members': len(members),
+            'out_count': len(employees),
+            'employees': employees
+        })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 def get_employee_remaining_leave_days(employee_id):
     """직원의 연차 잔여일수 계산"""
     try:
-        # 부여된 연차 총합
-        total_granted = db.session.query(db.func.sum(AnnualLeaveGrant.total_days)).filter_by(
-            employee_id=employee_id
-        ).scalar() or 0
-        
-        # 사용된 연차 총합 (승인된 신청만)
-        total_used = db.session.query(db.func.sum(AnnualLeaveUsage.used_days)).filter_by(
-            employee_id=employee_id
-        ).scalar() or 0
-        
-        # 대기중인 신청 총합 (임시 차감)
-        pending_requests = db.session.query(db.func.sum(AnnualLeaveRequest.total_days)).filter_by(
-            employee_id=employee_id,
-            status='pending'
-        ).scalar() or 0
-        
-        return total_granted - total_used - pending_requests
+        # 연차 원장의 부여 - 사용 - 대기중 신청 (전체 연도)
+        return get_total_remaining_days(employee_id)
         
     except Exception:
         return 0
-
@@ -1,13 +1,72 @@
-from flask import Blueprint, request, jsonify
-from datetime import datetime, date, time
+from flask import Blueprint, request, jsonify, current_app
+from datetime import datetime, date
 from src.models.user import db
 from src.models.attendance import AttendanceRecord, WorkSchedule
 from src.models.employee import Employee
-from src.utils.jwt_helper import jwt_required, admin_required
+from src.utils.jwt_helper import jwt_required, admin_required, get_current_user_id
 from src.utils.audit import log_action
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.bulk_write import bulk_insert
+from src.utils.pagination import keyset_page, page_size, flag_arg
+from src.utils.business_calendar import is_working_day
+from src.utils.schedule_index import schedule_index
+from src.utils.attendance_close import close_attendance_day, default_close_date
+from src.utils.attendance_summary import refresh_attendance_summaries
+from src.utils.attendance_import import (
+    import_attendance, detect_format, FORMATS as IMPORT_FORMATS, DEFAULT_CHUNK_SIZE as IMPORT_CHUNK_SIZE
+)
 
 attendance_bp = Blueprint('attendance', __name__)
 
+def build_attendance_values(data):
+    """요청 데이터로 출퇴근 기록 컬럼 값 구성 (값, 오류 메시지) 반환"""
+    # 날짜 파싱
+    try:
+        record_date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None, '잘못된 날짜 형식입니다'
+    
+    # 시간 파싱
+    check_in_time = None
+    check_out_time = None
+    
+    if data.get('check_in_time'):
+        try:
+            check_in_time = datetime.strptime(data['check_in_time'], '%H:%M').time()
+        except (TypeError, ValueError):
+            return None, '잘못된 출근시간 형식입니다'
+    
+    if data.get('check_out_time'):
+        try:
+            check_out_time = datetime.strptime(data['check_out_time'], '%H:%M').time()
+        except (TypeError, ValueError):
+            return None, '잘못된 퇴근시간 형식입니다'
+    
+    # 근무시간 계산
+    work_hours = AttendanceRecord.calculate_work_hours(check_in_time, check_out_time)
+    
+    # 상태 자동 판정 (직원별 요일 근무시간 기준, 미설정 시 기본 근무시간)
+    status = data.get('status')
+    if not status:
+        try:
+            schedule = schedule_index.slot(int(data['employee_id']), record_date)
+        except (TypeError, ValueError):
+            return None, '존재하지 않는 직원입니다'
+        status = AttendanceRecord.determine_status(
+            check_in_time, check_out_time, schedule.start, schedule.end
+        )
+    
+    return {
+        'employee_id': data['employee_id'],
+        'date': record_date,
+        'check_in_time': check_in_time,
+        'check_out_time': check_out_time,
+        'status': status,
+        'work_hours': work_hours,
+        'overtime_hours': data.get('overtime_hours', 0.0),
+        'notes': data.get('notes', '')
+    }, None
+
 @attendance_bp.route('/attendance/records', methods=['GET'])
 @jwt_required
 @admin_required
@@ -38,6 +97,21 @@ def get_attendance_records():
         if status:
             query = query.filter(AttendanceRecord.status == status)
         
+        # 커서 모드: (date, id) 내림차순 키셋 페이지네이션, 전체 건수는 요청 시에만 집계
+        if 'cursor' in request.args:
+            records, next_cursor = keyset_page(
+                query, [AttendanceRecord.date, AttendanceRecord.id], request.args.get('cursor'), page_size(per_page)
+            )
+            result = {
+                'records': [record.to_dict() for record in records],
+                'next_cursor': next_cursor,
+                'has_more': next_cursor is not None,
+                'per_page': page_size(per_page)
+            }
+            if flag_arg(request.args.get('include_total')):
+                result['total'] = query.count()
+            return jsonify(result)
+        
         # 날짜 역순으로 정렬
         query = query.order_by(AttendanceRecord.date.desc(), AttendanceRecord.created_at.desc())
         
@@ -45,7 +119,8 @@ def get_attendance_records():
         pagination = query.paginate(
             page=page, 
             per_page=per_page, 
-            error_out=False
+            error_out=False,
+            count=flag_arg(request.args.get('include_total'), default=True)
         )
         
         records = [record.to_dict() for record in pagination.items]
@@ -58,6 +133,8 @@ def get_attendance_records():
             'per_page': per_page
         })
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -81,11 +158,12 @@ def create_attendance_record():
         if not employee:
             return jsonify({'error': '존재하지 않는 직원입니다'}), 404
         
-        # 날짜 파싱
-        try:
-            record_date = datetime.strptime(data['date'], '%Y-%m-%d').date()
-        except ValueError:
-            return jsonify({'error': '잘못된 날짜 형식입니다'}), 400
+        # 입력값 파싱 및 상태 판정
+        values, error = build_attendance_values(data)
+        if error:
+            return jsonify({'error': error}), 400
+        record_date = values['date']
+        status = values['status']
         
         # 중복 기록 확인
         existing_record = AttendanceRecord.query.filter_by(
@@ -96,56 +174,21 @@ def create_attendance_record():
         if existing_record:
             return jsonify({'error': '해당 날짜에 이미 출퇴근 기록이 존재합니다'}), 400
         
-        # 시간 파싱
-        check_in_time = None
-        check_out_time = None
-        
-        if data.get('check_in_time'):
-            try:
-                check_in_time = datetime.strptime(data['check_in_time'], '%H:%M').time()
-            except ValueError:
-                return jsonify({'error': '잘못된 출근시간 형식입니다'}), 400
-        
-        if data.get('check_out_time'):
-            try:
-                check_out_time = datetime.strptime(data['check_out_time'], '%H:%M').time()
-            except ValueError:
-                return jsonify({'error': '잘못된 퇴근시간 형식입니다'}), 400
-        
-        # 근무시간 계산
-        work_hours = AttendanceRecord.calculate_work_hours(check_in_time, check_out_time)
-        
-        # 상태 자동 판정 (기본 근무시간 09:00-18:00 기준)
-        standard_start = time(9, 0)
-        standard_end = time(18, 0)
-        
-        if 'status' not in data or not data['status']:
-            status = AttendanceRecord.determine_status(
-                check_in_time, check_out_time, standard_start, standard_end
-            )
-        else:
-            status = data['status']
-        
         # 새 기록 생성
-        new_record = AttendanceRecord(
-            employee_id=data['employee_id'],
-            date=record_date,
-            check_in_time=check_in_time,
-            check_out_time=check_out_time,
-            status=status,
-            work_hours=work_hours,
-            overtime_hours=data.get('overtime_hours', 0.0),
-            notes=data.get('notes', '')
-        )
+        new_record = AttendanceRecord(**values)
         
         db.session.add(new_record)
+        refresh_attendance_summaries([(new_record.employee_id, new_record.date)])
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그 기록
         log_action(
-            user_id=request.current_user['id'],
-            action='CREATE_ATTENDANCE',
-            details=f"직원 {employee.name}의 {record_date} 출퇴근 기록 생성 (상태: {status})"
+            user_id=get_current_user_id(),
+            action_type='CREATE',
+            entity_type='attendance',
+            entity_id=new_record.id,
+            message=f"직원 {employee.name}의 {record_date} 출퇴근 기록 생성 (상태: {status})"
         )
         
         return jsonify({
@@ -158,6 +201,171 @@ def create_attendance_record():
         return jsonify({'error': str(e)}), 500
 
 
+@attendance_bp.route('/attendance/records/bulk', methods=['POST'])
+@jwt_required
+@admin_required
+def create_attendance_records_bulk():
+    """출퇴근 기록 일괄 생성"""
+    try:
+        data = request.get_json() or {}
+        items = data.get('records')
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'records 목록이 필요합니다'}), 400
+        
+        rows = []
+        errors = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or 'employee_id' not in item or 'date' not in item:
+                errors.append({'index': index, 'error': 'employee_id와 date는 필수 항목입니다'})
+                continue
+            
+            values, error = build_attendance_values(item)
+            if error:
+                errors.append({'index': index, 'error': error})
+                continue
+            rows.append((index, values))
+        
+        # 직원 존재 여부 및 기존 기록 일괄 조회
+        employee_ids = list({values['employee_id'] for _, values in rows})
+        dates = [values['date'] for _, values in rows]
+        existing_employees = {
+            row.id for row in db.session.query(Employee.id).filter(Employee.id.in_(employee_ids))
+        }
+        existing_keys = set()
+        if rows:
+            existing_keys = set(
+                db.session.query(AttendanceRecord.employee_id, AttendanceRecord.date).filter(
+                    AttendanceRecord.employee_id.in_(employee_ids),
+                    AttendanceRecord.date >= min(dates),
+                    AttendanceRecord.date <= max(dates)
+                ).all()
+            )
+        
+        new_rows = []
+        for index, values in rows:
+            key = (values['employee_id'], values['date'])
+            if values['employee_id'] not in existing_employees:
+                errors.append({'index': index, 'error': '존재하지 않는 직원입니다'})
+            elif key in existing_keys:
+                errors.append({'index': index, 'error': '해당 날짜에 이미 출퇴근 기록이 존재합니다'})
+            else:
+                new_rows.append(values)
+                existing_keys.add(key)
+        
+        created = bulk_insert(AttendanceRecord, new_rows)
+        refresh_attendance_summaries((values['employee_id'], values['date']) for values in new_rows)
+        db.session.commit()
+        
+        if created:
+            invalidate_dashboard_overview()
+            
+            # 감사 로그 (요약 1건)
+            log_action(
+                user_id=get_current_user_id(),
+                action_type='CREATE',
+                entity_type='attendance',
+                entity_id=None,
+                message=f"출퇴근 기록 일괄 생성: {created}건 (실패 {len(errors)}건)"
+            )
+        
+        errors.sort(key=lambda error: error['index'])
+        return jsonify({
+            'message': f'출퇴근 기록 {created}건이 생성되었습니다',
+            'created': created,
+            'failed': len(errors),
+            'errors': errors
+        }), 201 if created else 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@attendance_bp.route('/attendance/import', methods=['POST'])
+@jwt_required
+@admin_required
+def import_attendance_records():
+    """출입통제 장비 CSV/JSONL 출퇴근 기록 가져오기 (multipart file 또는 요청 본문)"""
+    try:
+        upload = request.files.get('file')
+        if upload is not None:
+            stream = upload.stream
+            fmt = request.args.get('format') or detect_format(upload.filename, upload.mimetype)
+        elif request.content_length:
+            stream = request.stream
+            fmt = request.args.get('format') or detect_format(content_type=request.mimetype)
+        else:
+            return jsonify({'error': '가져올 파일이 필요합니다'}), 400
+
+        if fmt not in IMPORT_FORMATS:
+            return jsonify({'error': f'지원하지 않는 형식입니다: {fmt}'}), 400
+
+        result = import_attendance(
+            stream, fmt,
+            chunk_size=current_app.config.get('ATTENDANCE_IMPORT_CHUNK_SIZE', IMPORT_CHUNK_SIZE)
+        )
+
+        if result['created'] or result['updated']:
+            invalidate_dashboard_overview()
+
+            # 감사 로그 (요약 1건)
+            log_action(
+                user_id=get_current_user_id(),
+                action_type='IMPORT',
+                entity_type='attendance',
+                entity_id=None,
+                message=f"출퇴근 기록 가져오기: 생성 {result['created']}건, 갱신 {result['updated']}건 (실패 {result['failed']}건)"
+            )
+
+        return jsonify({
+            'message': f"출퇴근 기록 {result['created'] + result['updated']}건을 가져왔습니다",
+            **result
+        })
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@attendance_bp.route('/attendance/close-day', methods=['POST'])
+@jwt_required
+@admin_required
+def close_attendance():
+    """일일 출퇴근 마감 (미기록 근무 예정자 결근/휴가 기록 생성, 기본: 전날)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            target_date = datetime.strptime(data['date'], '%Y-%m-%d').date() if data.get('date') else default_close_date()
+        except (TypeError, ValueError):
+            return jsonify({'error': '잘못된 날짜 형식입니다'}), 400
+        
+        try:
+            result = close_attendance_day(target_date)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if result['created']:
+            invalidate_dashboard_overview()
+            
+            # 감사 로그 (요약 1건)
+            log_action(
+                user_id=get_current_user_id(),
+                action_type='CREATE',
+                entity_type='attendance',
+                entity_id=None,
+                message=f"{result['date']} 출퇴근 마감: 결근 {result['absent_count']}건, 휴가 {result['on_leave_count']}건"
+            )
+        
+        return jsonify({
+            'message': f"{result['date']} 출퇴근 마감이 완료되었습니다",
+            **result
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @attendance_bp.route('/attendance/records/<int:record_id>', methods=['PUT'])
 @jwt_required
 @admin_required
@@ -169,6 +377,7 @@ def update_attendance_record(record_id):
             return jsonify({'error': '존재하지 않는 출퇴근 기록입니다'}), 404
         
         data = request.get_json()
+        previous_key = (record.employee_id, record.date)
         
         # 직원 변경 시 존재 확인
         if 'employee_id' in data and data['employee_id'] != record.employee_id:
@@ -229,13 +438,17 @@ def update_attendance_record(record_id):
         
         record.updated_at = datetime.utcnow()
         
+        refresh_attendance_summaries([previous_key, (record.employee_id, record.date)])
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그 기록
         log_action(
-            user_id=request.current_user['id'],
-            action='UPDATE_ATTENDANCE',
-            details=f"직원 {record.employee.name}의 {record.date} 출퇴근 기록 수정"
+            user_id=get_current_user_id(),
+            action_type='UPDATE',
+            entity_type='attendance',
+            entity_id=record.id,
+            message=f"직원 {record.employee.name}의 {record.date} 출퇴근 기록 수정"
         )
         
         return jsonify({
@@ -259,16 +472,21 @@ def delete_attendance_record(record_id):
             return jsonify({'error': '존재하지 않는 출퇴근 기록입니다'}), 404
         
         employee_name = record.employee.name
+        employee_id = record.employee_id
         record_date = record.date
         
         db.session.delete(record)
+        refresh_attendance_summaries([(employee_id, record_date)])
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그 기록
         log_action(
-            user_id=request.current_user['id'],
-            action='DELETE_ATTENDANCE',
-            details=f"직원 {employee_name}의 {record_date} 출퇴근 기록 삭제"
+            user_id=get_current_user_id(),
+            action_type='DELETE',
+            entity_type='attendance',
+            entity_id=record_id,
+            message=f"직원 {employee_name}의 {record_date} 출퇴근 기록 삭제"
         )
         
         return jsonify({'message': '출퇴근 기록이 삭제되었습니다'})
@@ -309,6 +527,7 @@ def get_attendance_statistics():
         
         return jsonify({
             'date': filter_date.isoformat(),
+            'is_working_day': is_working_day(filter_date),
             'total_employees': total_employees,
             'present_count': present_count,
             'late_count': late_count,
@@ -387,12 +606,15 @@ def create_work_schedule():
             db.session.add(new_schedule)
         
         db.session.commit()
+        schedule_index.refresh(employee.id)
         
         # 감사 로그 기록
         log_action(
-            user_id=request.current_user['id'],
-            action='CREATE_WORK_SCHEDULE',
-            details=f"직원 {employee.name}의 근무시간 설정 생성"
+            user_id=get_current_user_id(),
+            action_type='CREATE',
+            entity_type='work_schedule',
+            entity_id=employee.id,
+            message=f"직원 {employee.name}의 근무시간 설정 생성"
         )
         
         return jsonify({'message': '근무시간 설정이 생성되었습니다'}), 201
@@ -1,8 +1,13 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin
 from datetime import datetime, timedelta
 from src.models.user import db, User
-from src.models.audit_log import AuditLog
+from src.models.audit_log import AuditLog, AuditLogDailyRollup
+from src.utils.audit_rollup import refresh_audit_rollups
+from src.utils.pagination import keyset_page, page_size, flag_arg, encode_cursor, decode_cursor
+from src.utils.audit_archive import archived_until, iter_archived_logs, archived_log_dict
+from itertools import islice
+import math
 
 audit_log_bp = Blueprint('audit_log', __name__)
 
@@ -13,6 +18,95 @@ def require_admin():
         return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
     return None
 
+def sanitize_log(log_dict):
+    """민감한 정보(비밀번호 관련 필드) 제거"""
+    for key in ('old_values', 'new_values'):
+        if log_dict.get(key):
+            log_dict[key] = {k: v for k, v in log_dict[key].items()
+                             if k not in ['password_hash', 'password']}
+    return log_dict
+
+def archive_filters(start_datetime, end_datetime, **filters):
+    """조회 기간이 보관 구간에 걸치면 보관 로그 검색 조건 반환 (아니면 None)"""
+    if start_datetime is None and not flag_arg(request.args.get('include_archive')):
+        return None
+    latest = archived_until(current_app)
+    if latest is None or (start_datetime is not None and start_datetime > latest):
+        return None
+    return {'start': start_datetime, 'end': end_datetime, **filters}
+
+def archived_logs(rows, sanitize):
+    """보관 로그 행 -> 응답 dict"""
+    user_ids = {row['user_id'] for row in rows}
+    usernames = dict(db.session.query(User.id, User.username).filter(User.id.in_(user_ids)).all()) if user_ids else {}
+    logs = [archived_log_dict(row, usernames) for row in rows]
+    return [sanitize_log(log) for log in logs] if sanitize else logs
+
+def list_audit_logs(query, page, per_page, include_total, archive=None, sanitize=False):
+    """감사 로그 목록 (커서/페이지 번호 모드, 보관 구간 포함) 응답 dict"""
+    def serialize(log):
+        return sanitize_log(log.to_dict()) if sanitize else log.to_dict()
+    
+    if 'cursor' in request.args:
+        # 키셋 페이지네이션 (created_at, id 내림차순), 운영 테이블 이후 보관 로그 이어서 조회
+        limit = page_size(per_page)
+        cursor = request.args.get('cursor')
+        logs, next_cursor = keyset_page(query, [AuditLog.created_at, AuditLog.id], cursor, limit)
+        items = [serialize(log) for log in logs]
+        
+        if archive and next_cursor is None:
+            if logs:
+                before = (logs[-1].created_at, logs[-1].id)
+            else:
+                before = tuple(decode_cursor(cursor, [AuditLog.created_at, AuditLog.id])) if cursor else None
+            need = limit - len(items)
+            rows = list(islice(iter_archived_logs(current_app, before=before, **archive), need + 1))
+            if len(rows) > need:
+                rows = rows[:need]
+                last = rows[-1] if rows else None
+                next_cursor = encode_cursor(
+                    [last['created_at'], last['id']] if last else [logs[-1].created_at, logs[-1].id]
+                )
+            items += archived_logs(rows, sanitize)
+        
+        result = {
+            'logs': items,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
+            'per_page': limit
+        }
+        if include_total:
+            result['total'] = query.count() + (
+                sum(1 for _ in iter_archived_logs(current_app, **archive)) if archive else 0
+            )
+        return result
+    
+    # 최신순 정렬 후 페이지네이션, 운영 테이블 이후 페이지는 보관 로그에서 조회
+    query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    logs = query.paginate(page=page, per_page=per_page, error_out=False, count=include_total or bool(archive))
+    items = [serialize(log) for log in logs.items]
+    total = logs.total
+    pages = logs.pages
+    
+    if archive:
+        need = per_page - len(items)
+        if need > 0:
+            skip = max(0, (page - 1) * per_page - logs.total)
+            items += archived_logs(list(islice(iter_archived_logs(current_app, **archive), skip, skip + need)), sanitize)
+        if include_total:
+            total += sum(1 for _ in iter_archived_logs(current_app, **archive))
+            pages = math.ceil(total / per_page) if per_page else 0
+        else:
+            total, pages = None, 0
+    
+    return {
+        'logs': items,
+        'total': total,
+        'pages': pages,
+        'current_page': page,
+        'per_page': per_page
+    }
+
 @audit_log_bp.route('/audit-logs', methods=['GET'])
 @jwt_required
 def get_audit_logs():
@@ -34,6 +128,7 @@ def get_audit_logs():
         
         # 기본 쿼리
         query = AuditLog.query
+        start_datetime = end_datetime = None
         
         # 필터 적용
         if user_id:
@@ -53,30 +148,31 @@ def get_audit_logs():
             end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
             query = query.filter(AuditLog.created_at < end_datetime)
         
-        # 최신순 정렬
-        query = query.order_by(AuditLog.created_at.desc())
+        # 커서 모드는 전체 건수 기본 생략, 통계는 요청 시에만 집계
+        include_total = flag_arg(request.args.get('include_total'), default='cursor' not in request.args)
+        include_statistics = flag_arg(request.args.get('include_statistics'))
         
-        # 페이지네이션
-        logs = query.paginate(page=page, per_page=per_page, error_out=False)
+        archive = archive_filters(
+            start_datetime, end_datetime,
+            user_id=user_id or None, action_type=action_type, entity_type=entity_type
+        )
+        result = list_audit_logs(query, page, per_page, include_total, archive)
+        total = result.get('total')
         
         # 통계 정보
-        total_logs = query.count()
-        action_types = db.session.query(AuditLog.action_type, db.func.count(AuditLog.id)).group_by(AuditLog.action_type).all()
-        entity_types = db.session.query(AuditLog.entity_type, db.func.count(AuditLog.id)).group_by(AuditLog.entity_type).all()
-        
-        return jsonify({
-            'logs': [log.to_dict() for log in logs.items],
-            'total': logs.total,
-            'pages': logs.pages,
-            'current_page': page,
-            'per_page': per_page,
-            'statistics': {
-                'total_logs': total_logs,
+        if include_statistics:
+            action_types = db.session.query(AuditLog.action_type, db.func.count(AuditLog.id)).group_by(AuditLog.action_type).all()
+            entity_types = db.session.query(AuditLog.entity_type, db.func.count(AuditLog.id)).group_by(AuditLog.entity_type).all()
+            result['statistics'] = {
+                'total_logs': total if total is not None else query.count(),
                 'action_types': dict(action_types),
                 'entity_types': dict(entity_types)
             }
-        }), 200
         
+        return jsonify(result), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'감사 로그 조회 중 오류가 발생했습니다: {str(e)}'}), 500
 
@@ -115,6 +211,7 @@ def get_my_audit_logs():
         
         # 본인의 로그만 조회
         query = AuditLog.query.filter(AuditLog.user_id == current_user_id)
+        start_datetime = end_datetime = None
         
         # 필터 적용
         if action_type:
@@ -128,33 +225,13 @@ def get_my_audit_logs():
             end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
             query = query.filter(AuditLog.created_at < end_datetime)
         
-        # 최신순 정렬
-        query = query.order_by(AuditLog.created_at.desc())
-        
-        # 페이지네이션
-        logs = query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        # 민감한 정보 제거 (본인 로그이지만 보안상)
-        sanitized_logs = []
-        for log in logs.items:
-            log_dict = log.to_dict()
-            # old_values, new_values에서 민감한 정보 제거
-            if log_dict.get('old_values'):
-                log_dict['old_values'] = {k: v for k, v in log_dict['old_values'].items() 
-                                        if k not in ['password_hash', 'password']}
-            if log_dict.get('new_values'):
-                log_dict['new_values'] = {k: v for k, v in log_dict['new_values'].items() 
-                                        if k not in ['password_hash', 'password']}
-            sanitized_logs.append(log_dict)
-        
-        return jsonify({
-            'logs': sanitized_logs,
-            'total': logs.total,
-            'pages': logs.pages,
-            'current_page': page,
-            'per_page': per_page
-        }), 200
+        # 본인 로그도 민감한 정보는 제거하여 반환
+        include_total = flag_arg(request.args.get('include_total'), default='cursor' not in request.args)
+        archive = archive_filters(start_datetime, end_datetime, user_id=current_user_id, action_type=action_type)
+        return jsonify(list_audit_logs(query, page, per_page, include_total, archive, sanitize=True)), 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'내 활동 로그 조회 중 오류가 발생했습니다: {str(e)}'}), 500
 
@@ -168,51 +245,55 @@ def get_audit_log_summary():
         if admin_check:
             return admin_check
         
-        # 기간 설정 (기본: 최근 30일)
+        # 새 로그를 일별 집계에 반영 (실패 시 기존 집계로 응답)
+        try:
+            refresh_audit_rollups()
+        except Exception as e:
+            print(f"감사 로그 집계 갱신 실패: {str(e)}")
+        
+        # 기간 설정 (기본: 최근 30일, 일 단위)
         days = request.args.get('days', 30, type=int)
-        start_date = datetime.utcnow() - timedelta(days=days)
+        today = datetime.utcnow().date()
+        in_period = AuditLogDailyRollup.date >= today - timedelta(days=days)
+        log_count = db.func.sum(AuditLogDailyRollup.count)
         
         # 기본 통계
-        total_logs = AuditLog.query.filter(AuditLog.created_at >= start_date).count()
+        total_logs = db.session.query(db.func.coalesce(log_count, 0)).filter(in_period).scalar()
         
         # 액션 타입별 통계
         action_stats = db.session.query(
-            AuditLog.action_type, 
-            db.func.count(AuditLog.id)
-        ).filter(
-            AuditLog.created_at >= start_date
-        ).group_by(AuditLog.action_type).all()
+            AuditLogDailyRollup.action_type,
+            log_count
+        ).filter(in_period).group_by(AuditLogDailyRollup.action_type).all()
         
         # 엔티티 타입별 통계
         entity_stats = db.session.query(
-            AuditLog.entity_type, 
-            db.func.count(AuditLog.id)
-        ).filter(
-            AuditLog.created_at >= start_date
-        ).group_by(AuditLog.entity_type).all()
+            AuditLogDailyRollup.entity_type,
+            log_count
+        ).filter(in_period).group_by(AuditLogDailyRollup.entity_type).all()
         
         # 사용자별 활동 통계 (상위 10명)
         user_stats = db.session.query(
-            AuditLog.user_id,
+            AuditLogDailyRollup.user_id,
             User.username,
-            db.func.count(AuditLog.id).label('activity_count')
-        ).join(User).filter(
-            AuditLog.created_at >= start_date
-        ).group_by(
-            AuditLog.user_id, User.username
+            log_count.label('activity_count')
+        ).join(
+            User, User.id == AuditLogDailyRollup.user_id
+        ).filter(in_period).group_by(
+            AuditLogDailyRollup.user_id, User.username
         ).order_by(
-            db.func.count(AuditLog.id).desc()
+            log_count.desc()
         ).limit(10).all()
         
         # 일별 활동 통계 (최근 7일)
         daily_stats = db.session.query(
-            db.func.date(AuditLog.created_at).label('date'),
-            db.func.count(AuditLog.id).label('count')
+            AuditLogDailyRollup.date,
+            log_count.label('count')
         ).filter(
-            AuditLog.created_at >= datetime.utcnow() - timedelta(days=7)
+            AuditLogDailyRollup.date >= today - timedelta(days=7)
         ).group_by(
-            db.func.date(AuditLog.created_at)
-        ).order_by('date').all()
+            AuditLogDailyRollup.date
+        ).order_by(AuditLogDailyRollup.date).all()
         
         return jsonify({
             'period_days': days,
@@ -2,7 +2,7 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime, timedelta
 from src.models.user import db, User
 from src.models.audit_log import AuditLog
-from src.utils.jwt_helper import create_access_token, create_refresh_token, jwt_required, get_current_user_id, verify_refresh_token
+from src.utils.jwt_helper import create_access_token, create_refresh_token, jwt_required, get_current_user_id, verify_refresh_token, invalidate_auth_cache
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -70,6 +70,7 @@ def login():
         )
         
         db.session.commit()
+        invalidate_auth_cache(user.id)
         
         return jsonify({
             'access_token': access_token,
@@ -234,6 +235,7 @@ def change_password():
         )
         
         db.session.commit()
+        invalidate_auth_cache(user.id)
         
         return jsonify({'message': '비밀번호가 성공적으로 변경되었습니다.'}), 200
         
@@ -329,6 +331,7 @@ def update_my_profile():
             )
             
             db.session.commit()
+            invalidate_auth_cache(user.id)
             
             return jsonify({
                 'message': '프로필이 성공적으로 수정되었습니다.',
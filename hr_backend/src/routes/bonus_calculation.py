@@ -12,6 +12,9 @@ from ..models.bonus_calculation_advanced import (
 from ..models.audit_log import AuditLog
 from ..utils.auth import token_required, admin_required
 from ..utils.audit import log_action
+from ..utils.period import year_range, in_range
+from ..utils.pagination import flag_arg
+from ..utils.department_tree import subtree_filter
 
 bonus_calculation_bp = Blueprint('bonus_calculation', __name__)
 
@@ -195,7 +198,10 @@ def get_bonus_distributions(current_user, calculation_id):
         
         # 부서 필터
         if department_id:
-            query = query.filter(BonusDistribution.department_id == department_id)
+            if flag_arg(request.args.get('include_subdepartments')):
+                query = query.filter(subtree_filter(BonusDistribution.department_id, department_id))
+            else:
+                query = query.filter(BonusDistribution.department_id == department_id)
         
         # 직원 이름 검색
         if search:
@@ -397,7 +403,7 @@ def get_bonus_statistics(current_user):
         
         # 연도별 성과급 통계
         calculations = BonusCalculation.query.filter(
-            func.extract('year', BonusCalculation.start_date) == year
+            in_range(BonusCalculation.start_date, *year_range(year))
         ).all()
         
         # 기본 통계
@@ -441,7 +447,7 @@ def get_bonus_statistics(current_user):
         # 월별 지급 통계
         monthly_stats = {}
         payments = BonusPaymentHistory.query.filter(
-            func.extract('year', BonusPaymentHistory.payment_date) == year
+            in_range(BonusPaymentHistory.payment_date, *year_range(year))
         ).all()
         
         for payment in payments:
@@ -1,13 +1,11 @@
-from flask import Blueprint, request, jsonify
-from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin
-from sqlalchemy import and_, or_, desc, func, extract, case
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from src.utils.jwt_helper import jwt_required, admin_required, get_current_user_id, get_current_user_role, require_admin
+from sqlalchemy import and_, or_, desc, func, case
 from datetime import datetime, timedelta, date
-import calendar
 
 from ..database import db
 from ..models.employee import Employee
 from ..models.department import Department
-from ..models.attendance import AttendanceRecord
 from ..models.annual_leave_grant import AnnualLeaveGrant
 from ..models.annual_leave_usage import AnnualLeaveUsage
 from ..models.annual_leave_request import AnnualLeaveRequest as LeaveRequest
@@ -16,6 +14,10 @@ from ..models.bonus_policy import BonusCalculation, BonusDistribution
 from ..models.payroll import Payroll as PayrollRecord
 from ..models.audit_log import AuditLog
 from ..utils.report_generator import ReportGenerator
+from ..utils.dashboard_overview import overview_engine
+from ..utils.report_export import stream_report_csv, EXPORT_TYPES
+from ..utils.period import period_range, year_range, in_range
+from ..utils.attendance_summary import monthly_attendance_totals
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
@@ -24,124 +26,15 @@ dashboard_bp = Blueprint('dashboard', __name__)
 def get_dashboard_overview():
     """대시보드 개요 통계"""
     try:
-        print("=== 대시보드 API 디버깅 시작 ===")
-        
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        print(f"현재 연도/월: {current_year}/{current_month}")
-        
-        # 기본 통계
-        print("1. 기본 통계 조회 중...")
-        total_employees = Employee.query.count()
-        total_departments = Department.query.count()
-        print(f"✅ 직원 수: {total_employees}, 부서 수: {total_departments}")
-        
-        # 이번 달 출근 통계
-        print("2. 출근 통계 조회 중...")
-        total_records = AttendanceRecord.query.filter(
-            extract('year', AttendanceRecord.date) == current_year,
-            extract('month', AttendanceRecord.date) == current_month
-        ).count()
-        print(f"✅ 총 출근 기록: {total_records}")
-        
-        late_count = AttendanceRecord.query.filter(
-            extract('year', AttendanceRecord.date) == current_year,
-            extract('month', AttendanceRecord.date) == current_month,
-            AttendanceRecord.status == '지각'
-        ).count()
-        print(f"✅ 지각 수: {late_count}")
-        
-        absent_count = AttendanceRecord.query.filter(
-            extract('year', AttendanceRecord.date) == current_year,
-            extract('month', AttendanceRecord.date) == current_month,
-            AttendanceRecord.status == '결근'
-        ).count()
-        print(f"✅ 결근 수: {absent_count}")
-        
-        avg_work_hours_result = db.session.query(
-            func.avg(AttendanceRecord.work_hours)
-        ).filter(
-            extract('year', AttendanceRecord.date) == current_year,
-            extract('month', AttendanceRecord.date) == current_month
-        ).scalar() or 0
-        print(f"✅ 평균 근무시간: {avg_work_hours_result}")
-        
-        # 연차 사용 통계
-        print("3. 연차 통계 조회 중...")
-        annual_leave_stats = db.session.query(
-            func.sum(AnnualLeaveUsage.used_days).label('total_used'),
-            func.count(AnnualLeaveUsage.id).label('usage_count')
-        ).filter(
-            extract('year', AnnualLeaveUsage.usage_date) == current_year
-        ).first()
-        print(f"✅ 연차 통계: {annual_leave_stats}")
-        
-        # 평가 진행 상황 - SQLAlchemy 인스턴스 문제 해결 후 재활성화
-        print("4. 평가 통계 조회 중...")
-        total_evaluations = Evaluation.query.filter(
-            extract('year', Evaluation.created_at) == current_year
-        ).count()
-        print(f"✅ 총 평가 수: {total_evaluations}")
-        
-        completed_evaluations = Evaluation.query.filter(
-            extract('year', Evaluation.created_at) == current_year,
-            Evaluation.status == 'completed'
-        ).count()
-        print(f"✅ 완료된 평가 수: {completed_evaluations}")
-        
-        # 평균 점수는 0으로 설정 (추후 구현)
-        avg_score_result = 0
-        print(f"✅ 평균 점수: {avg_score_result}")
-        
-        # 급여 통계 (이번 달)
-        print("5. 급여 통계 조회 중...")
-        payroll_stats = db.session.query(
-            func.count(PayrollRecord.id).label('total_payrolls'),
-            func.sum(PayrollRecord.base_salary).label('total_gross_pay'),
-            func.sum(PayrollRecord.net_pay).label('total_net_pay'),
-            func.avg(PayrollRecord.net_pay).label('avg_net_pay')
-        ).filter(
-            PayrollRecord.year == current_year,
-            PayrollRecord.month == current_month
-        ).first()
-        print(f"✅ 급여 통계: {payroll_stats}")
-        
-        print("6. 응답 데이터 구성 중...")
-        response_data = {
-            'overview': {
-                'total_employees': total_employees,
-                'total_departments': total_departments,
-                'current_period': f"{current_year}년 {current_month}월"
-            },
-            'attendance': {
-                'total_records': total_records,
-                'avg_work_hours': float(avg_work_hours_result),
-                'late_count': late_count,
-                'absent_count': absent_count,
-                'attendance_rate': round((1 - (absent_count / max(total_records, 1))) * 100, 1)
-            },
-            'annual_leave': {
-                'total_used': float(annual_leave_stats.total_used or 0),
-                'usage_count': annual_leave_stats.usage_count or 0,
-                'avg_per_employee': round(float(annual_leave_stats.total_used or 0) / max(total_employees, 1), 1)
-            },
-            'evaluation': {
-                'total_evaluations': total_evaluations,
-                'completed_evaluations': completed_evaluations,
-                'completion_rate': round((completed_evaluations / max(total_evaluations, 1)) * 100, 1),
-                'avg_score': round(float(avg_score_result), 1)
-            },
-            'payroll': {
-                'total_payrolls': payroll_stats.total_payrolls or 0,
-                'total_gross_pay': float(payroll_stats.total_gross_pay or 0),
-                'total_net_pay': float(payroll_stats.total_net_pay or 0),
-                'avg_net_pay': float(payroll_stats.avg_net_pay or 0)
-            }
-        }
-        
-        print("✅ 응답 데이터 구성 완료")
-        print("=== 대시보드 API 디버깅 완료 ===")
-        
+        now = datetime.now()
+        year = request.args.get('year', now.year, type=int)
+        month = request.args.get('month', now.month, type=int)
+        use_cache = request.args.get('refresh', 'false').lower() != 'true'
+
+        if not 1 <= month <= 12:
+            return jsonify({'error': '월은 1~12 사이여야 합니다.'}), 400
+
+        response_data = overview_engine.get_overview(year, month, use_cache=use_cache)
         return jsonify(response_data)
         
     except Exception as e:
@@ -156,29 +49,12 @@ def get_dashboard_overview():
 def get_attendance_trend():
     """출근 트렌드 차트 데이터"""
     try:
-        # 최근 12개월 데이터
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        # 월별 출근 통계
-        monthly_stats = db.session.query(
-            extract('year', AttendanceRecord.date).label('year'),
-            extract('month', AttendanceRecord.date).label('month'),
-            func.count(AttendanceRecord.id).label('total_records'),
-            func.count().filter(AttendanceRecord.status == '출근').label('on_time'),
-            func.count().filter(AttendanceRecord.status == '지각').label('late'),
-            func.count().filter(AttendanceRecord.status == '결근').label('absent'),
-            func.avg(AttendanceRecord.work_hours).label('avg_hours')
-        ).filter(
-            AttendanceRecord.date >= start_date.date(),
-            AttendanceRecord.date <= end_date.date()
-        ).group_by(
-            extract('year', AttendanceRecord.date),
-            extract('month', AttendanceRecord.date)
-        ).order_by(
-            extract('year', AttendanceRecord.date),
-            extract('month', AttendanceRecord.date)
-        ).all()
+        # 최근 12개월 데이터 (월별 집계 테이블, 직원 수 x 12행)
+        today = date.today()
+        start_index = today.year * 12 + today.month - 1 - 11
+        monthly_stats = monthly_attendance_totals(
+            start_index // 12, start_index % 12 + 1, today.year, today.month
+        )
         
         chart_data = []
         for stat in monthly_stats:
@@ -190,7 +66,7 @@ def get_attendance_trend():
                 'on_time': stat.on_time,
                 'late': stat.late,
                 'absent': stat.absent,
-                'avg_hours': round(float(stat.avg_hours or 0), 1),
+                'avg_hours': round(float(stat.work_hours or 0) / max(stat.work_hours_days or 0, 1), 1),
                 'attendance_rate': round((stat.on_time + stat.late) / max(stat.total_records, 1) * 100, 1)
             })
         
@@ -237,7 +113,7 @@ def get_department_stats():
             func.sum(AnnualLeaveUsage.used_days).label('total_used_days'),
             func.count(Employee.id).label('employee_count')
         ).join(Employee).outerjoin(AnnualLeaveUsage).filter(
-            extract('year', AnnualLeaveUsage.usage_date) == current_year
+            in_range(AnnualLeaveUsage.usage_date, *year_range(current_year))
         ).group_by(Department.id, Department.name).all()
         
         # 데이터 통합
@@ -345,87 +221,22 @@ def get_summary_report():
         year = request.args.get('year', datetime.now().year, type=int)
         month = request.args.get('month', datetime.now().month, type=int)
         
-        # 기간 설정
-        if month:
-            # 특정 월 데이터
-            period_filter = and_(
-                extract('year', PayrollRecord.created_at) == year,
-                extract('month', PayrollRecord.created_at) == month
-            )
-            period_name = f"{year}년 {month}월"
-        else:
-            # 연간 데이터
-            period_filter = extract('year', PayrollRecord.created_at) == year
-            period_name = f"{year}년"
-        
-        # 직원 현황
-        employee_summary = {
-            'total_employees': Employee.query.count(),
-            'active_employees': Employee.query.filter_by(status='active').count(),
-            'departments': Department.query.count()
-        }
-        
-        # 출근 현황
-        attendance_summary = db.session.query(
-            func.count(AttendanceRecord.id).label('total_days'),
-            func.avg(AttendanceRecord.work_hours).label('avg_hours'),
-            func.count().filter(AttendanceRecord.status == '지각').label('late_days'),
-            func.count().filter(AttendanceRecord.status == '결근').label('absent_days')
-        ).filter(period_filter.replace(PayrollRecord.created_at, AttendanceRecord.date)).first()
-        
-        # 급여 현황
-        payroll_summary = db.session.query(
-            func.count(PayrollRecord.id).label('total_payrolls'),
-            func.sum(PayrollRecord.gross_pay).label('total_gross'),
-            func.sum(PayrollRecord.net_pay).label('total_net'),
-            func.sum(PayrollRecord.total_deductions).label('total_deductions')
-        ).filter(period_filter).first()
-        
-        # 평가 현황
-        evaluation_summary = db.session.query(
-            func.count(Evaluation.id).label('total_evaluations'),
-            func.count().filter(Evaluation.status == 'completed').label('completed'),
-            func.avg(func.case((Evaluation.status == 'completed', Evaluation.total_score), else_=None)).label('avg_score')
-        ).filter(period_filter.replace(PayrollRecord.created_at, Evaluation.created_at)).first()
+        report = get_summary_report_data(year, month or None)
         
         # 성과급 현황
         bonus_summary = db.session.query(
             func.count(BonusCalculation.id).label('total_calculations'),
             func.sum(BonusCalculation.total_amount).label('total_amount')
-        ).filter(period_filter.replace(PayrollRecord.created_at, BonusCalculation.created_at)).first()
+        ).filter(
+            in_range(BonusCalculation.created_at, *period_range(year, month or None))
+        ).first()
         
-        return jsonify({
-            'period': period_name,
-            'employee': {
-                'total_employees': employee_summary['total_employees'],
-                'active_employees': employee_summary['active_employees'],
-                'departments': employee_summary['departments']
-            },
-            'attendance': {
-                'total_days': attendance_summary.total_days or 0,
-                'avg_hours': round(float(attendance_summary.avg_hours or 0), 1),
-                'late_days': attendance_summary.late_days or 0,
-                'absent_days': attendance_summary.absent_days or 0,
-                'attendance_rate': round((1 - (attendance_summary.absent_days or 0) / max(attendance_summary.total_days or 1, 1)) * 100, 1)
-            },
-            'payroll': {
-                'total_payrolls': payroll_summary.total_payrolls or 0,
-                'total_gross': float(payroll_summary.total_gross or 0),
-                'total_net': float(payroll_summary.total_net or 0),
-                'total_deductions': float(payroll_summary.total_deductions or 0),
-                'avg_net': round(float(payroll_summary.total_net or 0) / max(payroll_summary.total_payrolls or 1, 1), 0)
-            },
-            'evaluation': {
-                'total_evaluations': evaluation_summary.total_evaluations or 0,
-                'completed': evaluation_summary.completed or 0,
-                'completion_rate': round((evaluation_summary.completed or 0) / max(evaluation_summary.total_evaluations or 1, 1) * 100, 1),
-                'avg_score': round(float(evaluation_summary.avg_score or 0), 1)
-            },
-            'bonus': {
-                'total_calculations': bonus_summary.total_calculations or 0,
-                'total_amount': float(bonus_summary.total_amount or 0)
-            }
-        })
+        report['bonus'] = {
+            'total_calculations': bonus_summary.total_calculations or 0,
+            'total_amount': float(bonus_summary.total_amount or 0)
+        }
+        
+        return jsonify(report)
         
     except Exception as e:
         return jsonify({'error': f'종합 리포트를 불러오는데 실패했습니다: {str(e)}'}), 500
@@ -434,9 +245,9 @@ def get_summary_report():
 
 @dashboard_bp.route('/dashboard/reports/download', methods=['POST'])
 @jwt_required
-
+@admin_required
 def download_report():
-    """리포트 다운로드"""
+    """리포트 다운로드 (관리자 전용, 직원별 출근/급여 상세 포함)"""
     try:
         data = request.get_json()
         report_type = data.get('report_type', 'summary')  # summary, attendance, payroll, evaluation
@@ -444,20 +255,20 @@ def download_report():
         year = data.get('year', datetime.now().year)
         month = data.get('month', datetime.now().month)
         
-        # 기간 설정
-        if month and month > 0:
-            period_name = f"{year}년 {month}월"
-            period_filter = and_(
-                extract('year', PayrollRecord.created_at) == year,
-                extract('month', PayrollRecord.created_at) == month
-            )
-        else:
-            period_name = f"{year}년"
-            period_filter = extract('year', PayrollRecord.created_at) == year
+        period_name = f"{year}년 {month}월" if month and month > 0 else f"{year}년"
+        
+        # 상세 CSV는 전체 파일을 만들지 않고 스트리밍
+        if format_type == 'csv' and report_type in EXPORT_TYPES:
+            start_date, end = period_range(year, month if month and month > 0 else None)
+            end_date = end - timedelta(days=1)
+            filename = f"hr_report_{report_type}_{year}"
+            if month and month > 0:
+                filename += f"_{month:02d}"
+            return _csv_stream_response(report_type, start_date, end_date, filename + ".csv")
         
         # 리포트 데이터 수집
         if report_type == 'summary':
-            report_data = get_summary_report_data(period_filter, period_name)
+            report_data = get_summary_report_data(year, month if month and month > 0 else None)
         else:
             # 다른 리포트 타입들은 향후 확장
             report_data = {}
@@ -497,64 +308,49 @@ def download_report():
     except Exception as e:
         return jsonify({'error': f'리포트 다운로드에 실패했습니다: {str(e)}'}), 500
 
-def get_summary_report_data(period_filter, period_name):
-    """종합 리포트 데이터 수집"""
-    # 직원 현황
-    employee_summary = {
-        'total_employees': Employee.query.count(),
-        'active_employees': Employee.query.filter_by(status='active').count(),
-        'departments': Department.query.count()
-    }
-    
-    # 출근 현황
-    attendance_summary = db.session.query(
-        func.count(AttendanceRecord.id).label('total_days'),
-        func.avg(AttendanceRecord.work_hours).label('avg_hours'),
-        func.count().filter(AttendanceRecord.status == '지각').label('late_days'),
-        func.count().filter(AttendanceRecord.status == '결근').label('absent_days')
-    ).filter(period_filter.replace(PayrollRecord.created_at, AttendanceRecord.date)).first()
-    
-    # 급여 현황
-    payroll_summary = db.session.query(
-        func.count(PayrollRecord.id).label('total_payrolls'),
-        func.sum(PayrollRecord.gross_pay).label('total_gross'),
-        func.sum(PayrollRecord.net_pay).label('total_net'),
-        func.sum(PayrollRecord.total_deductions).label('total_deductions')
-    ).filter(period_filter).first()
-    
-    # 평가 현황
-    evaluation_summary = db.session.query(
-        func.count(Evaluation.id).label('total_evaluations'),
-        func.count().filter(Evaluation.status == 'completed').label('completed'),
-        func.avg(func.case((Evaluation.status == 'completed', Evaluation.total_score), else_=None)).label('avg_score')
-    ).filter(period_filter.replace(PayrollRecord.created_at, Evaluation.created_at)).first()
-    
-    return {
-        'period': period_name,
-        'employee': {
-            'total_employees': employee_summary['total_employees'],
-            'active_employees': employee_summary['active_employees'],
-            'departments': employee_summary['departments']
-        },
-        'attendance': {
-            'total_days': attendance_summary.total_days or 0,
-            'avg_hours': round(float(attendance_summary.avg_hours or 0), 1),
-            'late_days': attendance_summary.late_days or 0,
-            'absent_days': attendance_summary.absent_days or 0,
-            'attendance_rate': round((1 - (attendance_summary.absent_days or 0) / max(attendance_summary.total_days or 1, 1)) * 100, 1)
-        },
-        'payroll': {
-            'total_payrolls': payroll_summary.total_payrolls or 0,
-            'total_gross': float(payroll_summary.total_gross or 0),
-            'total_net': float(payroll_summary.total_net or 0),
-            'total_deductions': float(payroll_summary.total_deductions or 0),
-            'avg_net': round(float(payroll_summary.total_net or 0) / max(payroll_summary.total_payrolls or 1, 1), 0)
-        },
-        'evaluation': {
-            'total_evaluations': evaluation_summary.total_evaluations or 0,
-            'completed': evaluation_summary.completed or 0,
-            'completion_rate': round((evaluation_summary.completed or 0) / max(evaluation_summary.total_evaluations or 1, 1) * 100, 1),
-            'avg_score': round(float(evaluation_summary.avg_score or 0), 1)
-        }
-    }
+@dashboard_bp.route('/dashboard/reports/export', methods=['GET'])
+@jwt_required
+@admin_required
+def export_report():
+    """리포트 CSV 스트리밍 내보내기 (임의 기간, 관리자 전용)"""
+    try:
+        report_type = request.args.get('report_type', 'attendance')  # attendance, payroll
+        if report_type not in EXPORT_TYPES:
+            return jsonify({'error': '지원하지 않는 리포트 타입입니다.'}), 400
+        
+        today = date.today()
+        try:
+            start_date = datetime.strptime(request.args['start_date'], '%Y-%m-%d').date() \
+                if request.args.get('start_date') else today.replace(day=1)
+            end_date = datetime.strptime(request.args['end_date'], '%Y-%m-%d').date() \
+                if request.args.get('end_date') else today
+        except ValueError:
+            return jsonify({'error': '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'}), 400
+        
+        if start_date > end_date:
+            return jsonify({'error': '시작일이 종료일보다 늦을 수 없습니다.'}), 400
+        
+        # 부서 지정 시 하위 부서 포함 직원만 내보내기
+        department_id = request.args.get('department_id', type=int)
+        
+        filename = f"hr_report_{report_type}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv"
+        return _csv_stream_response(report_type, start_date, end_date, filename, department_id)
+        
+    except Exception as e:
+        return jsonify({'error': f'리포트 내보내기에 실패했습니다: {str(e)}'}), 500
+
+def _csv_stream_response(report_type, start_date, end_date, filename, department_id=None):
+    """CSV 청크 스트리밍 응답"""
+    from flask import current_app
+    yield_per = current_app.config.get('REPORT_EXPORT_YIELD_PER', 1000)
+    response = Response(
+        stream_with_context(stream_report_csv(report_type, start_date, end_date, yield_per, department_id)),
+        mimetype='text/csv'
+    )
+    response.headers['Content-Type'] = 'text/csv; charset=utf-8'
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
 
+def get_summary_report_data(year, month=None):
+    """종합 리포트 데이터 수집"""
+    return overview_engine.summary_report(year, month)
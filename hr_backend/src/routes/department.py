@@ -4,7 +4,13 @@ from src.models.user import db, User
 from src.models.employee import Employee
 from src.models.department import Department
 from src.models.audit_log import AuditLog
-from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin
+from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin, invalidate_auth_cache
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.pagination import flag_arg
+from src.utils.department_tree import (
+    insert_department_node, move_department_subtree, delete_department_node, is_descendant,
+    subtree_filter, department_employee_counts, department_tree
+)
 
 department_bp = Blueprint('department', __name__)
 
@@ -29,9 +35,8 @@ def get_departments():
             query = query.filter(Department.is_active == True)
         
         if tree_view:
-            # 트리 구조로 반환 (최상위 부서만 조회)
-            root_departments = query.filter(Department.parent_id.is_(None)).order_by(Department.name).all()
-            departments_tree = [dept.to_tree_dict() for dept in root_departments]
+            # 트리 구조로 반환 (클로저 테이블로 부서/직원 수를 일괄 조회)
+            departments_tree = department_tree(include_inactive)
             
             return jsonify({
                 'departments': departments_tree,
@@ -40,9 +45,17 @@ def get_departments():
         else:
             # 플랫 리스트로 반환
             departments = query.order_by(Department.name).all()
+            counts = department_employee_counts()
+            
+            departments_data = []
+            for dept in departments:
+                direct, total = counts.get(dept.id, (0, 0))
+                dept_data = dept.to_dict(employee_count=direct)
+                dept_data['subtree_employee_count'] = total
+                departments_data.append(dept_data)
             
             return jsonify({
-                'departments': [dept.to_dict() for dept in departments],
+                'departments': departments_data,
                 'tree_view': False
             }), 200
         
@@ -58,10 +71,17 @@ def get_department(department_id):
         if not department:
             return jsonify({'error': '부서를 찾을 수 없습니다.'}), 404
         
-        # 부서 직원 목록도 함께 조회
-        employees = Employee.query.filter_by(department_id=department_id, status='active').all()
+        # 부서 직원 목록도 함께 조회 (include_subdepartments=true면 하위 부서 직원 포함)
+        employee_query = Employee.query.filter(Employee.status == 'active')
+        if flag_arg(request.args.get('include_subdepartments')):
+            employee_query = employee_query.filter(subtree_filter(Employee.department_id, department_id))
+        else:
+            employee_query = employee_query.filter(Employee.department_id == department_id)
+        employees = employee_query.all()
         
-        department_data = department.to_dict()
+        direct, total = department_employee_counts(department_id).get(department_id, (0, 0))
+        department_data = department.to_dict(employee_count=direct)
+        department_data['subtree_employee_count'] = total
         department_data['employees'] = [emp.to_summary_dict() for emp in employees]
         
         return jsonify({'department': department_data}), 200
@@ -120,6 +140,7 @@ def create_department():
         
         db.session.add(department)
         db.session.flush()  # department.id를 얻기 위해
+        insert_department_node(department.id, parent_id or None)
         
         # 감사 로그
         AuditLog.log_action(
@@ -134,6 +155,7 @@ def create_department():
         )
         
         db.session.commit()
+        invalidate_dashboard_overview()
         
         return jsonify({
             'message': '부서가 성공적으로 생성되었습니다.',
@@ -180,6 +202,9 @@ def update_department(department_id):
             parent_dept = Department.query.get(data['parent_id'])
             if not parent_dept:
                 return jsonify({'error': '상위 부서를 찾을 수 없습니다.'}), 404
+            
+            if is_descendant(parent_dept.id, department.id):
+                return jsonify({'error': '하위 부서를 상위 부서로 설정할 수 없습니다.'}), 400
         
         # 부서장 확인
         if 'manager_id' in data and data['manager_id']:
@@ -187,6 +212,8 @@ def update_department(department_id):
             if not manager:
                 return jsonify({'error': '부서장으로 지정된 직원을 찾을 수 없습니다.'}), 404
         
+        old_parent_id = department.parent_id
+        
         # 필드 업데이트
         updatable_fields = ['name', 'code', 'description', 'parent_id', 'manager_id', 'is_active']
         
@@ -196,6 +223,10 @@ def update_department(department_id):
         
         department.updated_at = datetime.utcnow()
         
+        # 상위 부서 변경 시 하위 트리 전체 이동
+        if 'parent_id' in data and (data['parent_id'] or None) != old_parent_id:
+            move_department_subtree(department.id, data['parent_id'] or None)
+        
         # 감사 로그
         AuditLog.log_action(
             user_id=current_user_id,
@@ -210,6 +241,8 @@ def update_department(department_id):
         )
         
         db.session.commit()
+        invalidate_dashboard_overview()
+        invalidate_auth_cache()
         
         return jsonify({
             'message': '부서 정보가 성공적으로 수정되었습니다.',
@@ -264,8 +297,11 @@ def delete_department(department_id):
         )
         
         # 부서 삭제
+        delete_department_node(department.id)
         db.session.delete(department)
         db.session.commit()
+        invalidate_dashboard_overview()
+        invalidate_auth_cache()
         
         return jsonify({
             'message': f'부서 {department_name}이 성공적으로 삭제되었습니다.'
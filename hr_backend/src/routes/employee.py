@@ -4,7 +4,10 @@ from src.models.user import db, User
 from src.models.employee import Employee
 from src.models.department import Department
 from src.models.audit_log import AuditLog
-from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin
+from src.utils.jwt_helper import jwt_required, get_current_user_id, get_current_user_role, require_admin, invalidate_auth_cache
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.pagination import flag_arg
+from src.utils.department_tree import subtree_filter
 
 employee_bp = Blueprint('employee', __name__)
 
@@ -37,7 +40,10 @@ def get_employees():
                 )
             
             if department_id:
-                query = query.filter(Employee.department_id == department_id)
+                if flag_arg(request.args.get('include_subdepartments')):
+                    query = query.filter(subtree_filter(Employee.department_id, department_id))
+                else:
+                    query = query.filter(Employee.department_id == department_id)
             
             if status:
                 query = query.filter(Employee.status == status)
@@ -169,6 +175,7 @@ def create_employee():
         )
         
         db.session.commit()
+        invalidate_dashboard_overview()
         
         return jsonify({
             'message': '직원이 성공적으로 등록되었습니다.',
@@ -236,6 +243,8 @@ def update_employee(employee_id):
         )
         
         db.session.commit()
+        invalidate_dashboard_overview()
+        invalidate_auth_cache(employee.user_id)
         
         return jsonify({
             'message': '직원 정보가 성공적으로 수정되었습니다.',
@@ -266,6 +275,7 @@ def delete_employee(employee_id):
         old_values = employee.to_dict()
         employee_name = employee.name
         employee_number = employee.employee_number
+        employee_user_id = employee.user_id
         
         # 관련 사용자 계정도 함께 삭제
         user = User.query.get(employee.user_id)
@@ -288,6 +298,8 @@ def delete_employee(employee_id):
             db.session.delete(user)
         
         db.session.commit()
+        invalidate_dashboard_overview()
+        invalidate_auth_cache(employee_user_id)
         
         return jsonify({
             'message': f'직원 {employee_name}이 성공적으로 삭제되었습니다.'
@@ -9,6 +9,7 @@ from ..models.evaluation_simple import Evaluation, EvaluationResult, EvaluationS
 from ..models.audit_log import AuditLog
 from ..utils.auth import token_required, admin_required
 from ..utils.audit import log_action
+from ..utils.dashboard_overview import invalidate_dashboard_overview
 
 evaluation_bp = Blueprint('evaluation', __name__)
 
@@ -97,6 +98,7 @@ def create_evaluation(current_user):
         
         db.session.add(evaluation)
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(current_user.id, 'CREATE', 'evaluation', evaluation.id, 
@@ -151,6 +153,7 @@ def update_evaluation(current_user, evaluation_id):
         
         evaluation.updated_at = datetime.utcnow()
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(current_user.id, 'UPDATE', 'evaluation', evaluation.id, 
@@ -178,6 +181,7 @@ def delete_evaluation(current_user, evaluation_id):
         
         db.session.delete(evaluation)
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(current_user.id, 'DELETE', 'evaluation', evaluation_id, 
@@ -0,0 +1,155 @@
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+from src.models.user import db
+from src.models.holiday import Holiday
+from src.utils.jwt_helper import jwt_required, get_current_user_id, require_admin
+from src.utils.audit import log_action
+from src.utils.period import year_range, in_range
+from src.utils.business_calendar import invalidate_calendar, get_year_calendar
+
+holiday_bp = Blueprint('holiday', __name__)
+
+@holiday_bp.route('/holidays', methods=['GET'])
+@jwt_required
+def get_holidays():
+    """공휴일 목록 및 연간 영업일 수 조회"""
+    try:
+        year = request.args.get('year', datetime.now().year, type=int)
+
+        holidays = Holiday.query.filter(
+            in_range(Holiday.date, *year_range(year))
+        ).order_by(Holiday.date).all()
+
+        return jsonify({
+            'success': True,
+            'year': year,
+            'holidays': [holiday.to_dict() for holiday in holidays],
+            'business_days': get_year_calendar(year).total
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@holiday_bp.route('/holidays', methods=['POST'])
+@jwt_required
+def create_holiday():
+    """공휴일 등록 (관리자 전용)"""
+    try:
+        admin_check = require_admin()
+        if admin_check:
+            return admin_check
+
+        data = request.get_json() or {}
+        for field in ['date', 'name']:
+            if not data.get(field):
+                return jsonify({'success': False, 'error': f'{field} 필드가 필요합니다.'}), 400
+
+        try:
+            holiday_date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+        except ValueError:
+            return jsonify({'success': False, 'error': '날짜 형식이 올바르지 않습니다.'}), 400
+
+        if Holiday.query.filter_by(date=holiday_date).first():
+            return jsonify({'success': False, 'error': '이미 등록된 날짜입니다.'}), 400
+
+        holiday = Holiday(
+            date=holiday_date,
+            name=data['name'],
+            type=data.get('type', 'public'),
+            is_working_day=bool(data.get('is_working_day', False))
+        )
+        db.session.add(holiday)
+        db.session.commit()
+        invalidate_calendar(holiday_date.year)
+
+        log_action(
+            user_id=get_current_user_id(),
+            action_type='CREATE',
+            entity_type='holiday',
+            entity_id=holiday.id,
+            message=f'공휴일 등록: {holiday.date} {holiday.name}'
+        )
+
+        return jsonify({'success': True, 'holiday': holiday.to_dict()}), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@holiday_bp.route('/holidays/<int:holiday_id>', methods=['PUT'])
+@jwt_required
+def update_holiday(holiday_id):
+    """공휴일 수정 (관리자 전용)"""
+    try:
+        admin_check = require_admin()
+        if admin_check:
+            return admin_check
+
+        holiday = Holiday.query.get(holiday_id)
+        if not holiday:
+            return jsonify({'success': False, 'error': '공휴일을 찾을 수 없습니다.'}), 404
+
+        data = request.get_json() or {}
+        old_year = holiday.date.year
+
+        if 'date' in data:
+            try:
+                holiday.date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+            except ValueError:
+                return jsonify({'success': False, 'error': '날짜 형식이 올바르지 않습니다.'}), 400
+        for field in ['name', 'type']:
+            if field in data:
+                setattr(holiday, field, data[field])
+        if 'is_working_day' in data:
+            holiday.is_working_day = bool(data['is_working_day'])
+
+        db.session.commit()
+        invalidate_calendar(old_year)
+        invalidate_calendar(holiday.date.year)
+
+        log_action(
+            user_id=get_current_user_id(),
+            action_type='UPDATE',
+            entity_type='holiday',
+            entity_id=holiday.id,
+            message=f'공휴일 수정: {holiday.date} {holiday.name}'
+        )
+
+        return jsonify({'success': True, 'holiday': holiday.to_dict()})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@holiday_bp.route('/holidays/<int:holiday_id>', methods=['DELETE'])
+@jwt_required
+def delete_holiday(holiday_id):
+    """공휴일 삭제 (관리자 전용)"""
+    try:
+        admin_check = require_admin()
+        if admin_check:
+            return admin_check
+
+        holiday = Holiday.query.get(holiday_id)
+        if not holiday:
+            return jsonify({'success': False, 'error': '공휴일을 찾을 수 없습니다.'}), 404
+
+        holiday_date = holiday.date
+        holiday_name = holiday.name
+        db.session.delete(holiday)
+        db.session.commit()
+        invalidate_calendar(holiday_date.year)
+
+        log_action(
+            user_id=get_current_user_id(),
+            action_type='DELETE',
+            entity_type='holiday',
+            entity_id=holiday_id,
+            message=f'공휴일 삭제: {holiday_date} {holiday_name}'
+        )
+
+        return jsonify({'success': True, 'message': '공휴일이 삭제되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
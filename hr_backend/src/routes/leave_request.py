@@ -9,6 +9,8 @@ from src.models.annual_leave_grant import AnnualLeaveGrant
 from src.models.employee import Employee
 from src.utils.auth import admin_required
 from src.utils.audit import log_action
+from src.utils.leave_ledger import record_usage, get_leave_balance
+from src.utils.leave_index import leave_index
 
 leave_request_bp = Blueprint('leave_request', __name__)
 
@@ -143,6 +145,12 @@ def create_leave_request():
         
         # 휴가 일수 계산
         leave_request.calculate_days()
+        if leave_request.days_requested <= 0:
+            return jsonify({'error': '선택한 기간에 근무일이 없습니다.'}), 400
+        
+        # 중복 신청 확인 (대기/승인 휴가 구간 인덱스 + DB 재확인)
+        if leave_index.find_overlap_for_write(employee_id, start_date, end_date):
+            return jsonify({'error': '해당 기간에 이미 신청된 휴가가 있습니다.'}), 400
         
         # 연차인 경우 잔여일수 확인
         if data['type'] == '연차':
@@ -155,21 +163,15 @@ def create_leave_request():
             if not grant:
                 return jsonify({'error': f'{year}년도 연차가 부여되지 않았습니다.'}), 400
             
-            # 사용한 연차 조회
-            from sqlalchemy import func
-            used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-                AnnualLeaveUsage.employee_id == employee_id,
-                func.extract('year', AnnualLeaveUsage.usage_date) == year
-            )
-            total_used = used_query.scalar() or 0
-            
-            # 잔여 연차 확인
-            remaining = grant.total_days - total_used
+            # 잔여 연차 확인 (연차 원장의 부여 - 사용)
+            balance = get_leave_balance(employee_id, year)
+            remaining = balance['granted_days'] - balance['used_days']
             if leave_request.days_requested > remaining:
                 return jsonify({'error': f'연차 잔여일수가 부족합니다. (잔여: {remaining}일, 신청: {leave_request.days_requested}일)'}), 400
         
         db.session.add(leave_request)
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그 기록
         log_action(
@@ -268,6 +270,13 @@ def update_leave_request(request_id):
         
         # 휴가 일수 재계산
         leave_request.calculate_days()
+        if leave_request.days_requested <= 0:
+            return jsonify({'error': '선택한 기간에 근무일이 없습니다.'}), 400
+        
+        # 중복 신청 확인 (수정 중인 신청 자신은 제외)
+        if leave_index.find_overlap_for_write(leave_request.employee_id, leave_request.start_date,
+                                              leave_request.end_date, exclude=('leave', leave_request.id)):
+            return jsonify({'error': '해당 기간에 이미 신청된 휴가가 있습니다.'}), 400
         
         # 연차인 경우 잔여일수 재확인
         if leave_request.type == '연차':
@@ -278,18 +287,13 @@ def update_leave_request(request_id):
             ).first()
             
             if grant:
-                from sqlalchemy import func
-                used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-                    AnnualLeaveUsage.employee_id == leave_request.employee_id,
-                    func.extract('year', AnnualLeaveUsage.usage_date) == year
-                )
-                total_used = used_query.scalar() or 0
-                
-                remaining = grant.total_days - total_used
+                balance = get_leave_balance(leave_request.employee_id, year)
+                remaining = balance['granted_days'] - balance['used_days']
                 if leave_request.days_requested > remaining:
                     return jsonify({'error': f'연차 잔여일수가 부족합니다. (잔여: {remaining}일, 신청: {leave_request.days_requested}일)'}), 400
         
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그 기록
         log_action(
@@ -340,9 +344,11 @@ def approve_leave_request(request_id):
                 created_by=current_user_id
             )
             db.session.add(usage)
+            record_usage(usage)
             leave_request.annual_leave_usage = usage
         
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그 기록
         log_action(
@@ -384,6 +390,7 @@ def reject_leave_request(request_id):
         leave_request.reject(current_user_id, data['reason'])
         
         db.session.commit()
+        leave_index.sync(leave_request)
         
         # 감사 로그 기록
         log_action(
@@ -426,16 +433,19 @@ def delete_leave_request(request_id):
             if leave_request.status == '승인':
                 return jsonify({'error': '승인된 신청은 삭제할 수 없습니다.'}), 400
         
+        employee_id = leave_request.employee_id
         employee_name = leave_request.employee.name
         leave_type = leave_request.type
         days_requested = leave_request.days_requested
         
         # 연관된 연차 사용 기록도 삭제
         if leave_request.annual_leave_usage:
+            record_usage(leave_request.annual_leave_usage, sign=-1)
             db.session.delete(leave_request.annual_leave_usage)
         
         db.session.delete(leave_request)
         db.session.commit()
+        leave_index.discard(employee_id, 'leave', request_id)
         
         # 감사 로그 기록
         log_action(
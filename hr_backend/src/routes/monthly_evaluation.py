@@ -8,14 +8,17 @@
 
 from flask import Blueprint, request, jsonify
 from src.models.user import db
-import sqlite3
+from src.utils.db_connection import get_db_connection
 from datetime import datetime, date
 import json
 import calendar
+from src.utils.business_calendar import (
+    working_months as calculate_working_months,
+    working_months_in_year as calculate_working_months_in_year
+)
 
 monthly_evaluation_bp = Blueprint('monthly_evaluation', __name__)
 
-DB_PATH = 'src/database/app.db'
 
 @monthly_evaluation_bp.route('/api/monthly-evaluations', methods=['GET'])
 def get_monthly_evaluations():
@@ -25,7 +28,7 @@ def get_monthly_evaluations():
         month = request.args.get('month', type=int)
         employee_id = request.args.get('employee_id')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 기본 쿼리
@@ -90,7 +93,6 @@ def get_monthly_evaluations():
             }
             evaluations.append(evaluation)
         
-        conn.close()
         return jsonify({
             'success': True,
             'data': evaluations,
@@ -106,7 +108,7 @@ def create_monthly_evaluation():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 평가 제외 여부 확인
@@ -136,7 +138,6 @@ def create_monthly_evaluation():
         ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'message': '월별 평가가 생성되었습니다.'})
         
@@ -149,7 +150,7 @@ def update_monthly_evaluation(evaluation_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -165,7 +166,6 @@ def update_monthly_evaluation(evaluation_id):
         ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'message': '월별 평가가 수정되었습니다.'})
         
@@ -176,7 +176,7 @@ def update_monthly_evaluation(evaluation_id):
 def get_annual_evaluation_summary(employee_id, year):
     """직원별 연도별 평가 요약"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 직원 정보 조회
@@ -223,8 +223,6 @@ def get_annual_evaluation_summary(employee_id, year):
         else:
             avg_company = avg_team = avg_individual = avg_total = 0
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'data': {
@@ -269,7 +267,7 @@ def create_evaluation_exclusion():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -283,50 +281,8 @@ def create_evaluation_exclusion():
         ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'message': '평가 제외가 등록되었습니다.'})
         
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-
-def calculate_working_months(hire_date, year, month):
-    """신규입사자 근무개월 수 계산 - 수정된 로직"""
-    if not hire_date:
-        return 12
-    
-    # 입사일이 해당 연도 이후라면
-    if hire_date.year > year:
-        return 0
-    
-    # 입사일이 해당 연도 이전이라면 (기존 직원)
-    if hire_date.year < year:
-        return month  # 해당 월까지의 개월 수
-    
-    # 입사일이 해당 연도라면 (신규입사자)
-    if hire_date.year == year:
-        if hire_date.month > month:
-            return 0  # 아직 입사하지 않음
-        return month - hire_date.month + 1  # 입사월부터 해당월까지
-    
-    return month
-
-def calculate_working_months_in_year(hire_date, year):
-    """연도별 총 근무개월 수 계산 - 수정된 로직"""
-    if not hire_date:
-        return 12
-    
-    # 입사일이 해당 연도 이후라면
-    if hire_date.year > year:
-        return 0
-    
-    # 입사일이 해당 연도 이전이라면 (기존 직원)
-    if hire_date.year < year:
-        return 12  # 전체 12개월 근무
-    
-    # 입사일이 해당 연도라면 (신규입사자)
-    if hire_date.year == year:
-        return 12 - hire_date.month + 1  # 입사월부터 12월까지
-    
-    return 12
-
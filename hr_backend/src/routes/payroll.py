@@ -8,9 +8,32 @@ from src.models.payroll import Payroll
 from src.models.employee import Employee
 from src.utils.jwt_helper import jwt_required, admin_required, get_current_user_id
 from src.utils.audit import log_action
+from src.utils.dashboard_overview import invalidate_dashboard_overview
+from src.utils.bulk_write import bulk_insert
+from src.utils.payroll_batch import start_payroll_batch, get_job
 
 payroll_bp = Blueprint('payroll', __name__)
 
+# 금액 항목 (Decimal 변환 대상)
+AMOUNT_FIELDS = Payroll.PAYMENT_FIELDS[1:] + Payroll.DEDUCTION_FIELDS + (
+    'overtime_hours', 'night_hours', 'holiday_hours'
+)
+
+def build_payroll_values(data, created_by):
+    """요청 데이터로 급여명세서 컬럼 값 구성"""
+    values = {
+        'employee_id': data['employee_id'],
+        'year': data['year'],
+        'month': data['month'],
+        'base_salary': Decimal(str(data['base_salary'])),
+        'work_days': data.get('work_days', 0),
+        'memo': data.get('memo'),
+        'created_by': created_by
+    }
+    for field in AMOUNT_FIELDS:
+        values[field] = Decimal(str(data.get(field, 0)))
+    return values
+
 @payroll_bp.route('/payrolls', methods=['GET'])
 @jwt_required
 @admin_required
@@ -98,39 +121,14 @@ def create_payroll():
             return jsonify({'error': '해당 직원의 해당 년월 급여명세서가 이미 존재합니다.'}), 400
         
         # 급여명세서 생성
-        payroll = Payroll(
-            employee_id=data['employee_id'],
-            year=data['year'],
-            month=data['month'],
-            base_salary=Decimal(str(data['base_salary'])),
-            position_allowance=Decimal(str(data.get('position_allowance', 0))),
-            meal_allowance=Decimal(str(data.get('meal_allowance', 0))),
-            transport_allowance=Decimal(str(data.get('transport_allowance', 0))),
-            overtime_pay=Decimal(str(data.get('overtime_pay', 0))),
-            night_pay=Decimal(str(data.get('night_pay', 0))),
-            holiday_pay=Decimal(str(data.get('holiday_pay', 0))),
-            bonus=Decimal(str(data.get('bonus', 0))),
-            other_allowances=Decimal(str(data.get('other_allowances', 0))),
-            income_tax=Decimal(str(data.get('income_tax', 0))),
-            resident_tax=Decimal(str(data.get('resident_tax', 0))),
-            national_pension=Decimal(str(data.get('national_pension', 0))),
-            health_insurance=Decimal(str(data.get('health_insurance', 0))),
-            employment_insurance=Decimal(str(data.get('employment_insurance', 0))),
-            long_term_care=Decimal(str(data.get('long_term_care', 0))),
-            other_deductions=Decimal(str(data.get('other_deductions', 0))),
-            work_days=data.get('work_days', 0),
-            overtime_hours=Decimal(str(data.get('overtime_hours', 0))),
-            night_hours=Decimal(str(data.get('night_hours', 0))),
-            holiday_hours=Decimal(str(data.get('holiday_hours', 0))),
-            memo=data.get('memo'),
-            created_by=get_current_user_id()
-        )
+        payroll = Payroll(**build_payroll_values(data, get_current_user_id()))
         
         # 총액 계산
         payroll.calculate_totals()
         
         db.session.add(payroll)
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(
@@ -151,6 +149,145 @@ def create_payroll():
         current_app.logger.error(f"급여명세서 생성 오류: {str(e)}")
         return jsonify({'error': '급여명세서 생성 중 오류가 발생했습니다.'}), 500
 
+@payroll_bp.route('/payrolls/bulk', methods=['POST'])
+@jwt_required
+@admin_required
+def create_payrolls_bulk():
+    """급여명세서 일괄 생성 (월말 대량 생성용)"""
+    try:
+        data = request.get_json() or {}
+        items = data.get('payrolls')
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'payrolls 목록이 필요합니다.'}), 400
+        
+        current_user_id = get_current_user_id()
+        required_fields = ['employee_id', 'year', 'month', 'base_salary']
+        
+        # 항목별 형식 검증 및 직원 ID/연/월 정수 변환
+        candidates = []
+        errors = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({'index': index, 'error': '잘못된 항목 형식입니다.'})
+                continue
+            
+            missing = [field for field in required_fields if field not in item]
+            if missing:
+                errors.append({'index': index, 'error': f'{missing[0]}는 필수 항목입니다.'})
+                continue
+            
+            invalid = None
+            key = []
+            for field in ('employee_id', 'year', 'month'):
+                try:
+                    key.append(int(item[field]))
+                except (TypeError, ValueError):
+                    invalid = field
+                    break
+            if invalid:
+                errors.append({'index': index, 'error': f'{invalid} 값이 올바르지 않습니다: {item[invalid]!r}'})
+                continue
+            if not 1 <= key[2] <= 12:
+                errors.append({'index': index, 'error': f'month 값이 올바르지 않습니다: {item["month"]!r}'})
+                continue
+            
+            candidates.append((index, item, tuple(key)))
+        
+        # 직원 존재 여부 및 기존 명세서 일괄 조회
+        employee_ids = {key[0] for _, _, key in candidates}
+        existing_employees = {
+            row.id for row in db.session.query(Employee.id).filter(Employee.id.in_(list(employee_ids)))
+        }
+        existing_keys = set(
+            db.session.query(Payroll.employee_id, Payroll.year, Payroll.month).filter(
+                Payroll.employee_id.in_(list(employee_ids)),
+                Payroll.year.in_(list({key[1] for _, _, key in candidates})),
+                Payroll.month.in_(list({key[2] for _, _, key in candidates}))
+            ).all()
+        )
+        
+        rows = []
+        for index, item, key in candidates:
+            if key[0] not in existing_employees:
+                errors.append({'index': index, 'error': '존재하지 않는 직원입니다.'})
+                continue
+            
+            if key in existing_keys:
+                errors.append({'index': index, 'error': '해당 직원의 해당 년월 급여명세서가 이미 존재합니다.'})
+                continue
+            
+            item = dict(item, employee_id=key[0], year=key[1], month=key[2])
+            try:
+                values = build_payroll_values(item, current_user_id)
+            except (ArithmeticError, ValueError):
+                errors.append({'index': index, 'error': '금액 형식이 올바르지 않습니다.'})
+                continue
+            
+            values['total_payment'], values['total_deductions'], values['net_pay'] = Payroll.compute_totals(values)
+            rows.append(values)
+            existing_keys.add(key)
+        errors.sort(key=lambda error: error['index'])
+        
+        created = bulk_insert(Payroll, rows)
+        db.session.commit()
+        
+        if created:
+            invalidate_dashboard_overview()
+            
+            # 감사 로그 (요약 1건)
+            log_action(
+                user_id=current_user_id,
+                action_type='CREATE',
+                entity_type='payroll',
+                entity_id=None,
+                message=f"급여명세서 일괄 생성: {created}건 (실패 {len(errors)}건)"
+            )
+        
+        return jsonify({
+            'message': f'급여명세서 {created}건이 생성되었습니다.',
+            'created': created,
+            'failed': len(errors),
+            'errors': errors
+        }), 201 if created else 400
+        
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"급여명세서 일괄 생성 오류: {str(e)}")
+        return jsonify({'error': '급여명세서 일괄 생성 중 오류가 발생했습니다.'}), 500
+
+@payroll_bp.route('/payrolls/batch/<int:year>/<int:month>', methods=['POST'])
+@jwt_required
+@admin_required
+def start_payroll_batch_job(year, month):
+    """월말 급여 일괄 생성 배치 시작"""
+    try:
+        if not 1 <= month <= 12:
+            return jsonify({'error': '월은 1~12 사이여야 합니다.'}), 400
+        
+        job, created = start_payroll_batch(
+            current_app._get_current_object(), year, month, get_current_user_id()
+        )
+        
+        return jsonify({
+            'message': '급여 일괄 생성 작업이 시작되었습니다.' if created else '이미 진행 중인 작업이 있습니다.',
+            'job': job
+        }), 202
+        
+    except Exception as e:
+        current_app.logger.error(f"급여 일괄 생성 시작 오류: {str(e)}")
+        return jsonify({'error': '급여 일괄 생성 작업 시작 중 오류가 발생했습니다.'}), 500
+
+@payroll_bp.route('/payrolls/batch/jobs/<job_id>', methods=['GET'])
+@jwt_required
+@admin_required
+def get_payroll_batch_job(job_id):
+    """급여 일괄 생성 작업 상태 조회"""
+    job = get_job(job_id)
+    if not job:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify({'job': job})
+
 @payroll_bp.route('/payrolls/<int:payroll_id>', methods=['GET'])
 @jwt_required
 @admin_required
@@ -196,6 +333,7 @@ def update_payroll(payroll_id):
         payroll.updated_at = datetime.utcnow()
         
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(
@@ -228,6 +366,7 @@ def delete_payroll(payroll_id):
         
         db.session.delete(payroll)
         db.session.commit()
+        invalidate_dashboard_overview()
         
         # 감사 로그
         log_action(
@@ -3,13 +3,12 @@
 성과 기준 관리 API 라우트
 """
 from flask import Blueprint, request, jsonify
-import sqlite3
+from src.utils.db_connection import get_db_connection
 from datetime import datetime
 import json
 
 performance_targets_bp = Blueprint('performance_targets', __name__)
 
-DB_PATH = 'src/database/app.db'
 
 # ==================== 성과 지표 카테고리 관리 ====================
 
@@ -17,7 +16,7 @@ DB_PATH = 'src/database/app.db'
 def get_target_categories():
     """성과 지표 카테고리 목록 조회"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -39,7 +38,6 @@ def get_target_categories():
                 'created_at': row[6]
             })
         
-        conn.close()
         return jsonify({'success': True, 'data': categories})
         
     except Exception as e:
@@ -51,7 +49,7 @@ def create_target_category():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -61,7 +59,6 @@ def create_target_category():
         
         category_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'data': {'id': category_id}})
         
@@ -74,7 +71,7 @@ def update_target_category(category_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -84,7 +81,6 @@ def update_target_category(category_id):
         ''', (data['name'], data.get('description'), data.get('unit'), data['target_type'], category_id))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -95,7 +91,7 @@ def update_target_category(category_id):
 def delete_target_category(category_id):
     """성과 지표 카테고리 삭제 (비활성화)"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -105,7 +101,6 @@ def delete_target_category(category_id):
         ''', (category_id,))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -120,7 +115,7 @@ def get_company_targets():
     try:
         year = request.args.get('year', datetime.now().year)
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -147,7 +142,6 @@ def get_company_targets():
                 'is_active': bool(row[9])
             })
         
-        conn.close()
         return jsonify({'success': True, 'data': targets})
         
     except Exception as e:
@@ -159,7 +153,7 @@ def create_company_target():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -170,7 +164,6 @@ def create_company_target():
         
         target_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'data': {'id': target_id}})
         
@@ -183,7 +176,7 @@ def update_company_target(target_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -196,7 +189,6 @@ def update_company_target(target_id):
               data.get('weight', 100.0), target_id))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -207,7 +199,7 @@ def update_company_target(target_id):
 def delete_company_target(target_id):
     """회사 성과 목표 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -217,7 +209,6 @@ def delete_company_target(target_id):
         ''', (target_id,))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -233,7 +224,7 @@ def get_department_targets():
         year = request.args.get('year', datetime.now().year)
         department_id = request.args.get('department_id')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         query = '''
@@ -272,7 +263,6 @@ def get_department_targets():
                 'is_active': bool(row[11])
             })
         
-        conn.close()
         return jsonify({'success': True, 'data': targets})
         
     except Exception as e:
@@ -284,7 +274,7 @@ def create_department_target():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -297,7 +287,6 @@ def create_department_target():
         
         target_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'data': {'id': target_id}})
         
@@ -310,7 +299,7 @@ def update_department_target(target_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -323,7 +312,6 @@ def update_department_target(target_id):
               data.get('description'), data.get('weight', 100.0), target_id))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -334,7 +322,7 @@ def update_department_target(target_id):
 def delete_department_target(target_id):
     """부서별 성과 목표 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -344,7 +332,6 @@ def delete_department_target(target_id):
         ''', (target_id,))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -360,7 +347,7 @@ def get_employee_targets():
         year = request.args.get('year', datetime.now().year)
         employee_id = request.args.get('employee_id')
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         query = '''
@@ -399,7 +386,6 @@ def get_employee_targets():
                 'is_active': bool(row[11])
             })
         
-        conn.close()
         return jsonify({'success': True, 'data': targets})
         
     except Exception as e:
@@ -411,7 +397,7 @@ def create_employee_target():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -424,7 +410,6 @@ def create_employee_target():
         
         target_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'data': {'id': target_id}})
         
@@ -437,7 +422,7 @@ def update_employee_target(target_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -450,7 +435,6 @@ def update_employee_target(target_id):
               data.get('description'), data.get('weight', 100.0), target_id))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -461,7 +445,7 @@ def update_employee_target(target_id):
 def delete_employee_target(target_id):
     """개인별 성과 목표 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -471,7 +455,6 @@ def delete_employee_target(target_id):
         ''', (target_id,))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -488,7 +471,7 @@ def get_target_achievements():
         month = request.args.get('month')
         target_type = request.args.get('target_type')  # company, department, employee
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         query = '''
@@ -525,7 +508,6 @@ def get_target_achievements():
                 'recorded_at': row[8]
             })
         
-        conn.close()
         return jsonify({'success': True, 'data': achievements})
         
     except Exception as e:
@@ -537,7 +519,7 @@ def create_target_achievement():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 달성률 자동 계산
@@ -555,7 +537,6 @@ def create_target_achievement():
         
         achievement_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'data': {'id': achievement_id}})
         
@@ -568,7 +549,7 @@ def update_target_achievement(achievement_id):
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 달성률 자동 계산
@@ -586,7 +567,6 @@ def update_target_achievement(achievement_id):
               achievement_rate, data.get('notes'), achievement_id))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -597,7 +577,7 @@ def update_target_achievement(achievement_id):
 def delete_target_achievement(achievement_id):
     """실적 입력 삭제"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -606,7 +586,6 @@ def delete_target_achievement(achievement_id):
         ''', (achievement_id,))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
@@ -621,7 +600,7 @@ def update_target_weights(target_type, year):
     try:
         data = request.get_json()  # [{'id': 1, 'weight': 40.0}, ...]
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         if target_type == 'company':
@@ -641,7 +620,6 @@ def update_target_weights(target_type, year):
             ''', (item['weight'], item['id'], year))
         
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True})
         
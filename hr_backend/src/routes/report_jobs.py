@@ -0,0 +1,99 @@
+from flask import Blueprint, request, jsonify, current_app, send_file
+from datetime import datetime
+import os
+
+from src.utils.jwt_helper import jwt_required, admin_required, get_current_user_id, get_current_user_role
+from src.utils.report_jobs import report_job_queue, ReportQueueFullError, MIMETYPES, public_job
+
+report_jobs_bp = Blueprint('report_jobs', __name__)
+
+REPORT_TYPES = ('summary', 'attendance', 'payroll', 'evaluation')
+REPORT_FORMATS = ('pdf', 'csv')
+PAYSLIP_FORMATS = ('pdf', 'zip')  # 단일 PDF, 직원별 PDF ZIP
+
+def _get_accessible_job(job_id):
+    """작업 조회 (본인 또는 관리자만)"""
+    job = report_job_queue.get(job_id)
+    if not job:
+        return None, (jsonify({'error': '작업을 찾을 수 없거나 보관 기간이 만료되었습니다.'}), 404)
+
+    if get_current_user_role() != 'admin' and job['created_by'] != get_current_user_id():
+        return None, (jsonify({'error': '해당 작업에 접근할 권한이 없습니다.'}), 403)
+
+    return job, None
+
+@report_jobs_bp.route('/reports/jobs', methods=['POST'])
+@jwt_required
+@admin_required
+def submit_report_job():
+    """리포트 생성 작업 등록 (관리자 전용, 모든 리포트가 전사 데이터 대상)"""
+    try:
+        data = request.get_json() or {}
+        report_type = data.get('report_type', 'summary')
+        format_type = data.get('format', 'pdf')
+        year = data.get('year', datetime.now().year)
+        month = data.get('month') or None
+
+        if report_type not in REPORT_TYPES and report_type != 'payslips':
+            return jsonify({'error': '지원하지 않는 리포트 타입입니다.'}), 400
+        if not isinstance(year, int) or (month is not None and (not isinstance(month, int) or not 1 <= month <= 12)):
+            return jsonify({'error': '연도/월 값이 올바르지 않습니다.'}), 400
+
+        if report_type == 'payslips':
+            # 급여명세서 일괄 생성
+            if format_type not in PAYSLIP_FORMATS:
+                return jsonify({'error': '지원하지 않는 파일 형식입니다.'}), 400
+            if month is None:
+                return jsonify({'error': '급여명세서 일괄 생성은 월을 지정해야 합니다.'}), 400
+            kind = 'payslips'
+            params = {'format': format_type, 'year': year, 'month': month}
+        else:
+            if format_type not in REPORT_FORMATS:
+                return jsonify({'error': '지원하지 않는 파일 형식입니다.'}), 400
+            kind = 'report'
+            params = {'report_type': report_type, 'format': format_type, 'year': year, 'month': month}
+
+        job = report_job_queue.submit(current_app._get_current_object(), kind, params, get_current_user_id())
+
+        return jsonify({
+            'message': '리포트 생성 작업이 등록되었습니다.',
+            'job': public_job(job)
+        }), 202
+
+    except ReportQueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        return jsonify({'error': f'리포트 작업 등록에 실패했습니다: {str(e)}'}), 500
+
+@report_jobs_bp.route('/reports/jobs/<job_id>', methods=['GET'])
+@jwt_required
+def get_report_job(job_id):
+    """리포트 작업 상태 조회"""
+    job, error = _get_accessible_job(job_id)
+    if error:
+        return error
+
+    return jsonify({'job': public_job(job)})
+
+@report_jobs_bp.route('/reports/jobs/<job_id>/download', methods=['GET'])
+@jwt_required
+def download_report_job(job_id):
+    """완료된 리포트 다운로드"""
+    job, error = _get_accessible_job(job_id)
+    if error:
+        return error
+
+    if job['status'] != 'completed':
+        return jsonify({'error': '리포트가 아직 생성되지 않았습니다.', 'status': job['status']}), 409
+
+    path = report_job_queue.artifact_path(job_id)
+    if not os.path.exists(path):
+        return jsonify({'error': '리포트 파일이 만료되었습니다.'}), 404
+
+    extension = job['filename'].rsplit('.', 1)[-1]
+    return send_file(
+        path,
+        mimetype=MIMETYPES.get(extension, 'application/octet-stream'),
+        as_attachment=True,
+        download_name=job['filename']
+    )
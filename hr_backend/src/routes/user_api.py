@@ -6,7 +6,12 @@
 from flask import Blueprint, request, jsonify
 from src.utils.jwt_helper import jwt_required, user_required, get_current_employee, get_current_user_id
 from src.utils.audit import log_action
-import sqlite3
+from src.utils.db_connection import get_db_connection
+from src.utils.period import year_range, sql_range_params
+from src.utils.leave_ledger import get_leave_balance, adjust_leave_balance
+from src.utils.leave_index import leave_index, LeaveInterval
+from src.utils.business_calendar import business_days_between
+from src.utils.attendance_summary import employee_attendance_stats
 from datetime import datetime, date
 
 user_api_bp = Blueprint('user_api', __name__)
@@ -45,8 +50,7 @@ def get_my_attendance():
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 20))
         
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 기본 쿼리
@@ -94,8 +98,6 @@ def get_my_attendance():
         cursor.execute(count_query, count_params)
         total = cursor.fetchone()['total']
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'records': records,
@@ -122,8 +124,7 @@ def get_my_annual_leave():
         
         year = int(request.args.get('year', datetime.now().year))
         
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # 연차 부여 정보
@@ -136,24 +137,23 @@ def get_my_annual_leave():
         # 연차 사용 내역
         cursor.execute('''
             SELECT * FROM annual_leave_usages 
-            WHERE employee_id = ? AND strftime('%Y', start_date) = ?
-            ORDER BY start_date DESC
-        ''', (employee['id'], str(year)))
+            WHERE employee_id = ? AND usage_date >= ? AND usage_date < ?
+            ORDER BY usage_date DESC
+        ''', (employee['id'], *sql_range_params(*year_range(year))))
         usages = [dict(row) for row in cursor.fetchall()]
         
         # 연차 신청 내역
         cursor.execute('''
             SELECT * FROM annual_leave_requests 
-            WHERE employee_id = ? AND strftime('%Y', start_date) = ?
+            WHERE employee_id = ? AND start_date >= ? AND start_date < ?
             ORDER BY created_at DESC
-        ''', (employee['id'], str(year)))
+        ''', (employee['id'], *sql_range_params(*year_range(year))))
         requests = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
-        
-        # 연차 잔여일수 계산
-        total_granted = sum(grant['days_granted'] for grant in grants)
-        total_used = sum(usage['used_days'] for usage in usages)
+        # 연차 잔여일수 (연차 원장)
+        balance = get_leave_balance(employee['id'], year, cursor=cursor)
+        total_granted = balance['granted_days']
+        total_used = balance['used_days']
         remaining_days = total_granted - total_used
         
         return jsonify({
@@ -200,7 +200,7 @@ def create_annual_leave_request():
         # 사용일수 계산
         leave_type = data['leave_type']
         if leave_type == 'full':
-            days_requested = (end_date - start_date).days + 1
+            days_requested = business_days_between(start_date, end_date)
         elif leave_type == 'half':
             days_requested = 0.5
         elif leave_type == 'quarter':
@@ -208,48 +208,31 @@ def create_annual_leave_request():
         else:
             return jsonify({'error': '올바르지 않은 휴가 유형입니다.'}), 400
         
-        # 연차 잔여일수 확인
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        if days_requested <= 0:
+            return jsonify({'error': '선택한 기간에 근무일이 없습니다.'}), 400
+        
+        conn = get_db_connection()
         cursor = conn.cursor()
         
-        year = start_date.year
+        # 중복 신청 확인 (대기/승인 휴가 구간 인덱스 + INSERT와 같은 연결에서 DB 재확인)
+        if leave_index.find_overlap_for_write(employee['id'], start_date, end_date, cursor=cursor):
+            return jsonify({'error': '해당 기간에 이미 신청된 휴가가 있습니다.'}), 400
         
-        # 부여된 연차
-        cursor.execute('''
-            SELECT COALESCE(SUM(days_granted), 0) as total_granted
-            FROM annual_leave_grants 
-            WHERE employee_id = ? AND year = ?
-        ''', (employee['id'], year))
-        total_granted = cursor.fetchone()['total_granted']
-        
-        # 사용된 연차 (승인된 것만)
-        cursor.execute('''
-            SELECT COALESCE(SUM(used_days), 0) as total_used
-            FROM annual_leave_usages 
-            WHERE employee_id = ? AND strftime('%Y', start_date) = ?
-        ''', (employee['id'], str(year)))
-        total_used = cursor.fetchone()['total_used']
+        # 연차 잔여일수 확인
         
-        # 대기 중인 신청
-        cursor.execute('''
-            SELECT COALESCE(SUM(days_requested), 0) as pending_requests
-            FROM annual_leave_requests 
-            WHERE employee_id = ? AND strftime('%Y', start_date) = ? AND status = 'pending'
-        ''', (employee['id'], str(year)))
-        pending_requests = cursor.fetchone()['pending_requests']
+        year = start_date.year
         
-        remaining_days = total_granted - total_used - pending_requests
+        # 연차 원장의 부여 - 사용 - 대기 중 신청
+        remaining_days = get_leave_balance(employee['id'], year, cursor=cursor)['remaining_days']
         
         if days_requested > remaining_days:
-            conn.close()
             return jsonify({'error': f'연차가 부족합니다. (잔여: {remaining_days}일, 신청: {days_requested}일)'}), 400
         
         # 연차 신청 생성
         cursor.execute('''
             INSERT INTO annual_leave_requests 
-            (employee_id, start_date, end_date, leave_type, days_requested, reason, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, 'pending', ?)
+            (employee_id, start_date, end_date, leave_type, total_days, reason, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?)
         ''', (
             employee['id'],
             data['start_date'],
@@ -257,17 +240,23 @@ def create_annual_leave_request():
             leave_type,
             days_requested,
             data['reason'],
+            datetime.now(),
             datetime.now()
         ))
         
         request_id = cursor.lastrowid
+        adjust_leave_balance(employee['id'], year, pending=days_requested, cursor=cursor)
         conn.commit()
-        conn.close()
+        leave_index.add(employee['id'], LeaveInterval(
+            start_date, end_date, 'annual', request_id, leave_type, 'pending', days_requested
+        ))
         
         # 감사 로그
         log_action(
             get_current_user_id(),
-            'annual_leave_request_create',
+            'CREATE',
+            'annual_leave_request',
+            request_id,
             f"연차 신청: {employee['name']} - {data['start_date']} ~ {data['end_date']} ({days_requested}일)"
         )
         
@@ -293,8 +282,7 @@ def get_my_payroll():
         year = request.args.get('year', datetime.now().year)
         month = request.args.get('month')
         
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         query = '''
@@ -314,8 +302,6 @@ def get_my_payroll():
         cursor.execute(query, params)
         payrolls = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'payrolls': payrolls
@@ -334,8 +320,7 @@ def get_my_work_schedule():
         if not employee:
             return jsonify({'error': '직원 정보를 찾을 수 없습니다.'}), 404
         
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -345,8 +330,6 @@ def get_my_work_schedule():
         ''', (employee['id'],))
         schedules = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'schedules': schedules
@@ -368,45 +351,18 @@ def get_my_statistics():
         year = int(request.args.get('year', datetime.now().year))
         month = request.args.get('month')
         
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
+        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # 출근 통계
-        attendance_query = '''
-            SELECT 
-                COUNT(*) as total_days,
-                SUM(CASE WHEN status = 'present' THEN 1 ELSE 0 END) as present_days,
-                SUM(CASE WHEN status = 'late' THEN 1 ELSE 0 END) as late_days,
-                SUM(CASE WHEN status = 'absent' THEN 1 ELSE 0 END) as absent_days
-            FROM attendance_records 
-            WHERE employee_id = ? AND strftime('%Y', date) = ?
-        '''
-        params = [employee['id'], str(year)]
-        
-        if month:
-            attendance_query += " AND strftime('%m', date) = ?"
-            params.append(f"{int(month):02d}")
-        
-        cursor.execute(attendance_query, params)
-        attendance_stats = dict(cursor.fetchone())
-        
-        # 연차 통계
-        cursor.execute('''
-            SELECT 
-                COALESCE(SUM(days_granted), 0) as total_granted
-            FROM annual_leave_grants 
-            WHERE employee_id = ? AND year = ?
-        ''', (employee['id'], year))
-        total_granted = cursor.fetchone()['total_granted']
+        # 출근 통계 (월별 출퇴근 집계)
+        attendance_stats = employee_attendance_stats(
+            employee['id'], year, int(month) if month else None, cursor=cursor
+        )
         
-        cursor.execute('''
-            SELECT 
-                COALESCE(SUM(used_days), 0) as total_used
-            FROM annual_leave_usages 
-            WHERE employee_id = ? AND strftime('%Y', start_date) = ?
-        ''', (employee['id'], str(year)))
-        total_used = cursor.fetchone()['total_used']
+        # 연차 통계 (연차 원장)
+        balance = get_leave_balance(employee['id'], year, cursor=cursor)
+        total_granted = balance['granted_days']
+        total_used = balance['used_days']
         
         # 급여 통계 (최근 3개월)
         cursor.execute('''
@@ -421,8 +377,6 @@ def get_my_statistics():
         ''', (employee['id'], year))
         payroll_stats = dict(cursor.fetchone())
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'statistics': {
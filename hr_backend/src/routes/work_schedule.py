@@ -4,6 +4,7 @@ from src.models.attendance import WorkSchedule
 from src.models.employee import Employee
 from src.utils.jwt_helper import admin_required
 from src.utils.audit import log_action
+from src.utils.schedule_index import schedule_index
 from datetime import datetime, time
 
 work_schedule_bp = Blueprint('work_schedule', __name__)
@@ -105,6 +106,7 @@ def create_work_schedule():
         
         db.session.add(schedule)
         db.session.commit()
+        schedule_index.refresh(schedule.employee_id)
         
         # 감사 로그 기록
         log_action(
@@ -174,6 +176,7 @@ def update_work_schedule(schedule_id):
         
         schedule.updated_at = datetime.utcnow()
         db.session.commit()
+        schedule_index.refresh(schedule.employee_id)
         
         # 감사 로그 기록
         log_action(
@@ -207,11 +210,13 @@ def delete_work_schedule(schedule_id):
                 'error': '존재하지 않는 근무시간 설정입니다.'
             }), 404
         
+        employee_id = schedule.employee_id
         employee_name = schedule.employee.name
         day_name = ['월','화','수','목','금','토','일'][schedule.day_of_week]
         
         db.session.delete(schedule)
         db.session.commit()
+        schedule_index.refresh(employee_id)
         
         # 감사 로그 기록
         log_action(
@@ -291,6 +296,7 @@ def create_bulk_work_schedules():
             created_schedules.append(schedule)
         
         db.session.commit()
+        schedule_index.refresh(employee.id)
         
         # 감사 로그 기록
         log_action(
@@ -0,0 +1,113 @@
+"""
+일일 출퇴근 마감
+- 해당 날짜에 근무 예정이지만 출퇴근 기록이 없는 직원에게 결근(absent)/휴가(on_leave) 기록을 일괄 생성
+- 근무 예정 판단: 재직 중 + 입사일 이후 + 근무일
+  * 근무시간 설정이 있는 직원: 요일 설정(schedule_index) 기준, 단 휴무 공휴일은 제외
+  * 설정이 없는 직원: 영업일 달력(주말/공휴일) 기준
+- 승인된 휴가는 휴가 구간 인덱스(leave_index)에서 조회하여 on_leave로 기록
+- 직원/기존 기록 조회는 날짜당 쿼리 1회씩, 나머지는 메모리 집합 연산 후 bulk INSERT
+- 이미 기록이 있는 직원은 건너뛰므로 같은 날짜를 여러 번 실행해도 안전
+- 월별 출퇴근 집계도 같은 트랜잭션에서 갱신
+- 기본 마감 날짜는 전날 (default_close_date), 당일은 근무 예정자의 가장 늦은 퇴근 예정 시각 이후에만 마감 가능
+  (근무 중 마감하면 결근 기록이 먼저 생겨 이후 출근 기록 등록이 중복으로 거부됨)
+- 운영: 매일 업무 종료 후(또는 다음 날 새벽) cron 등으로 `flask close-attendance` 실행
+"""
+
+import threading
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import or_
+
+from ..database import db
+from ..models.attendance import AttendanceRecord
+from ..models.employee import Employee
+from ..models.holiday import Holiday
+from .bulk_write import bulk_insert
+from .attendance_summary import refresh_attendance_summaries
+from .business_calendar import is_working_day
+from .schedule_index import schedule_index, DEFAULT_WEEK
+from .leave_index import leave_index
+
+APPROVED_LEAVE_STATUSES = ('approved', '승인')
+
+_close_lock = threading.Lock()
+
+
+def _expected_employee_ids(target_date):
+    """해당 날짜 근무 예정 직원 ID 집합"""
+    calendar_working = is_working_day(target_date)
+    holiday_off = db.session.query(Holiday.id).filter(
+        Holiday.date == target_date, Holiday.is_working_day.is_(False)
+    ).first() is not None
+    weekday = target_date.weekday()
+
+    expected = set()
+    for (employee_id,) in db.session.query(Employee.id).filter(
+        Employee.status == 'active',
+        or_(Employee.hire_date.is_(None), Employee.hire_date <= target_date)
+    ):
+        week = schedule_index.week(employee_id)
+        if week is DEFAULT_WEEK:
+            working = calendar_working
+        else:
+            working = week[weekday].is_working_day and not holiday_off
+        if working:
+            expected.add(employee_id)
+    return expected
+
+
+def default_close_date():
+    """기본 마감 날짜 (전날)"""
+    return date.today() - timedelta(days=1)
+
+
+def close_attendance_day(target_date, now=None):
+    """target_date 출퇴근 마감 후 요약 반환 (now: 당일 마감 가능 여부 판단 기준 시각, 기본 현재)"""
+    now = now or datetime.now()
+    if target_date > now.date():
+        raise ValueError('미래 날짜는 마감할 수 없습니다')
+
+    with _close_lock:
+        expected = _expected_employee_ids(target_date)
+        if target_date == now.date():
+            latest_end = max((schedule_index.slot(employee_id, target_date).end for employee_id in expected),
+                             default=None)
+            if latest_end is not None and now.time() < latest_end:
+                raise ValueError(f'당일 마감은 퇴근 예정 시각({latest_end.strftime("%H:%M")}) 이후에 가능합니다')
+        recorded = {
+            employee_id for (employee_id,) in db.session.query(AttendanceRecord.employee_id).filter(
+                AttendanceRecord.date == target_date
+            )
+        }
+        missing = expected - recorded
+
+        on_leave = {}
+        for employee_id, intervals in leave_index.employees_out(target_date, target_date, missing).items():
+            approved = [interval for interval in intervals if interval.status in APPROVED_LEAVE_STATUSES]
+            if approved:
+                on_leave[employee_id] = approved[0]
+
+        rows = []
+        for employee_id in sorted(missing):
+            interval = on_leave.get(employee_id)
+            rows.append({
+                'employee_id': employee_id,
+                'date': target_date,
+                'status': 'on_leave' if interval else 'absent',
+                'work_hours': 0.0,
+                'overtime_hours': 0.0,
+                'notes': f'자동 마감 (휴가: {interval.leave_type})' if interval else '자동 마감 (미출근)'
+            })
+
+        bulk_insert(AttendanceRecord, rows)
+        refresh_attendance_summaries((employee_id, target_date) for employee_id in missing)
+        db.session.commit()
+
+    return {
+        'date': target_date.isoformat(),
+        'expected_count': len(expected),
+        'recorded_count': len(expected & recorded),
+        'absent_count': len(rows) - len(on_leave),
+        'on_leave_count': len(on_leave),
+        'created': len(rows)
+    }
@@ -0,0 +1,307 @@
+"""
+출퇴근 기록 대량 가져오기 (출입통제 장비 CSV/JSONL)
+- 입력을 스트리밍으로 읽어 IMPORT_CHUNK_SIZE 단위로 처리 (전체 파일을 메모리에 올리지 않음)
+- 행 형식
+  * 기록 행: employee_id|employee_number, date, check_in_time, check_out_time[, status, overtime_hours, notes]
+  * 출입 행: employee_id|employee_number, timestamp (YYYY-MM-DD HH:MM[:SS]) - 같은 날 최초/최종 출입을 출근/퇴근으로 사용
+- 직원별 요일 근무시간(schedule_index)으로 지각/조퇴 판정, 근무시간/연장근무시간 계산 (비근무일 근무는 전부 연장근무)
+- (employee_id, date) 기준 upsert: 기록 행은 덮어쓰기, 출입 행은 기존 출근/퇴근과 병합
+- 청크별 커밋 (월별 출퇴근 집계도 같은 트랜잭션에서 갱신), 청크 쓰기 실패 시 행 단위로 재시도하여 실패 행만 오류로 보고
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from sqlalchemy import update
+
+from ..database import db
+from ..models.attendance import AttendanceRecord
+from ..models.employee import Employee
+from .bulk_write import iter_chunks, bulk_insert
+from .schedule_index import schedule_index
+from .attendance_summary import refresh_attendance_summaries
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_ERRORS = 1000
+
+FORMATS = ('csv', 'jsonl')
+
+_TIME_FORMATS = ('%H:%M', '%H:%M:%S')
+_TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M', '%Y-%m-%dT%H:%M:%S')
+
+
+class ImportRowError(ValueError):
+    """행 단위 검증 오류"""
+
+
+def detect_format(filename=None, content_type=None):
+    """파일명/Content-Type으로 형식 추정 (기본 csv)"""
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson', '.json')) or 'json' in (content_type or ''):
+        return 'jsonl'
+    return 'csv'
+
+
+def iter_source_rows(stream, fmt='csv'):
+    """텍스트 스트림에서 (줄 번호, dict 또는 파싱 오류 메시지) 순회"""
+    if fmt == 'jsonl':
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                yield line_no, '잘못된 JSON 형식입니다'
+                continue
+            yield line_no, item if isinstance(item, dict) else 'JSON 객체가 아닙니다'
+    else:
+        reader = csv.DictReader(stream)
+        for item in reader:
+            # 헤더가 1행이므로 데이터 행 번호는 reader.line_num 기준
+            yield reader.line_num, {key.strip(): value.strip() for key, value in item.items()
+                                    if key and isinstance(value, str)}
+
+
+def _parse_time(value, message):
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).time()
+        except ValueError:
+            continue
+    raise ImportRowError(message)
+
+
+def _parse_row(item):
+    """원본 행 -> (직원 키, 날짜, 출근, 퇴근, 병합 여부, 추가 값)"""
+    employee_id = item.get('employee_id')
+    employee_number = item.get('employee_number')
+    if employee_id in (None, '') and not employee_number:
+        raise ImportRowError('employee_id 또는 employee_number가 필요합니다')
+    if employee_id not in (None, ''):
+        try:
+            employee_key = ('id', int(employee_id))
+        except (TypeError, ValueError):
+            raise ImportRowError('잘못된 employee_id입니다')
+    else:
+        employee_key = ('number', str(employee_number))
+
+    timestamp = item.get('timestamp')
+    if timestamp:
+        for fmt in _TIMESTAMP_FORMATS:
+            try:
+                punched_at = datetime.strptime(str(timestamp), fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ImportRowError('잘못된 출입 시각 형식입니다')
+        punch = punched_at.time().replace(microsecond=0)
+        return employee_key, punched_at.date(), punch, punch, True, {}
+
+    try:
+        record_date = datetime.strptime(str(item.get('date') or ''), '%Y-%m-%d').date()
+    except ValueError:
+        raise ImportRowError('잘못된 날짜 형식입니다')
+
+    check_in_time = _parse_time(str(item['check_in_time']), '잘못된 출근시간 형식입니다') if item.get('check_in_time') else None
+    check_out_time = _parse_time(str(item['check_out_time']), '잘못된 퇴근시간 형식입니다') if item.get('check_out_time') else None
+
+    extra = {}
+    if item.get('status'):
+        extra['status'] = str(item['status'])
+    if item.get('overtime_hours') not in (None, ''):
+        try:
+            extra['overtime_hours'] = float(item['overtime_hours'])
+        except (TypeError, ValueError):
+            raise ImportRowError('잘못된 연장근무시간입니다')
+    if item.get('notes'):
+        extra['notes'] = str(item['notes'])
+    return employee_key, record_date, check_in_time, check_out_time, False, extra
+
+
+def _min_time(a, b):
+    return b if a is None else a if b is None else min(a, b)
+
+
+def _max_time(a, b):
+    return b if a is None else a if b is None else max(a, b)
+
+
+class AttendanceImporter:
+    """청크 단위 출퇴근 기록 upsert (직원 조회 결과는 가져오기 동안 재사용)"""
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, max_errors=DEFAULT_MAX_ERRORS):
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.employee_ids = {}     # employee_number -> id
+        self.known_ids = set()
+        self.missing = set()       # 존재하지 않는 ('id'|'number', 값)
+        self.result = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'errors': []}
+
+    def _error(self, line_no, message):
+        self.result['failed'] += 1
+        if len(self.result['errors']) < self.max_errors:
+            self.result['errors'].append({'line': line_no, 'error': message})
+
+    def _resolve_employees(self, keys):
+        """청크에 처음 등장한 직원 ID/사번만 조회"""
+        new_ids = {value for kind, value in keys if kind == 'id'} - self.known_ids
+        new_numbers = {value for kind, value in keys if kind == 'number'} - set(self.employee_ids)
+        new_ids = {value for value in new_ids if ('id', value) not in self.missing}
+        new_numbers = {value for value in new_numbers if ('number', value) not in self.missing}
+        if new_ids:
+            found = {row.id for row in db.session.query(Employee.id).filter(Employee.id.in_(new_ids))}
+            self.known_ids |= found
+            self.missing |= {('id', value) for value in new_ids - found}
+        if new_numbers:
+            rows = db.session.query(Employee.id, Employee.employee_number).filter(
+                Employee.employee_number.in_(new_numbers)
+            )
+            for employee_id, employee_number in rows:
+                self.employee_ids[employee_number] = employee_id
+                self.known_ids.add(employee_id)
+            self.missing |= {('number', value) for value in new_numbers - set(self.employee_ids)}
+
+    def _employee_id(self, key):
+        kind, value = key
+        if kind == 'id':
+            return value if value in self.known_ids else None
+        return self.employee_ids.get(value)
+
+    def _build_values(self, employee_id, record_date, check_in_time, check_out_time, extra):
+        """근무시간/상태/연장근무 계산"""
+        if check_out_time is not None and check_in_time is not None and check_out_time <= check_in_time:
+            check_out_time = None  # 출입 1회만 있는 날
+        schedule = schedule_index.slot(employee_id, record_date)
+        work_hours = AttendanceRecord.calculate_work_hours(check_in_time, check_out_time)
+        scheduled_hours = AttendanceRecord.calculate_work_hours(schedule.start, schedule.end) if schedule.is_working_day else 0.0
+        values = {
+            'employee_id': employee_id,
+            'date': record_date,
+            'check_in_time': check_in_time,
+            'check_out_time': check_out_time,
+            'status': extra.get('status') or AttendanceRecord.determine_status(
+                check_in_time, check_out_time, schedule.start, schedule.end
+            ),
+            'work_hours': work_hours,
+            'overtime_hours': extra.get('overtime_hours', round(max(0.0, work_hours - scheduled_hours), 2)),
+            'updated_at': datetime.utcnow()
+        }
+        if 'notes' in extra:
+            values['notes'] = extra['notes']
+        return values
+
+    def _write(self, inserts, updates):
+        created = bulk_insert(AttendanceRecord, inserts, self.chunk_size)
+        if updates:
+            db.session.execute(update(AttendanceRecord), updates)
+        return created, len(updates)
+
+    def process_chunk(self, chunk):
+        """(줄 번호, 원본 행) 청크 1개 처리 후 커밋"""
+        parsed = []
+        for line_no, item in chunk:
+            self.result['processed'] += 1
+            if isinstance(item, str):
+                self._error(line_no, item)
+                continue
+            try:
+                parsed.append((line_no, _parse_row(item)))
+            except ImportRowError as e:
+                self._error(line_no, str(e))
+
+        self._resolve_employees({row[0] for _, row in parsed})
+
+        # 청크 내 같은 (직원, 날짜) 행 합치기: 출입 행은 최초/최종 시각, 기록 행은 마지막 값
+        merged = {}
+        for line_no, (employee_key, record_date, check_in_time, check_out_time, merge, extra) in parsed:
+            employee_id = self._employee_id(employee_key)
+            if employee_id is None:
+                self._error(line_no, '존재하지 않는 직원입니다')
+                continue
+            key = (employee_id, record_date)
+            current = merged.get(key)
+            if merge and current is not None and current['merge']:
+                current['check_in_time'] = _min_time(current['check_in_time'], check_in_time)
+                current['check_out_time'] = _max_time(current['check_out_time'], check_out_time)
+                current['lines'].append(line_no)
+            else:
+                merged[key] = {
+                    'check_in_time': check_in_time, 'check_out_time': check_out_time,
+                    'merge': merge, 'extra': extra,
+                    'lines': (current['lines'] if current else []) + [line_no]
+                }
+        if not merged:
+            return
+
+        employee_ids = {employee_id for employee_id, _ in merged}
+        dates = [record_date for _, record_date in merged]
+        existing = {}
+        for record_id, employee_id, record_date, check_in_time, check_out_time in db.session.query(
+            AttendanceRecord.id, AttendanceRecord.employee_id, AttendanceRecord.date,
+            AttendanceRecord.check_in_time, AttendanceRecord.check_out_time
+        ).filter(
+            AttendanceRecord.employee_id.in_(employee_ids),
+            AttendanceRecord.date >= min(dates),
+            AttendanceRecord.date <= max(dates)
+        ):
+            existing.setdefault((employee_id, record_date), (record_id, check_in_time, check_out_time))
+
+        planned = []
+        for (employee_id, record_date), entry in merged.items():
+            check_in_time, check_out_time = entry['check_in_time'], entry['check_out_time']
+            current = existing.get((employee_id, record_date))
+            if current is not None and entry['merge']:
+                check_in_time = _min_time(current[1], check_in_time)
+                check_out_time = _max_time(current[2], _max_time(current[1], check_out_time))
+            values = self._build_values(employee_id, record_date, check_in_time, check_out_time, entry['extra'])
+            if current is not None:
+                values['id'] = current[0]
+            planned.append((entry['lines'], values))
+
+        try:
+            with db.session.begin_nested():
+                created, updated = self._write(
+                    [values for _, values in planned if 'id' not in values],
+                    [values for _, values in planned if 'id' in values]
+                )
+            written = [values for _, values in planned]
+        except Exception:
+            # 청크 쓰기 실패 시 행 단위 재시도 (실패 행만 오류 처리)
+            created = updated = 0
+            written = []
+            for lines, values in planned:
+                try:
+                    with db.session.begin_nested():
+                        is_update = 'id' in values
+                        self._write([] if is_update else [values], [values] if is_update else [])
+                    updated += is_update
+                    created += not is_update
+                    written.append(values)
+                except Exception as e:
+                    for line_no in lines:
+                        self._error(line_no, f'저장 실패: {e}')
+        refresh_attendance_summaries((values['employee_id'], values['date']) for values in written)
+        db.session.commit()
+        self.result['created'] += created
+        self.result['updated'] += updated
+
+    def run(self, rows):
+        """(줄 번호, 원본 행) 순회 가능 객체 전체 처리"""
+        for chunk in iter_chunks(rows, self.chunk_size):
+            self.process_chunk(chunk)
+        self.result['errors'].sort(key=lambda error: error['line'])
+        return self.result
+
+
+def import_attendance(stream, fmt='csv', chunk_size=DEFAULT_CHUNK_SIZE, max_errors=DEFAULT_MAX_ERRORS):
+    """텍스트/바이너리 스트림에서 출퇴근 기록 가져오기 후 결과 요약 반환"""
+    if fmt not in FORMATS:
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    importer = AttendanceImporter(chunk_size=chunk_size, max_errors=max_errors)
+    return importer.run(iter_source_rows(stream, fmt))
@@ -0,0 +1,197 @@
+"""
+월별 출퇴근 집계 (attendance_monthly_summaries)
+- 출퇴근 기록 생성/수정/삭제 시 호출자의 트랜잭션 안에서 영향받은 직원·월만 원본으로 재집계하여 UPSERT
+  (증감 대신 재집계하므로 상태 변경/날짜 이동/일괄 upsert에도 누적 오차 없음, 직원·월당 기록은 최대 31행)
+- 월별 추이/내 통계/급여 연장근무는 집계 행만 읽음
+- rebuild_attendance_summaries(): 원본 전체(또는 연도) 재집계
+"""
+
+from datetime import datetime, date
+
+from sqlalchemy import text, func, or_, and_
+
+from ..database import db
+from .bulk_write import iter_chunks
+from .period import month_range, in_range
+from .schedule_index import schedule_index
+
+STATUS_FIELDS = {
+    'present': 'present_days', '출근': 'present_days',
+    'late': 'late_days', '지각': 'late_days',
+    'early_leave': 'early_leave_days', '조퇴': 'early_leave_days',
+    'absent': 'absent_days', '결근': 'absent_days',
+    'on_leave': 'on_leave_days', '휴가': 'on_leave_days'
+}
+LATE_STATUSES = ('late', '지각')
+
+SUMMARY_FIELDS = (
+    'total_days', 'present_days', 'late_days', 'early_leave_days', 'absent_days', 'on_leave_days',
+    'work_hours', 'work_hours_days', 'overtime_hours', 'late_minutes'
+)
+
+# ORM 세션(text)과 sqlite3 커서 모두에서 사용하는 이름 기반 파라미터 SQL
+UPSERT_SQL = """
+INSERT INTO attendance_monthly_summaries (employee_id, year, month, {fields}, updated_at)
+VALUES (:employee_id, :year, :month, {values}, :updated_at)
+ON CONFLICT (employee_id, year, month) DO UPDATE SET
+    {updates}, updated_at = excluded.updated_at
+""".format(
+    fields=', '.join(SUMMARY_FIELDS),
+    values=', '.join(f':{field}' for field in SUMMARY_FIELDS),
+    updates=', '.join(f'{field} = excluded.{field}' for field in SUMMARY_FIELDS)
+)
+
+EMPLOYEE_SUMMARY_SQL = """
+SELECT COALESCE(SUM(total_days), 0), COALESCE(SUM(present_days), 0),
+       COALESCE(SUM(late_days), 0), COALESCE(SUM(absent_days), 0)
+FROM attendance_monthly_summaries
+WHERE employee_id = :employee_id AND year = :year AND (:month IS NULL OR month = :month)
+"""
+
+REFRESH_CHUNK_SIZE = 500
+
+
+def _empty():
+    return dict.fromkeys(SUMMARY_FIELDS, 0)
+
+
+def _late_minutes(employee_id, record_date, check_in_time):
+    start = schedule_index.slot(employee_id, record_date).start
+    late = (check_in_time.hour * 60 + check_in_time.minute) - (start.hour * 60 + start.minute)
+    return max(0, late)
+
+
+def _accumulate(summaries, row):
+    """원본 행 1개를 (직원, 연, 월) 집계에 반영"""
+    employee_id, record_date, status, check_in_time, work_hours, overtime_hours = row
+    summary = summaries.get((employee_id, record_date.year, record_date.month))
+    if summary is None:
+        summary = summaries[(employee_id, record_date.year, record_date.month)] = _empty()
+    summary['total_days'] += 1
+    field = STATUS_FIELDS.get(status)
+    if field:
+        summary[field] += 1
+    if work_hours is not None:
+        summary['work_hours'] += work_hours
+        summary['work_hours_days'] += 1
+    summary['overtime_hours'] += overtime_hours or 0.0
+    if status in LATE_STATUSES and check_in_time is not None:
+        summary['late_minutes'] += _late_minutes(employee_id, record_date, check_in_time)
+
+
+def _source_query():
+    from ..models.attendance import AttendanceRecord
+
+    return db.session.query(
+        AttendanceRecord.employee_id, AttendanceRecord.date, AttendanceRecord.status,
+        AttendanceRecord.check_in_time, AttendanceRecord.work_hours, AttendanceRecord.overtime_hours
+    ), AttendanceRecord
+
+
+def _upsert(summaries):
+    updated_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
+    params = [
+        {'employee_id': employee_id, 'year': year, 'month': month, 'updated_at': updated_at, **values}
+        for (employee_id, year, month), values in summaries.items()
+    ]
+    for chunk in iter_chunks(params):
+        db.session.execute(text(UPSERT_SQL), chunk)
+
+
+def refresh_attendance_summaries(keys):
+    """출퇴근 기록 변경분 반영 (keys: (employee_id, date) 목록, 커밋은 호출자가 담당)"""
+    from ..models.attendance_monthly_summary import AttendanceMonthlySummary
+
+    months = {}
+    for employee_id, record_date in keys:
+        months.setdefault((record_date.year, record_date.month), set()).add(int(employee_id))
+    if not months:
+        return
+
+    query, AttendanceRecord = _source_query()
+    summaries = {}
+    stale = []
+    for (year, month), employee_ids in months.items():
+        for chunk in iter_chunks(sorted(employee_ids), REFRESH_CHUNK_SIZE):
+            for row in query.filter(
+                AttendanceRecord.employee_id.in_(chunk),
+                in_range(AttendanceRecord.date, *month_range(year, month))
+            ):
+                _accumulate(summaries, row)
+            stale.extend((employee_id, year, month) for employee_id in chunk
+                         if (employee_id, year, month) not in summaries)
+
+    _upsert(summaries)
+
+    # 기록이 모두 삭제된 직원·월 집계 제거
+    for chunk in iter_chunks(stale, REFRESH_CHUNK_SIZE):
+        db.session.query(AttendanceMonthlySummary).filter(or_(*[
+            and_(
+                AttendanceMonthlySummary.employee_id == employee_id,
+                AttendanceMonthlySummary.year == year,
+                AttendanceMonthlySummary.month == month
+            ) for employee_id, year, month in chunk
+        ])).delete(synchronize_session=False)
+
+
+def rebuild_attendance_summaries(year=None):
+    """원본 기준 월별 집계 재생성 후 커밋 (year 지정 시 해당 연도만), 생성 행 수 반환"""
+    from ..models.attendance_monthly_summary import AttendanceMonthlySummary
+
+    query, AttendanceRecord = _source_query()
+    summary_query = db.session.query(AttendanceMonthlySummary)
+    if year is not None:
+        query = query.filter(in_range(AttendanceRecord.date, date(year, 1, 1), date(year + 1, 1, 1)))
+        summary_query = summary_query.filter(AttendanceMonthlySummary.year == year)
+
+    summaries = {}
+    for row in query.yield_per(5000):
+        _accumulate(summaries, row)
+
+    summary_query.delete(synchronize_session=False)
+    _upsert(summaries)
+    db.session.commit()
+    return len(summaries)
+
+
+def monthly_attendance_totals(start_year, start_month, end_year, end_month):
+    """기간 내 월별 전사 합계 [(연, 월, 기록 일수, 정상, 지각, 결근, 근무시간 합계, 근무시간 기록 일수)]"""
+    from ..models.attendance_monthly_summary import AttendanceMonthlySummary as Summary
+
+    period = Summary.year * 100 + Summary.month
+    return db.session.query(
+        Summary.year, Summary.month,
+        func.sum(Summary.total_days).label('total_records'),
+        func.sum(Summary.present_days).label('on_time'),
+        func.sum(Summary.late_days).label('late'),
+        func.sum(Summary.absent_days).label('absent'),
+        func.sum(Summary.work_hours).label('work_hours'),
+        func.sum(Summary.work_hours_days).label('work_hours_days')
+    ).filter(
+        period >= start_year * 100 + start_month,
+        period <= end_year * 100 + end_month
+    ).group_by(Summary.year, Summary.month).order_by(Summary.year, Summary.month).all()
+
+
+def employee_attendance_stats(employee_id, year, month=None, cursor=None):
+    """직원의 연간(또는 월) 출근 통계 dict (cursor 지정 시 원시 연결에서 조회)"""
+    params = {'employee_id': employee_id, 'year': year, 'month': month}
+    if cursor is not None:
+        cursor.execute(EMPLOYEE_SUMMARY_SQL, params)
+        row = cursor.fetchone()
+    else:
+        row = db.session.execute(text(EMPLOYEE_SUMMARY_SQL), params).fetchone()
+    return dict(zip(('total_days', 'present_days', 'late_days', 'absent_days'), (int(value) for value in row)))
+
+
+def monthly_payroll_attendance(year, month):
+    """급여 계산용 직원별 (연장근무시간, 출근 일수)"""
+    from ..models.attendance_monthly_summary import AttendanceMonthlySummary as Summary
+
+    return {
+        employee_id: (overtime_hours, worked_days)
+        for employee_id, overtime_hours, worked_days in db.session.query(
+            Summary.employee_id, Summary.overtime_hours,
+            Summary.present_days + Summary.late_days + Summary.early_leave_days
+        ).filter(Summary.year == year, Summary.month == month)
+    }
@@ -0,0 +1,249 @@
+"""
+감사 로그 보관(아카이브)
+- 보관 기준(AUDIT_ARCHIVE_RETENTION_DAYS)보다 오래된 audit_logs 행을 월별 세그먼트 파일로 이동
+- 세그먼트: audit_logs_YYYY_MM.jsonl.gz (추가 전용, 실행마다 gzip 멤버 1개 추가)
+- 사이드카 인덱스: audit_logs_YYYY_MM.index.json (멤버별 오프셋/길이/건수/ID·시각 범위)
+- 조회 기간이 보관 구간에 걸치면 인덱스로 해당 멤버만 읽어 최신순으로 반환
+"""
+
+import glob
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, delete
+
+from ..database import db
+from .bulk_write import iter_chunks
+from .period import month_range
+
+DEFAULT_RETENTION_DAYS = 365
+DELETE_CHUNK_SIZE = 500
+READ_CHUNK_SIZE = 1000
+
+_archive_lock = threading.Lock()
+
+
+def archive_dir(app):
+    """세그먼트 저장 디렉토리"""
+    return app.config.get('AUDIT_ARCHIVE_DIR') or os.path.join(app.instance_path, 'audit_archive')
+
+
+def _segment_paths(directory, year, month):
+    base = os.path.join(directory, f"audit_logs_{year}_{month:02d}")
+    return base + '.jsonl.gz', base + '.index.json'
+
+
+def _load_index(index_path, year, month):
+    if not os.path.exists(index_path):
+        return {'month': f"{year}-{month:02d}", 'members': []}
+    with open(index_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_index(index_path, index):
+    """인덱스 원자적 저장"""
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, index_path)
+
+
+def _read_member(segment_path, member):
+    """세그먼트에서 gzip 멤버 1개를 읽어 행 목록 반환"""
+    with open(segment_path, 'rb') as f:
+        f.seek(member['offset'])
+        data = gzip.decompress(f.read(member['length']))
+    return [json.loads(line) for line in data.decode('utf-8').splitlines() if line]
+
+
+def _serialize(row):
+    record = dict(row._mapping)
+    record['created_at'] = record['created_at'].isoformat()
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _delete_rows(connection, table, ids):
+    for chunk in iter_chunks(ids, DELETE_CHUNK_SIZE):
+        connection.execute(delete(table).where(table.c.id.in_(chunk)))
+
+
+def _finish_pending(directory, table):
+    """파일 기록 후 DB 삭제 전에 중단된 멤버의 원본 행 삭제"""
+    for index_path in glob.glob(os.path.join(directory, 'audit_logs_*.index.json')):
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+        pending = [member for member in index['members'] if not member['deleted']]
+        if not pending:
+            continue
+        segment_path = index_path.replace('.index.json', '.jsonl.gz')
+        with db.engine.begin() as connection:
+            for member in pending:
+                _delete_rows(connection, table, [row['id'] for row in _read_member(segment_path, member)])
+        for member in pending:
+            member['deleted'] = True
+        _save_index(index_path, index)
+
+
+def _archive_month(directory, table, year, month, cutoff):
+    """해당 월의 cutoff 이전 행을 세그먼트에 추가하고 원본 삭제, 이동 건수 반환"""
+    start, end = month_range(year, month)
+    end = min(datetime.combine(end, datetime.min.time()), cutoff)
+    segment_path, index_path = _segment_paths(directory, year, month)
+
+    query = select(table).where(
+        table.c.created_at >= datetime.combine(start, datetime.min.time()),
+        table.c.created_at < end
+    ).order_by(table.c.created_at, table.c.id)
+
+    ids = []
+    offset = os.path.getsize(segment_path) if os.path.exists(segment_path) else 0
+    first = last = None
+    with open(segment_path, 'ab') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb') as archive:
+            with db.engine.connect() as connection:
+                result = connection.execution_options(yield_per=READ_CHUNK_SIZE).execute(query)
+                for rows in result.partitions():
+                    for row in rows:
+                        archive.write(_serialize(row).encode('utf-8') + b'\n')
+                        ids.append(row.id)
+                        first = first or row.created_at
+                        last = row.created_at
+        if not ids:
+            raw.truncate(offset)
+            return 0
+        raw.flush()
+        os.fsync(raw.fileno())
+        length = raw.tell() - offset
+
+    index = _load_index(index_path, year, month)
+    member = {
+        'offset': offset,
+        'length': length,
+        'count': len(ids),
+        'min_id': min(ids),
+        'max_id': max(ids),
+        'min_created_at': first.isoformat(),
+        'max_created_at': last.isoformat(),
+        'deleted': False
+    }
+    index['members'].append(member)
+    _save_index(index_path, index)
+
+    # 파일/인덱스가 디스크에 기록된 뒤 원본 삭제
+    with db.engine.begin() as connection:
+        _delete_rows(connection, table, ids)
+    member['deleted'] = True
+    _save_index(index_path, index)
+    return len(ids)
+
+
+def archive_audit_logs(app, before=None):
+    """before(기본: 보관 기준일) 이전 감사 로그를 월별 세그먼트로 이동, {월: 건수} 반환"""
+    from ..models.audit_log import AuditLog
+
+    table = AuditLog.__table__
+    if before is None:
+        retention = app.config.get('AUDIT_ARCHIVE_RETENTION_DAYS', DEFAULT_RETENTION_DAYS)
+        before = datetime.utcnow() - timedelta(days=retention)
+    if isinstance(before, datetime):
+        before = before.date()
+    cutoff = datetime.combine(before, datetime.min.time())
+
+    directory = archive_dir(app)
+    os.makedirs(directory, exist_ok=True)
+
+    with _archive_lock:
+        _finish_pending(directory, table)
+
+        with db.engine.connect() as connection:
+            oldest = connection.execute(
+                select(db.func.min(table.c.created_at)).where(table.c.created_at < cutoff)
+            ).scalar()
+        if oldest is None:
+            return {}
+
+        archived = {}
+        year, month = oldest.year, oldest.month
+        while (year, month) <= (cutoff.year, cutoff.month):
+            count = _archive_month(directory, table, year, month, cutoff)
+            if count:
+                archived[f"{year}-{month:02d}"] = count
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return archived
+
+
+def archived_until(app):
+    """보관된 가장 최근 로그 시각 (보관본이 없으면 None)"""
+    latest = None
+    for index_path in glob.glob(os.path.join(archive_dir(app), 'audit_logs_*.index.json')):
+        with open(index_path, encoding='utf-8') as f:
+            for member in json.load(f)['members']:
+                value = datetime.fromisoformat(member['max_created_at'])
+                latest = value if latest is None or value > latest else latest
+    return latest
+
+
+def iter_archived_logs(app, start=None, end=None, user_id=None, action_type=None,
+                       entity_type=None, before=None):
+    """보관 로그를 (created_at, id) 내림차순으로 반환
+
+    start/end: [start, end) 시각 범위, before: (created_at, id) 커서 - 이보다 오래된 행만
+    """
+    directory = archive_dir(app)
+    index_paths = sorted(glob.glob(os.path.join(directory, 'audit_logs_*.index.json')), reverse=True)
+
+    for index_path in index_paths:
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+        segment_path = index_path.replace('.index.json', '.jsonl.gz')
+
+        rows = []
+        for member in index['members']:
+            low = datetime.fromisoformat(member['min_created_at'])
+            high = datetime.fromisoformat(member['max_created_at'])
+            # 인덱스의 시각 범위로 해당 없는 멤버는 읽지 않음
+            if (start and high < start) or (end and low >= end) or (before and low > before[0]):
+                continue
+            for row in _read_member(segment_path, member):
+                created_at = datetime.fromisoformat(row['created_at'])
+                if start and created_at < start:
+                    continue
+                if end and created_at >= end:
+                    continue
+                if before and (created_at, row['id']) >= tuple(before):
+                    continue
+                if user_id is not None and row['user_id'] != user_id:
+                    continue
+                if action_type and row['action_type'] != action_type:
+                    continue
+                if entity_type and row['entity_type'] != entity_type:
+                    continue
+                row['created_at'] = created_at
+                rows.append(row)
+
+        rows.sort(key=lambda row: (row['created_at'], row['id']), reverse=True)
+        yield from rows
+
+
+def archived_log_dict(row, usernames):
+    """보관 로그를 AuditLog.to_dict()와 같은 형태로 변환"""
+    return {
+        'id': row['id'],
+        'user_id': row['user_id'],
+        'username': usernames.get(row['user_id']),
+        'action_type': row['action_type'],
+        'entity_type': row['entity_type'],
+        'entity_id': row['entity_id'],
+        'old_values': json.loads(row['old_values']) if row['old_values'] else None,
+        'new_values': json.loads(row['new_values']) if row['new_values'] else None,
+        'ip_address': row['ip_address'],
+        'user_agent': row['user_agent'],
+        'message': row['message'],
+        'created_at': row['created_at'].isoformat(),
+        'archived': True
+    }
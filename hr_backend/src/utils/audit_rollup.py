@@ -0,0 +1,105 @@
+"""
+감사 로그 일별 집계 (audit_log_daily_rollups) 증분 갱신
+- audit_rollup_state.last_log_id 이후 새 로그만 GROUP BY 하여 건수를 누적 (UPSERT)
+- 비동기 기록기(일괄 INSERT 직후)와 요약 API 조회 직전에 호출
+- 요약 API는 원본 로그 대신 집계 테이블만 조회하므로 로그 건수와 무관하게 일정한 비용
+- 전제: audit_logs.id는 삭제(아카이브) 후에도 재사용되지 않고 계속 증가 (SQLite AUTOINCREMENT)
+  최대 ID가 워터마크보다 작아지면(ID 재사용) 경고를 남기고 워터마크를 최대 ID로 낮춰 이후 로그부터 다시 집계
+"""
+
+import logging
+import threading
+from datetime import date
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..database import db
+from .bulk_write import iter_chunks
+
+UPSERT_CHUNK_SIZE = 500
+STATE_ID = 1
+
+_refresh_lock = threading.Lock()
+logger = logging.getLogger(__name__)
+
+
+def _upsert(connection):
+    """방언별 INSERT ... ON CONFLICT 구문"""
+    return postgresql.insert if connection.dialect.name == 'postgresql' else sqlite.insert
+
+
+def refresh_audit_rollups(engine=None):
+    """마지막 집계 이후 감사 로그를 일별 집계에 반영하고 반영한 로그 수 반환"""
+    from ..models.audit_log import AuditLog, AuditLogDailyRollup, AuditRollupState
+
+    logs = AuditLog.__table__
+    rollups = AuditLogDailyRollup.__table__
+    state = AuditRollupState.__table__
+    engine = engine or db.engine
+
+    with _refresh_lock, engine.begin() as connection:
+        insert = _upsert(connection)
+        connection.execute(
+            insert(state).values(id=STATE_ID, last_log_id=0).on_conflict_do_nothing(index_elements=[state.c.id])
+        )
+        last_log_id = connection.execute(
+            select(state.c.last_log_id).where(state.c.id == STATE_ID)
+        ).scalar()
+        max_log_id = connection.execute(select(func.max(logs.c.id))).scalar() or 0
+        if max_log_id < last_log_id:
+            # ID 재사용으로 워터마크를 넘는 로그가 생기지 않아 집계가 멈추는 것을 방지
+            logger.warning(
+                "audit_logs 최대 ID(%s)가 집계 워터마크(%s)보다 작아 워터마크를 재설정합니다.",
+                max_log_id, last_log_id
+            )
+            connection.execute(
+                update(state)
+                .where(state.c.id == STATE_ID, state.c.last_log_id == last_log_id)
+                .values(last_log_id=max_log_id, updated_at=func.current_timestamp())
+            )
+            return 0
+        if max_log_id == last_log_id:
+            return 0
+
+        # 상태를 먼저 갱신하여 다른 프로세스와 같은 구간을 중복 집계하지 않도록 함
+        claimed = connection.execute(
+            update(state)
+            .where(state.c.id == STATE_ID, state.c.last_log_id == last_log_id)
+            .values(last_log_id=max_log_id, updated_at=func.current_timestamp())
+        ).rowcount
+        if not claimed:
+            return 0
+
+        day = func.date(logs.c.created_at)
+        rows = connection.execute(
+            select(
+                day.label('date'),
+                logs.c.action_type,
+                logs.c.entity_type,
+                logs.c.user_id,
+                func.count().label('count')
+            ).where(
+                logs.c.id > last_log_id,
+                logs.c.id <= max_log_id
+            ).group_by(day, logs.c.action_type, logs.c.entity_type, logs.c.user_id)
+        ).all()
+
+        values = [
+            {
+                'date': date.fromisoformat(row.date) if isinstance(row.date, str) else row.date,
+                'action_type': row.action_type,
+                'entity_type': row.entity_type,
+                'user_id': row.user_id,
+                'count': row.count
+            }
+            for row in rows
+        ]
+        for chunk in iter_chunks(values, UPSERT_CHUNK_SIZE):
+            statement = insert(rollups).values(chunk)
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=[rollups.c.date, rollups.c.action_type, rollups.c.entity_type, rollups.c.user_id],
+                set_={'count': rollups.c.count + statement.excluded.count}
+            ))
+
+        return sum(row['count'] for row in values)
@@ -0,0 +1,191 @@
+"""
+감사 로그 비동기 일괄 기록기
+- 요청 스레드는 이벤트를 메모리 대기열에 넣고 즉시 반환 (요청 세션을 커밋하지 않음)
+- 백그라운드 스레드가 건수(AUDIT_BATCH_SIZE) 또는 시간(AUDIT_FLUSH_INTERVAL) 기준으로 모아서 별도 연결로 일괄 INSERT
+- 대기열이 가득 차면 호출 스레드에서 직접 기록, DB 기록 실패 시 스풀 파일(JSON Lines)에 보관 후 재기동 시 재처리
+- 일괄 기록 후 일별 집계(audit_log_daily_rollups) 증분 갱신
+- 프로세스 종료 시 남은 이벤트 기록
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from ..database import db
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0  # 초
+DEFAULT_QUEUE_SIZE = 10000
+SHUTDOWN_TIMEOUT = 10.0
+
+_STOP = object()
+
+
+class AuditWriter:
+    """감사 로그 대기열 + 일괄 기록 스레드"""
+
+    def __init__(self):
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+        self._app = None
+        self._engine = None
+        self._table = None
+
+    def _ensure_started(self, app):
+        """첫 기록 시 대기열/기록 스레드 생성"""
+        with self._lock:
+            if self._app is not None:
+                return
+            from ..models.audit_log import AuditLog
+
+            self._app = app
+            self._engine = db.engine
+            self._table = AuditLog.__table__
+            self._queue = queue.Queue(maxsize=app.config.get('AUDIT_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+            if app.config.get('AUDIT_ASYNC', True):
+                self._thread = threading.Thread(target=self._worker, name='audit-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+            else:
+                self._replay_spool()
+
+    @property
+    def spool_path(self):
+        """DB 기록 실패 이벤트 보관 파일"""
+        return self._app.config.get('AUDIT_SPOOL_PATH') or os.path.join(self._app.instance_path, 'audit_spool.jsonl')
+
+    def write(self, app, event):
+        """이벤트 기록 요청 (비동기 모드는 대기열에 추가)"""
+        self._ensure_started(app)
+
+        if self._thread is None:
+            self._write([event])
+            return
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # 대기열 초과: 호출 스레드에서 직접 기록 (유실 방지)
+            self._write([event])
+
+    def flush(self, timeout=SHUTDOWN_TIMEOUT):
+        """대기 중인 이벤트가 모두 기록될 때까지 대기"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self):
+        """기록 스레드 종료 (남은 이벤트 기록 후)"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(SHUTDOWN_TIMEOUT)
+
+    def _worker(self):
+        """대기열 이벤트를 건수/시간 기준으로 모아 일괄 기록"""
+        self._replay_spool()
+        batch_size = self._app.config.get('AUDIT_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        interval = self._app.config.get('AUDIT_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+
+        while True:
+            batch = []
+            markers = []
+            stop = False
+            item = self._queue.get()
+            deadline = time.monotonic() + interval
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+
+                # 종료/flush 요청 또는 건수 도달 시 즉시 기록
+                if stop or markers or len(batch) >= batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if stop or markers:
+                # 남은 이벤트까지 모두 포함
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        markers.append(item)
+                    else:
+                        batch.append(item)
+
+            if batch:
+                self._write(batch)
+                self._refresh_rollups()
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write(self, events):
+        """별도 연결로 일괄 INSERT (실패 시 스풀 파일 보관)"""
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(self._table.insert(), events)
+        except Exception:
+            traceback.print_exc()
+            self._spool(events)
+
+    def _refresh_rollups(self):
+        """일별 집계 증분 갱신 (실패해도 다음 호출 시 이어서 반영)"""
+        from .audit_rollup import refresh_audit_rollups
+        try:
+            refresh_audit_rollups(self._engine)
+        except Exception:
+            traceback.print_exc()
+
+    def _spool(self, events):
+        with self._spool_lock:
+            os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)
+            with open(self.spool_path, 'a', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps({**event, 'created_at': event['created_at'].isoformat()}, ensure_ascii=False))
+                    f.write('\n')
+
+    def _replay_spool(self):
+        """이전에 기록하지 못한 스풀 이벤트 재처리"""
+        with self._spool_lock:
+            if not os.path.exists(self.spool_path):
+                return
+            processing = self.spool_path + '.processing'
+            os.replace(self.spool_path, processing)
+
+        with open(processing, encoding='utf-8') as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        for event in events:
+            event['created_at'] = datetime.fromisoformat(event['created_at'])
+        if events:
+            self._write(events)
+        os.remove(processing)
+
+
+# 프로세스 공용 감사 로그 기록기
+audit_writer = AuditWriter()
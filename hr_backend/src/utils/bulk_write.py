@@ -0,0 +1,32 @@
+"""
+대량 쓰기 헬퍼
+- ORM 모델에 대한 청크 단위 executemany INSERT
+- 컬럼 기본값(default)은 행마다 적용되며 커밋은 호출자가 담당
+"""
+
+from itertools import islice
+
+from sqlalchemy import insert
+
+from ..database import db
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iter_chunks(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """리스트/제너레이터를 chunk_size 단위 리스트로 분할"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bulk_insert(model, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """모델 행(dict) 대량 INSERT 후 삽입 건수 반환"""
+    inserted = 0
+    for chunk in iter_chunks(rows, chunk_size):
+        db.session.execute(insert(model), chunk)
+        inserted += len(chunk)
+    return inserted
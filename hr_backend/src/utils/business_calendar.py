@@ -0,0 +1,134 @@
+"""
+영업일 달력 서비스
+- 연도별 영업일 비트맵(일자별 0/1)과 누적합(prefix sum)을 미리 계산하여 연도 단위로 캐시
+- is_working_day: 비트맵 조회 O(1), business_days_between: 누적합 차이 (연도당 O(1))
+- 주말(토/일) + holidays 테이블 기준 (is_working_day=True인 휴일은 근무일, 예: 대체 근무 토요일)
+- 공휴일 변경 시 invalidate_calendar(year)로 해당 연도만 무효화, 다른 프로세스는 BUSINESS_CALENDAR_TTL 주기로 재계산
+- 근무개월 수 계산(월별 평가/연간 성과급)도 이 모듈에서 제공
+"""
+
+from array import array
+from datetime import date, timedelta
+
+from flask import current_app, has_app_context
+
+from ..database import db
+from .cache import TTLCache
+from .period import year_range, in_range
+
+DEFAULT_CALENDAR_TTL = 3600  # 초
+
+_calendars = TTLCache(maxsize=32, ttl=DEFAULT_CALENDAR_TTL)
+
+
+class YearCalendar:
+    """한 해의 영업일 비트맵과 누적합"""
+
+    __slots__ = ('year', 'first', 'bits', 'prefix')
+
+    def __init__(self, year, holidays):
+        """holidays: {날짜: 근무일 여부}"""
+        self.year = year
+        self.first = date(year, 1, 1)
+        days = (date(year + 1, 1, 1) - self.first).days
+        first_weekday = self.first.weekday()
+
+        self.bits = bytearray(1 if (first_weekday + offset) % 7 < 5 else 0 for offset in range(days))
+        for day, is_working_day in holidays.items():
+            self.bits[(day - self.first).days] = 1 if is_working_day else 0
+
+        # prefix[i] = 1월 1일부터 i일 전까지의 영업일 수
+        self.prefix = array('H', [0])
+        for bit in self.bits:
+            self.prefix.append(self.prefix[-1] + bit)
+
+    def is_working_day(self, day):
+        return bool(self.bits[(day - self.first).days])
+
+    def count(self, start, end):
+        """start~end(포함, 같은 연도) 영업일 수"""
+        return self.prefix[(end - self.first).days + 1] - self.prefix[(start - self.first).days]
+
+    @property
+    def total(self):
+        return self.prefix[-1]
+
+
+def _ttl():
+    if has_app_context():
+        return current_app.config.get('BUSINESS_CALENDAR_TTL', DEFAULT_CALENDAR_TTL)
+    return DEFAULT_CALENDAR_TTL
+
+
+def get_year_calendar(year):
+    """연도별 영업일 달력 (캐시 우선, 없으면 holidays 1회 조회 후 계산)"""
+    calendar = _calendars.get(year)
+    if calendar is None:
+        from ..models.holiday import Holiday
+
+        holidays = {
+            day: bool(is_working_day)
+            for day, is_working_day in db.session.query(Holiday.date, Holiday.is_working_day).filter(
+                in_range(Holiday.date, *year_range(year))
+            )
+        }
+        calendar = YearCalendar(year, holidays)
+        _calendars.set(year, calendar, ttl=_ttl())
+    return calendar
+
+
+def invalidate_calendar(year=None):
+    """영업일 달력 캐시 무효화 (연도 미지정 시 전체)"""
+    if year is None:
+        _calendars.clear()
+    else:
+        _calendars.pop(year)
+
+
+def is_working_day(day):
+    """영업일 여부"""
+    return get_year_calendar(day.year).is_working_day(day)
+
+
+def business_days_between(start, end):
+    """start~end(포함) 영업일 수"""
+    if not start or not end or end < start:
+        return 0
+    total = 0
+    for year in range(start.year, end.year + 1):
+        calendar = get_year_calendar(year)
+        total += calendar.count(max(start, calendar.first), min(end, date(year, 12, 31)))
+    return total
+
+
+def iter_working_days(start, end):
+    """start~end(포함) 영업일 순회"""
+    day = start
+    while day <= end:
+        if is_working_day(day):
+            yield day
+        day += timedelta(days=1)
+
+
+def working_months(hire_date, year, month):
+    """입사일 기준 해당 연도 1월(입사월)부터 해당 월까지 근무개월 수"""
+    if not hire_date:
+        return 12
+    if hire_date.year > year:
+        return 0
+    if hire_date.year < year:
+        return month
+    if hire_date.month > month:
+        return 0  # 아직 입사하지 않음
+    return month - hire_date.month + 1
+
+
+def working_months_in_year(hire_date, year):
+    """입사일 기준 연도별 총 근무개월 수"""
+    if not hire_date:
+        return 12
+    if hire_date.year > year:
+        return 0
+    if hire_date.year < year:
+        return 12
+    return 12 - hire_date.month + 1
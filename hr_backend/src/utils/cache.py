@@ -0,0 +1,65 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """만료시간(TTL)과 최대 크기를 가진 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize=128, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """값 조회 (만료된 항목은 제거 후 default 반환)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """값 저장 (ttl 미지정 시 기본 TTL 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+
+            # 최대 크기 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """항목 제거"""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[0] if item else default
+
+    def invalidate_where(self, predicate):
+        """조건에 맞는 키의 항목 일괄 제거"""
+        with self._lock:
+            stale_keys = [key for key in self._data if predicate(key)]
+            for key in stale_keys:
+                del self._data[key]
+            return len(stale_keys)
+
+    def clear(self):
+        """전체 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,206 @@
+"""
+대시보드 개요 통계 집계 엔진
+- 도메인(출근/연차/평가/급여)별 조건부 집계 쿼리 1회로 통계 계산
+- 날짜 컬럼은 범위 조건([시작, 끝))으로 조회하여 인덱스 사용 가능
+- 기간(연/월)별 TTL 캐시 및 명시적 무효화 지원
+"""
+
+from flask import current_app
+from sqlalchemy import func, case, select
+
+from ..database import db
+from ..models.employee import Employee
+from ..models.department import Department
+from ..models.attendance import AttendanceRecord
+from ..models.annual_leave_usage import AnnualLeaveUsage
+from ..models.evaluation_simple import Evaluation
+from ..models.payroll import Payroll
+from .cache import TTLCache
+from .period import month_range, year_range, in_range
+
+# 출근 상태값 (관리자 화면은 영문, 기존 데이터는 한글 상태값을 사용)
+LATE_STATUSES = ('late', '지각')
+ABSENT_STATUSES = ('absent', '결근')
+
+DEFAULT_CACHE_TTL = 60  # 초
+
+
+class DashboardOverviewEngine:
+    """대시보드 개요 통계 계산 및 캐시 관리"""
+
+    def __init__(self, maxsize=32):
+        self._cache = TTLCache(maxsize=maxsize, ttl=DEFAULT_CACHE_TTL)
+
+    def get_overview(self, year, month, use_cache=True):
+        """기간별 개요 통계 조회 (캐시 우선)"""
+        key = (year, month)
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        overview = self.compute(year, month)
+        ttl = current_app.config.get('DASHBOARD_OVERVIEW_CACHE_TTL', DEFAULT_CACHE_TTL)
+        self._cache.set(key, overview, ttl=ttl)
+        return overview
+
+    def invalidate(self, year=None, month=None):
+        """캐시 무효화 (연/월 미지정 시 전체)"""
+        if year is None:
+            self._cache.clear()
+            return
+
+        self._cache.invalidate_where(
+            lambda key: key[0] == year and (month is None or key[1] == month)
+        )
+
+    def compute(self, year, month):
+        """개요 통계 계산 (캐시 미사용)"""
+        counts = self._basic_counts()
+        attendance = self._attendance_stats(year, month)
+        annual_leave = self._annual_leave_stats(year)
+        evaluation = self._evaluation_stats(year)
+        payroll = self._payroll_stats(year, month)
+
+        total_employees = counts.total_employees or 0
+        total_records = attendance.total_records or 0
+        absent_count = int(attendance.absent_count or 0)
+        total_used = float(annual_leave.total_used or 0)
+        total_evaluations = evaluation.total_evaluations or 0
+        completed_evaluations = int(evaluation.completed_evaluations or 0)
+
+        return {
+            'overview': {
+                'total_employees': total_employees,
+                'total_departments': counts.total_departments or 0,
+                'current_period': f"{year}년 {month}월"
+            },
+            'attendance': {
+                'total_records': total_records,
+                'avg_work_hours': float(attendance.avg_work_hours or 0),
+                'late_count': int(attendance.late_count or 0),
+                'absent_count': absent_count,
+                'attendance_rate': round((1 - (absent_count / max(total_records, 1))) * 100, 1)
+            },
+            'annual_leave': {
+                'total_used': total_used,
+                'usage_count': annual_leave.usage_count or 0,
+                'avg_per_employee': round(total_used / max(total_employees, 1), 1)
+            },
+            'evaluation': {
+                'total_evaluations': total_evaluations,
+                'completed_evaluations': completed_evaluations,
+                'completion_rate': round((completed_evaluations / max(total_evaluations, 1)) * 100, 1),
+                'avg_score': 0.0  # 평균 점수는 추후 구현
+            },
+            'payroll': {
+                'total_payrolls': payroll.total_payrolls or 0,
+                'total_gross_pay': float(payroll.total_gross_pay or 0),
+                'total_net_pay': float(payroll.total_net_pay or 0),
+                'avg_net_pay': float(payroll.avg_net_pay or 0)
+            }
+        }
+
+    def summary_report(self, year, month=None):
+        """종합 리포트 데이터 (월 미지정 시 연간)"""
+        counts = self._basic_counts()
+        attendance = self._attendance_stats(year, month)
+        evaluation = self._evaluation_stats(year)
+        payroll = self._payroll_stats(year, month)
+
+        total_days = attendance.total_records or 0
+        absent_days = int(attendance.absent_count or 0)
+        total_payrolls = payroll.total_payrolls or 0
+        total_net = float(payroll.total_net_pay or 0)
+        total_evaluations = evaluation.total_evaluations or 0
+        completed = int(evaluation.completed_evaluations or 0)
+
+        return {
+            'period': f"{year}년 {month}월" if month else f"{year}년",
+            'employee': {
+                'total_employees': counts.total_employees or 0,
+                'active_employees': counts.active_employees or 0,
+                'departments': counts.total_departments or 0
+            },
+            'attendance': {
+                'total_days': total_days,
+                'avg_hours': round(float(attendance.avg_work_hours or 0), 1),
+                'late_days': int(attendance.late_count or 0),
+                'absent_days': absent_days,
+                'attendance_rate': round((1 - absent_days / max(total_days, 1)) * 100, 1)
+            },
+            'payroll': {
+                'total_payrolls': total_payrolls,
+                'total_gross': float(payroll.total_payment or 0),
+                'total_net': total_net,
+                'total_deductions': float(payroll.total_deductions or 0),
+                'avg_net': round(total_net / max(total_payrolls, 1), 0)
+            },
+            'evaluation': {
+                'total_evaluations': total_evaluations,
+                'completed': completed,
+                'completion_rate': round(completed / max(total_evaluations, 1) * 100, 1),
+                'avg_score': 0.0  # 평균 점수는 추후 구현
+            }
+        }
+
+    def _basic_counts(self):
+        """직원/부서 수 (스칼라 서브쿼리 1회)"""
+        return db.session.query(
+            select(func.count(Employee.id)).scalar_subquery().label('total_employees'),
+            select(func.count(Employee.id)).where(Employee.status == 'active').scalar_subquery().label('active_employees'),
+            select(func.count(Department.id)).scalar_subquery().label('total_departments')
+        ).one()
+
+    def _attendance_stats(self, year, month):
+        """월간(월 미지정 시 연간) 출근 통계 (조건부 집계)"""
+        start, end = month_range(year, month) if month else year_range(year)
+        return db.session.query(
+            func.count(AttendanceRecord.id).label('total_records'),
+            func.sum(case((AttendanceRecord.status.in_(LATE_STATUSES), 1), else_=0)).label('late_count'),
+            func.sum(case((AttendanceRecord.status.in_(ABSENT_STATUSES), 1), else_=0)).label('absent_count'),
+            func.avg(AttendanceRecord.work_hours).label('avg_work_hours')
+        ).filter(
+            in_range(AttendanceRecord.date, start, end)
+        ).one()
+
+    def _annual_leave_stats(self, year):
+        """연간 연차 사용 통계"""
+        return db.session.query(
+            func.sum(AnnualLeaveUsage.used_days).label('total_used'),
+            func.count(AnnualLeaveUsage.id).label('usage_count')
+        ).filter(
+            in_range(AnnualLeaveUsage.usage_date, *year_range(year))
+        ).one()
+
+    def _evaluation_stats(self, year):
+        """연간 평가 진행 통계"""
+        return db.session.query(
+            func.count(Evaluation.id).label('total_evaluations'),
+            func.sum(case((Evaluation.status == 'completed', 1), else_=0)).label('completed_evaluations')
+        ).filter(
+            in_range(Evaluation.created_at, *year_range(year))
+        ).one()
+
+    def _payroll_stats(self, year, month):
+        """월간(월 미지정 시 연간) 급여 통계"""
+        query = db.session.query(
+            func.count(Payroll.id).label('total_payrolls'),
+            func.sum(Payroll.base_salary).label('total_gross_pay'),
+            func.sum(Payroll.total_payment).label('total_payment'),
+            func.sum(Payroll.total_deductions).label('total_deductions'),
+            func.sum(Payroll.net_pay).label('total_net_pay'),
+            func.avg(Payroll.net_pay).label('avg_net_pay')
+        ).filter(Payroll.year == year)
+        if month:
+            query = query.filter(Payroll.month == month)
+        return query.one()
+
+
+# 프로세스 공용 엔진 인스턴스
+overview_engine = DashboardOverviewEngine()
+
+
+def invalidate_dashboard_overview(year=None, month=None):
+    """대시보드 개요 캐시 무효화 (데이터 변경 시 호출)"""
+    overview_engine.invalidate(year, month)
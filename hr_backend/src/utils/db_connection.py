@@ -0,0 +1,140 @@
+"""
+원시 SQL(sqlite3) 공용 연결 관리
+- SQLALCHEMY_DATABASE_URI(ORM 엔진과 동일한 파일)에 바인딩
+- 요청(앱 컨텍스트)마다 풀에서 연결 1개를 대여하고 종료 시 반납
+- 연결 생성 시 WAL, busy_timeout, mmap_size, cache_size PRAGMA 적용
+- 연결별 prepared statement 캐시 재사용
+"""
+
+import queue
+import sqlite3
+import threading
+
+from flask import current_app, g
+
+from ..database import db
+
+_G_KEY = '_sqlite_connection'
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class SQLiteConnectionPool:
+    """동일 DB 파일에 대한 sqlite3 연결 풀"""
+
+    def __init__(self, path, pool_size=8, cached_statements=256, busy_timeout_ms=5000,
+                 journal_mode='WAL', mmap_size=268435456, cache_size_kb=20000):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.busy_timeout_ms = busy_timeout_ms
+        self.journal_mode = journal_mode
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+
+    def _connect(self):
+        """새 연결 생성 및 PRAGMA 설정"""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.cached_statements,
+            check_same_thread=False  # 풀을 통해 스레드 간 전달 (동시 사용은 하지 않음)
+        )
+        conn.row_factory = sqlite3.Row
+
+        if self.journal_mode:
+            conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout_ms)}')
+        conn.execute(f'PRAGMA mmap_size = {int(self.mmap_size)}')
+        # 음수 값은 KiB 단위 페이지 캐시 크기
+        conn.execute(f'PRAGMA cache_size = -{int(self.cache_size_kb)}')
+        return conn
+
+    def acquire(self):
+        """유휴 연결 대여 (없으면 새로 생성)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn):
+        """연결 반납 (미완료 트랜잭션은 롤백)"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self):
+        """유휴 연결 전체 종료"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _resolve_database_path():
+    """ORM 엔진이 사용하는 SQLite 파일 경로"""
+    path = db.engine.url.database
+    if not path:
+        raise RuntimeError('SQLite 데이터베이스 경로를 확인할 수 없습니다.')
+    return path
+
+
+def get_pool():
+    """현재 앱 설정에 해당하는 연결 풀"""
+    path = _resolve_database_path()
+    pool = _pools.get(path)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            config = current_app.config
+            pool = SQLiteConnectionPool(
+                path,
+                pool_size=config.get('SQLITE_POOL_SIZE', 8),
+                cached_statements=config.get('SQLITE_CACHED_STATEMENTS', 256),
+                busy_timeout_ms=config.get('SQLITE_BUSY_TIMEOUT_MS', 5000),
+                journal_mode=config.get('SQLITE_JOURNAL_MODE', 'WAL'),
+                mmap_size=config.get('SQLITE_MMAP_SIZE', 268435456),
+                cache_size_kb=config.get('SQLITE_CACHE_SIZE_KB', 20000)
+            )
+            _pools[path] = pool
+        return pool
+
+
+def get_db_connection():
+    """현재 앱 컨텍스트의 sqlite3 연결 (컨텍스트 종료 시 자동 반납)"""
+    conn = g.get(_G_KEY)
+    if conn is None:
+        conn = get_pool().acquire()
+        setattr(g, _G_KEY, conn)
+    return conn
+
+
+def release_db_connection(exception=None):
+    """앱 컨텍스트 종료 시 연결 반납"""
+    conn = g.pop(_G_KEY, None)
+    if conn is not None:
+        get_pool().release(conn)
+
+
+def init_app(app):
+    """연결 설정 기본값 및 반납 핸들러 등록"""
+    app.config.setdefault('SQLITE_POOL_SIZE', 8)
+    app.config.setdefault('SQLITE_CACHED_STATEMENTS', 256)
+    app.config.setdefault('SQLITE_BUSY_TIMEOUT_MS', 5000)
+    app.config.setdefault('SQLITE_JOURNAL_MODE', 'WAL')
+    app.config.setdefault('SQLITE_MMAP_SIZE', 268435456)  # 256MB
+    app.config.setdefault('SQLITE_CACHE_SIZE_KB', 20000)  # 약 20MB
+    app.teardown_appcontext(release_db_connection)
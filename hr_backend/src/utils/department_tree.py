@@ -0,0 +1,157 @@
+"""
+부서 계층 클로저 테이블 (department_closure)
+- 모든 조상-자손 쌍을 depth와 함께 저장 (자기 자신 depth=0 포함)
+- 부서 생성/상위 부서 변경/삭제 시 호출자의 트랜잭션 안에서 갱신 (커밋은 호출자가 담당)
+- 하위 부서 전체 조회는 재귀 없이 ancestor_id 조건 1회로 처리
+- 트리/하위 포함 직원 수는 부서 목록 1회 + 클로저-직원 GROUP BY 1회로 조회
+- rebuild_department_closure(): departments.parent_id 기준 전체 재생성
+"""
+
+from sqlalchemy import text, select, func, case, or_
+
+from ..database import db
+from ..models.department import Department, DepartmentClosure
+from ..models.employee import Employee
+from .bulk_write import bulk_insert
+
+INSERT_NODE_SQL = """
+INSERT INTO department_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, :department_id, depth + 1 FROM department_closure WHERE descendant_id = :parent_id
+UNION ALL
+SELECT :department_id, :department_id, 0
+"""
+
+# 이동할 하위 트리와 기존 상위(하위 트리 밖) 조상 사이의 연결 제거
+DETACH_SUBTREE_SQL = """
+DELETE FROM department_closure
+WHERE descendant_id IN (SELECT descendant_id FROM department_closure WHERE ancestor_id = :department_id)
+  AND ancestor_id NOT IN (SELECT descendant_id FROM department_closure WHERE ancestor_id = :department_id)
+"""
+
+# 새 상위 부서의 조상 × 하위 트리 전체 연결
+ATTACH_SUBTREE_SQL = """
+INSERT INTO department_closure (ancestor_id, descendant_id, depth)
+SELECT parent.ancestor_id, child.descendant_id, parent.depth + child.depth + 1
+FROM department_closure parent, department_closure child
+WHERE parent.descendant_id = :parent_id AND child.ancestor_id = :department_id
+"""
+
+
+def _ids(department_ids):
+    if isinstance(department_ids, int):
+        return [department_ids]
+    return [int(department_id) for department_id in department_ids]
+
+
+def insert_department_node(department_id, parent_id=None):
+    """새 부서를 parent_id 하위에 추가"""
+    db.session.execute(text(INSERT_NODE_SQL), {'department_id': department_id, 'parent_id': parent_id})
+
+
+def move_department_subtree(department_id, new_parent_id=None):
+    """부서와 하위 부서 전체를 new_parent_id 하위로 이동 (순환 여부는 호출자가 is_descendant로 확인)"""
+    params = {'department_id': department_id, 'parent_id': new_parent_id}
+    db.session.execute(text(DETACH_SUBTREE_SQL), params)
+    if new_parent_id is not None:
+        db.session.execute(text(ATTACH_SUBTREE_SQL), params)
+
+
+def delete_department_node(department_id):
+    """부서의 클로저 행 제거 (하위 부서가 없는 부서만 삭제 가능)"""
+    db.session.query(DepartmentClosure).filter(or_(
+        DepartmentClosure.ancestor_id == department_id,
+        DepartmentClosure.descendant_id == department_id
+    )).delete(synchronize_session=False)
+
+
+def is_descendant(department_id, ancestor_id):
+    """department_id가 ancestor_id 자신 또는 하위 부서인지 여부"""
+    return db.session.query(DepartmentClosure.depth).filter(
+        DepartmentClosure.ancestor_id == ancestor_id,
+        DepartmentClosure.descendant_id == department_id
+    ).first() is not None
+
+
+def subtree_select(department_ids):
+    """department_ids 자신과 하위 부서 ID 서브쿼리"""
+    return select(DepartmentClosure.descendant_id).where(
+        DepartmentClosure.ancestor_id.in_(_ids(department_ids))
+    )
+
+
+def subtree_filter(column, department_ids):
+    """부서 ID 컬럼이 department_ids 하위 트리에 속하는 조건 (예: Employee.department_id)"""
+    return column.in_(subtree_select(department_ids))
+
+
+def subtree_ids(department_id):
+    """부서 자신과 하위 부서 ID 목록"""
+    return [row[0] for row in db.session.execute(subtree_select(department_id))]
+
+
+def department_employee_counts(department_ids=None):
+    """부서별 (소속 직원 수, 하위 부서 포함 직원 수) (department_ids 지정 시 해당 부서만)"""
+    query = db.session.query(
+        DepartmentClosure.ancestor_id,
+        func.sum(case((DepartmentClosure.depth == 0, 1), else_=0)),
+        func.count(Employee.id)
+    ).join(
+        Employee, Employee.department_id == DepartmentClosure.descendant_id
+    )
+    if department_ids is not None:
+        query = query.filter(DepartmentClosure.ancestor_id.in_(_ids(department_ids)))
+    return {
+        department_id: (int(direct), int(total))
+        for department_id, direct, total in query.group_by(DepartmentClosure.ancestor_id)
+    }
+
+
+def department_tree(include_inactive=False):
+    """부서 트리 (최상위 부서 목록, 하위 부서는 활성 부서만 포함)"""
+    counts = department_employee_counts()
+    nodes = {}
+    children = {}
+    roots = []
+    for department in Department.query.order_by(Department.id):
+        direct, total = counts.get(department.id, (0, 0))
+        nodes[department.id] = {
+            'id': department.id,
+            'name': department.name,
+            'code': department.code,
+            'parent_id': department.parent_id,
+            'manager_id': department.manager_id,
+            'employee_count': direct,
+            'subtree_employee_count': total,
+            'children': []
+        }
+        if department.parent_id is None:
+            if include_inactive or department.is_active:
+                roots.append(department)
+        elif department.is_active:
+            children.setdefault(department.parent_id, []).append(department.id)
+
+    for parent_id, child_ids in children.items():
+        if parent_id in nodes:
+            nodes[parent_id]['children'] = [nodes[child_id] for child_id in child_ids]
+
+    roots.sort(key=lambda department: department.name)
+    return [nodes[department.id] for department in roots]
+
+
+def rebuild_department_closure():
+    """departments.parent_id 기준 클로저 테이블 재생성 후 커밋, 생성 행 수 반환"""
+    parents = dict(db.session.query(Department.id, Department.parent_id))
+
+    rows = []
+    for department_id in parents:
+        ancestor_id, depth, seen = department_id, 0, set()
+        # 잘못된 순환 참조가 있어도 무한 루프 없이 중단
+        while ancestor_id is not None and ancestor_id in parents and ancestor_id not in seen:
+            seen.add(ancestor_id)
+            rows.append({'ancestor_id': ancestor_id, 'descendant_id': department_id, 'depth': depth})
+            ancestor_id, depth = parents[ancestor_id], depth + 1
+
+    db.session.query(DepartmentClosure).delete(synchronize_session=False)
+    bulk_insert(DepartmentClosure, rows)
+    db.session.commit()
+    return len(rows)
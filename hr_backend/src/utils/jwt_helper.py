@@ -1,8 +1,44 @@
 import jwt
+import time
 from datetime import datetime, timedelta
 from functools import wraps
-from flask import request, jsonify, current_app
+from flask import request, jsonify, current_app, g, has_app_context
 from src.models.user import User
+from src.utils.db_connection import get_db_connection
+from src.utils.cache import TTLCache
+
+# 디코딩된 토큰 / 사용자·직원 조회 결과 프로세스 캐시 (항목 TTL은 토큰 만료시각 이내)
+DEFAULT_TOKEN_CACHE_TTL = 300
+DEFAULT_USER_CACHE_TTL = 60
+
+_token_cache = TTLCache(maxsize=4096, ttl=DEFAULT_TOKEN_CACHE_TTL)
+_user_cache = TTLCache(maxsize=1024, ttl=DEFAULT_USER_CACHE_TTL)
+_employee_cache = TTLCache(maxsize=1024, ttl=DEFAULT_USER_CACHE_TTL)
+
+def _ttl_until(exp, limit):
+    """토큰 만료시각을 넘지 않는 캐시 TTL"""
+    if exp is None:
+        return limit
+    return min(limit, exp - time.time())
+
+def _user_cache_ttl():
+    """현재 요청 토큰 기준 사용자/직원 캐시 TTL"""
+    limit = current_app.config.get('AUTH_USER_CACHE_TTL', DEFAULT_USER_CACHE_TTL)
+    return _ttl_until(getattr(request, 'current_token_exp', None), limit)
+
+def invalidate_auth_cache(user_id=None):
+    """사용자/직원 캐시 무효화 (프로필, 역할, 부서 변경 시 호출 / user_id 미지정 시 전체)"""
+    if user_id is None:
+        _user_cache.clear()
+        _employee_cache.clear()
+    else:
+        _user_cache.pop(user_id)
+        _employee_cache.pop(user_id)
+    
+    # 같은 요청 안에서 변경 후 다시 조회하는 경우
+    if has_app_context():
+        g.pop('_current_user', None)
+        g.pop('_current_employee', None)
 
 def create_access_token(user_id, role, username):
     """액세스 토큰 생성"""
@@ -36,18 +72,27 @@ def create_refresh_token(user_id):
     )
 
 def verify_token(token):
-    """토큰 검증"""
+    """토큰 검증 (검증된 토큰은 만료 전까지 캐시)"""
+    secret = current_app.config['JWT_SECRET_KEY']
+    cache_key = (secret, token)
+    payload = _token_cache.get(cache_key)
+    if payload is not None:
+        return dict(payload)
+    
     try:
         payload = jwt.decode(
             token, 
-            current_app.config['JWT_SECRET_KEY'], 
+            secret, 
             algorithms=['HS256']
         )
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
+    
+    limit = current_app.config.get('AUTH_TOKEN_CACHE_TTL', DEFAULT_TOKEN_CACHE_TTL)
+    _token_cache.set(cache_key, payload, ttl=_ttl_until(payload.get('exp'), limit))
+    return dict(payload)
 
 def verify_refresh_token(token):
     """리프레시 토큰 검증"""
@@ -92,6 +137,7 @@ def jwt_required(f):
         request.current_user_id = payload.get('user_id')
         request.current_user_role = payload.get('role')
         request.current_user_username = payload.get('username')
+        request.current_token_exp = payload.get('exp')
         
         return f(*args, **kwargs)
     
@@ -112,20 +158,24 @@ def get_current_user():
         if not user_id:
             return None
         
-        # 데이터베이스에서 사용자 정보 조회
-        import sqlite3
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-        user = cursor.fetchone()
-        
-        conn.close()
+        # 요청 내 메모 -> 프로세스 캐시 -> 데이터베이스 순으로 조회
+        user = g.get('_current_user')
+        if user is None:
+            user = _user_cache.get(user_id)
+        if user is None:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            
+            user = dict(row)
+            _user_cache.set(user_id, user, ttl=_user_cache_ttl())
         
-        if user:
-            return dict(user)
-        return None
+        g._current_user = user
+        return dict(user)
         
     except Exception:
         return None
@@ -161,24 +211,29 @@ def get_current_employee():
         if not user_id:
             return None
         
-        import sqlite3
-        conn = sqlite3.connect('src/database/app.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT e.*, d.name as department_name 
-            FROM employees e 
-            LEFT JOIN departments d ON e.department_id = d.id 
-            WHERE e.user_id = ?
-        ''', (user_id,))
-        employee = cursor.fetchone()
-        
-        conn.close()
+        # 요청 내 메모 -> 프로세스 캐시 -> 데이터베이스 순으로 조회
+        employee = g.get('_current_employee')
+        if employee is None:
+            employee = _employee_cache.get(user_id)
+        if employee is None:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT e.*, d.name as department_name 
+                FROM employees e 
+                LEFT JOIN departments d ON e.department_id = d.id 
+                WHERE e.user_id = ?
+            ''', (user_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            
+            employee = dict(row)
+            _employee_cache.set(user_id, employee, ttl=_user_cache_ttl())
         
-        if employee:
-            return dict(employee)
-        return None
+        g._current_employee = employee
+        return dict(employee)
         
     except Exception:
         return None
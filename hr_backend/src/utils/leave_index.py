@@ -0,0 +1,253 @@
+"""
+휴가 구간 인덱스 (메모리)
+- 대기/승인 상태의 연차 신청(annual_leave_requests)과 휴가 신청(leave_requests)을 직원별 구간 목록으로 보관
+- 직원별 목록은 시작일 정렬 + 종료일 누적 최대값을 유지하여 겹침 검사를 이진 탐색으로 처리 (O(log n))
+- 부서 단위 "부재자" 조회도 같은 인덱스 사용 (DB 재조회 없음)
+- 이 프로세스의 변경은 커밋 후 sync()로 즉시 반영, 다른 프로세스 변경은 LEAVE_INDEX_TTL 주기로 전체 재적재
+- 신청 저장 경로는 find_overlap_for_write()로 인덱스 확인 후 같은 트랜잭션에서 DB 겹침 조회로 재확인
+  (다른 프로세스가 TTL 내에 저장한 신청도 중복으로 판정)
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date
+
+from flask import current_app, has_app_context
+from sqlalchemy import text
+
+from ..database import db
+
+DEFAULT_INDEX_TTL = 300  # 초
+
+# source: 'annual' (annual_leave_requests) / 'leave' (leave_requests)
+LeaveInterval = namedtuple('LeaveInterval', 'start end source request_id leave_type status days')
+
+ACTIVE_STATUSES = {
+    'annual': ('pending', 'approved'),
+    'leave': ('대기', '승인')
+}
+
+# 직원의 [start, end]와 겹치는 대기/승인 신청 1건 (employee_id, start_date, end_date 인덱스 사용)
+OVERLAP_SQL = """
+SELECT start_date, end_date, 'annual', id, leave_type, status, total_days FROM annual_leave_requests
+WHERE employee_id = :employee_id AND start_date <= :end AND end_date >= :start
+  AND status IN ('pending', 'approved') AND NOT (:exclude_source = 'annual' AND id = :exclude_id)
+UNION ALL
+SELECT start_date, end_date, 'leave', id, type, status, days_requested FROM leave_requests
+WHERE employee_id = :employee_id AND start_date <= :end AND end_date >= :start
+  AND status IN ('대기', '승인') AND NOT (:exclude_source = 'leave' AND id = :exclude_id)
+LIMIT 1
+"""
+
+
+def interval_dict(interval):
+    """구간 -> 응답 dict"""
+    return {
+        'source': interval.source,
+        'request_id': interval.request_id,
+        'start_date': interval.start.isoformat(),
+        'end_date': interval.end.isoformat(),
+        'leave_type': interval.leave_type,
+        'status': interval.status,
+        'days': interval.days
+    }
+
+
+class EmployeeLeaveIntervals:
+    """직원 1명의 휴가 구간 (시작일 정렬, 종료일 누적 최대값)"""
+
+    __slots__ = ('entries', 'starts', 'max_ends')
+
+    def __init__(self):
+        self.entries = []
+        self.starts = []
+        self.max_ends = []
+
+    def _rebuild_from(self, position):
+        del self.max_ends[position:]
+        for entry in self.entries[position:]:
+            self.max_ends.append(max(self.max_ends[-1], entry.end) if self.max_ends else entry.end)
+
+    def add(self, interval):
+        position = bisect_right(self.starts, interval.start)
+        self.entries.insert(position, interval)
+        self.starts.insert(position, interval.start)
+        self._rebuild_from(position)
+
+    def discard(self, source, request_id):
+        for position, entry in enumerate(self.entries):
+            if entry.source == source and entry.request_id == request_id:
+                del self.entries[position]
+                del self.starts[position]
+                self._rebuild_from(position)
+                return True
+        return False
+
+    def overlapping(self, start, end, exclude=None):
+        """[start, end]와 겹치는 구간 (시작일 역순)
+
+        시작일 <= end인 구간은 이진 탐색으로 찾고, 누적 최대 종료일이 start보다 작아지면 중단
+        """
+        position = bisect_right(self.starts, end) - 1
+        while position >= 0 and self.max_ends[position] >= start:
+            entry = self.entries[position]
+            if entry.end >= start and (entry.source, entry.request_id) != exclude:
+                yield entry
+            position -= 1
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LeaveIntervalIndex:
+    """직원별 휴가 구간 인덱스"""
+
+    def __init__(self):
+        self._employees = {}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def _ttl(self):
+        if has_app_context():
+            return current_app.config.get('LEAVE_INDEX_TTL', DEFAULT_INDEX_TTL)
+        return DEFAULT_INDEX_TTL
+
+    def _load(self):
+        """대기/승인 구간 전체 적재 (테이블별 쿼리 1회)"""
+        from ..models.annual_leave_request import AnnualLeaveRequest
+        from ..models.leave_request import LeaveRequest
+
+        employees = {}
+        annual_rows = db.session.query(
+            AnnualLeaveRequest.employee_id, AnnualLeaveRequest.start_date, AnnualLeaveRequest.end_date,
+            AnnualLeaveRequest.id, AnnualLeaveRequest.leave_type, AnnualLeaveRequest.status,
+            AnnualLeaveRequest.total_days
+        ).filter(AnnualLeaveRequest.status.in_(ACTIVE_STATUSES['annual']))
+        leave_rows = db.session.query(
+            LeaveRequest.employee_id, LeaveRequest.start_date, LeaveRequest.end_date,
+            LeaveRequest.id, LeaveRequest.type, LeaveRequest.status, LeaveRequest.days_requested
+        ).filter(LeaveRequest.status.in_(ACTIVE_STATUSES['leave']))
+
+        intervals = []
+        for source, rows in (('annual', annual_rows), ('leave', leave_rows)):
+            for employee_id, start, end, request_id, leave_type, status, days in rows:
+                intervals.append((employee_id, LeaveInterval(start, end, source, request_id, leave_type, status, days)))
+
+        # 시작일 순으로 추가하면 직원별 목록이 정렬 상태로 쌓임
+        intervals.sort(key=lambda item: item[1].start)
+        for employee_id, interval in intervals:
+            employees.setdefault(employee_id, EmployeeLeaveIntervals()).add(interval)
+
+        self._employees = employees
+        self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None or time.monotonic() - self._loaded_at >= self._ttl():
+            self._load()
+
+    def invalidate(self):
+        """인덱스 무효화 (다음 조회 시 전체 재적재)"""
+        with self._lock:
+            self._employees = {}
+            self._loaded_at = None
+
+    def add(self, employee_id, interval):
+        """구간 추가/교체 (적재 전이면 다음 적재에 포함되므로 무시)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            intervals = self._employees.setdefault(employee_id, EmployeeLeaveIntervals())
+            intervals.discard(interval.source, interval.request_id)
+            intervals.add(interval)
+
+    def discard(self, employee_id, source, request_id):
+        """구간 제거"""
+        with self._lock:
+            intervals = self._employees.get(employee_id)
+            if intervals is not None:
+                intervals.discard(source, request_id)
+
+    def sync(self, leave_request):
+        """신청 객체의 현재 상태를 인덱스에 반영 (커밋 후 호출, 삭제된 신청은 discard 사용)"""
+        from ..models.annual_leave_request import AnnualLeaveRequest
+
+        if isinstance(leave_request, AnnualLeaveRequest):
+            source = 'annual'
+            interval = LeaveInterval(
+                leave_request.start_date, leave_request.end_date, source, leave_request.id,
+                leave_request.leave_type, leave_request.status, leave_request.total_days
+            )
+        else:
+            source = 'leave'
+            interval = LeaveInterval(
+                leave_request.start_date, leave_request.end_date, source, leave_request.id,
+                leave_request.type, leave_request.status, leave_request.days_requested
+            )
+
+        if leave_request.status in ACTIVE_STATUSES[source]:
+            self.add(leave_request.employee_id, interval)
+        else:
+            self.discard(leave_request.employee_id, source, leave_request.id)
+
+    def find_overlap(self, employee_id, start, end, exclude=None):
+        """직원의 [start, end]와 겹치는 대기/승인 휴가 1건 (없으면 None)
+
+        exclude: 제외할 (source, request_id) - 수정 중인 신청 자신
+        """
+        with self._lock:
+            self._ensure_loaded()
+            intervals = self._employees.get(employee_id)
+            if intervals is None:
+                return None
+            return next(intervals.overlapping(start, end, exclude), None)
+
+    def find_overlap_for_write(self, employee_id, start, end, exclude=None, cursor=None):
+        """신청 저장 전 겹침 확인: 인덱스로 먼저 확인하고, 없으면 DB에서 재확인 (없으면 None)
+
+        cursor 지정 시 원시 연결에서 조회 (INSERT와 같은 트랜잭션)
+        DB에서만 발견되면 인덱스가 오래된 것이므로 무효화
+        """
+        found = self.find_overlap(employee_id, start, end, exclude)
+        if found:
+            return found
+
+        source, request_id = exclude or ('', 0)
+        params = {
+            'employee_id': employee_id,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'exclude_source': source,
+            'exclude_id': request_id
+        }
+        if cursor is not None:
+            cursor.execute(OVERLAP_SQL, params)
+            row = cursor.fetchone()
+        else:
+            row = db.session.execute(text(OVERLAP_SQL), params).first()
+        if row is None:
+            return None
+
+        self.invalidate()
+        row_start, row_end = (value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+                              for value in row[:2])
+        return LeaveInterval(row_start, row_end, *row[2:])
+
+    def employees_out(self, start, end, employee_ids=None):
+        """[start, end] 기간 휴가자 {employee_id: [구간, ...]} (employee_ids 지정 시 해당 직원만)"""
+        with self._lock:
+            self._ensure_loaded()
+            candidates = self._employees.keys() if employee_ids is None else employee_ids
+            result = {}
+            for employee_id in candidates:
+                intervals = self._employees.get(employee_id)
+                if not intervals:
+                    continue
+                found = sorted(intervals.overlapping(start, end), key=lambda entry: entry.start)
+                if found:
+                    result[employee_id] = found
+            return result
+
+
+leave_index = LeaveIntervalIndex()
@@ -0,0 +1,162 @@
+"""
+연차 잔여 원장 (annual_leave_balances)
+- 부여/사용/신청/승인/반려/삭제 시 호출자의 트랜잭션 안에서 직원·연도별 합계를 증감 (UPSERT)
+- 잔여일수 조회는 원장 행만 읽음 (부여/사용/대기 SUM 쿼리 불필요)
+- reconcile_leave_balances(): 원본 테이블 재집계와 비교하여 불일치 탐지/보정
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text, func, extract
+
+from ..database import db
+
+# ORM 세션(text)과 sqlite3 커서 모두에서 사용하는 이름 기반 파라미터 SQL
+ADJUST_SQL = """
+INSERT INTO annual_leave_balances (employee_id, year, granted_days, used_days, pending_days, updated_at)
+VALUES (:employee_id, :year, :granted, :used, :pending, :updated_at)
+ON CONFLICT (employee_id, year) DO UPDATE SET
+    granted_days = granted_days + excluded.granted_days,
+    used_days = used_days + excluded.used_days,
+    pending_days = pending_days + excluded.pending_days,
+    updated_at = excluded.updated_at
+"""
+
+BALANCE_SQL = """
+SELECT granted_days, used_days, pending_days FROM annual_leave_balances
+WHERE employee_id = :employee_id AND year = :year
+"""
+
+BALANCE_FIELDS = ('granted_days', 'used_days', 'pending_days')
+TOLERANCE = 1e-9
+
+
+def _adjust_params(employee_id, year, granted=0.0, used=0.0, pending=0.0):
+    return {
+        'employee_id': employee_id,
+        'year': year,
+        'granted': float(granted),
+        'used': float(used),
+        'pending': float(pending),
+        'updated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
+    }
+
+
+def adjust_leave_balance(employee_id, year, granted=0.0, used=0.0, pending=0.0, cursor=None):
+    """원장 증감 (cursor 지정 시 원시 연결, 아니면 현재 세션 트랜잭션에서 실행)"""
+    params = _adjust_params(employee_id, year, granted, used, pending)
+    if cursor is not None:
+        cursor.execute(ADJUST_SQL, params)
+    else:
+        db.session.execute(text(ADJUST_SQL), params)
+
+
+def adjust_leave_balances(changes):
+    """여러 직원 원장 일괄 증감 (changes: employee_id/year/granted/used/pending dict, executemany)"""
+    params = [_adjust_params(**change) for change in changes]
+    if params:
+        db.session.execute(text(ADJUST_SQL), params)
+
+
+def record_grant(grant):
+    """연차 부여 반영"""
+    adjust_leave_balance(grant.employee_id, grant.year, granted=grant.total_days)
+
+
+def record_usage(usage, sign=1):
+    """연차 사용 반영 (sign=-1: 사용 기록 삭제)"""
+    adjust_leave_balance(usage.employee_id, usage.usage_date.year, used=sign * usage.used_days)
+
+
+def record_pending(leave_request, sign=1):
+    """대기중 연차 신청 반영 (sign=-1: 승인/반려/삭제로 대기 해제)"""
+    adjust_leave_balance(leave_request.employee_id, leave_request.start_date.year,
+                         pending=sign * leave_request.total_days)
+
+
+def get_leave_balance(employee_id, year, cursor=None):
+    """직원의 해당 연도 원장 (없으면 0, cursor 지정 시 원시 연결에서 조회)"""
+    from ..models.annual_leave_balance import AnnualLeaveBalance
+
+    if cursor is not None:
+        cursor.execute(BALANCE_SQL, {'employee_id': employee_id, 'year': year})
+        row = cursor.fetchone()
+        values = {field: row[index] if row else 0.0 for index, field in enumerate(BALANCE_FIELDS)}
+    else:
+        balance = AnnualLeaveBalance.query.filter_by(employee_id=employee_id, year=year).first()
+        values = {field: getattr(balance, field) if balance else 0.0 for field in BALANCE_FIELDS}
+    values['remaining_days'] = values['granted_days'] - values['used_days'] - values['pending_days']
+    return values
+
+
+def get_total_remaining_days(employee_id):
+    """직원의 전체 연도 잔여일수 합계 (대기중 신청 차감)"""
+    from ..models.annual_leave_balance import AnnualLeaveBalance
+
+    return db.session.query(func.coalesce(func.sum(
+        AnnualLeaveBalance.granted_days - AnnualLeaveBalance.used_days - AnnualLeaveBalance.pending_days
+    ), 0.0)).filter(AnnualLeaveBalance.employee_id == employee_id).scalar()
+
+
+def _expected_balances():
+    """원본 테이블 기준 직원·연도별 부여/사용/대기 합계"""
+    from ..models.annual_leave_grant import AnnualLeaveGrant
+    from ..models.annual_leave_usage import AnnualLeaveUsage
+    from ..models.annual_leave_request import AnnualLeaveRequest
+
+    expected = {}
+
+    def add(rows, index):
+        for employee_id, year, days in rows:
+            expected.setdefault((employee_id, int(year)), [0.0, 0.0, 0.0])[index] += float(days or 0)
+
+    add(db.session.query(
+        AnnualLeaveGrant.employee_id, AnnualLeaveGrant.year, func.sum(AnnualLeaveGrant.total_days)
+    ).group_by(AnnualLeaveGrant.employee_id, AnnualLeaveGrant.year).all(), 0)
+
+    usage_year = extract('year', AnnualLeaveUsage.usage_date)
+    add(db.session.query(
+        AnnualLeaveUsage.employee_id, usage_year, func.sum(AnnualLeaveUsage.used_days)
+    ).group_by(AnnualLeaveUsage.employee_id, usage_year).all(), 1)
+
+    request_year = extract('year', AnnualLeaveRequest.start_date)
+    add(db.session.query(
+        AnnualLeaveRequest.employee_id, request_year, func.sum(AnnualLeaveRequest.total_days)
+    ).filter(
+        AnnualLeaveRequest.status == 'pending'
+    ).group_by(AnnualLeaveRequest.employee_id, request_year).all(), 2)
+
+    return expected
+
+
+def reconcile_leave_balances(repair=False):
+    """원장과 원본 재집계 비교, 불일치 목록 반환 (repair=True면 원본 기준으로 보정 후 커밋)"""
+    from ..models.annual_leave_balance import AnnualLeaveBalance
+
+    expected = _expected_balances()
+    balances = {(balance.employee_id, balance.year): balance for balance in AnnualLeaveBalance.query.all()}
+
+    drift = []
+    for key in sorted(set(expected) | set(balances)):
+        values = expected.get(key, [0.0, 0.0, 0.0])
+        balance = balances.get(key)
+        actual = [getattr(balance, field) for field in BALANCE_FIELDS] if balance else [0.0, 0.0, 0.0]
+        if all(abs(a - b) <= TOLERANCE for a, b in zip(actual, values)):
+            continue
+
+        drift.append({
+            'employee_id': key[0],
+            'year': key[1],
+            'expected': dict(zip(BALANCE_FIELDS, values)),
+            'actual': dict(zip(BALANCE_FIELDS, actual)) if balance else None
+        })
+        if repair:
+            if balance is None:
+                balance = AnnualLeaveBalance(employee_id=key[0], year=key[1])
+                db.session.add(balance)
+            for field, value in zip(BALANCE_FIELDS, values):
+                setattr(balance, field, value)
+
+    if repair and drift:
+        db.session.commit()
+    return drift
@@ -0,0 +1,75 @@
+"""
+키셋(커서) 페이지네이션
+- OFFSET 대신 마지막 행의 정렬 키 (예: created_at, id) 이후를 조회하여 깊은 페이지도 인덱스 탐색으로 처리
+- 커서는 정렬 키 값을 JSON + base64로 인코딩한 불투명 문자열
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import tuple_, Date, DateTime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values):
+    """정렬 키 값 목록을 커서 문자열로 인코딩"""
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, columns):
+    """커서 문자열을 컬럼 타입에 맞는 값 목록으로 디코딩 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError('잘못된 커서입니다.')
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError('잘못된 커서입니다.')
+
+    decoded = []
+    for column, value in zip(columns, values):
+        try:
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError('잘못된 커서입니다.')
+        decoded.append(value)
+    return decoded
+
+
+def page_size(value, default=DEFAULT_PAGE_SIZE):
+    """요청 페이지 크기 보정 (1 ~ MAX_PAGE_SIZE)"""
+    return max(1, min(value or default, MAX_PAGE_SIZE))
+
+
+def keyset_page(query, columns, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """columns 내림차순 키셋 페이지 조회 -> (항목 목록, 다음 커서 또는 None)
+
+    columns의 마지막 항목은 id처럼 유일한 컬럼이어야 함
+    """
+    if cursor:
+        query = query.filter(tuple_(*columns) < tuple(decode_cursor(cursor, columns)))
+
+    items = query.order_by(*(column.desc() for column in columns)).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    return items, encode_cursor([getattr(items[-1], column.key) for column in columns])
+
+
+def flag_arg(value, default=False):
+    """쿼리 파라미터 불리언 해석 (1/true/yes/on)"""
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
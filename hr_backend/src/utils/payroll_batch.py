@@ -0,0 +1,236 @@
+"""
+월말 급여 일괄 생성 배치
+- 재직 직원 전체의 급여를 기본급, 출퇴근 연장근무시간, 세금/보험 규칙으로 계산
+- 계산은 청크 단위(설정 시 프로세스 풀 병렬), 저장은 청크 단위 트랜잭션
+- 작업 진행 상황은 프로세스 내 작업 레지스트리에서 조회 (완료/실패 작업은 보관 기간 후 제거)
+"""
+
+import multiprocessing
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+from ..database import db
+from ..models.payroll_record import calculate_tax_and_insurance_amounts
+from .bulk_write import iter_chunks, bulk_insert
+from .attendance_summary import monthly_payroll_attendance
+
+# 통상임금 산정 기준 월 소정근로시간 / 연장근무 가산율
+MONTHLY_STANDARD_HOURS = 209
+OVERTIME_RATE = 1.5
+
+DEFAULT_JOB_RETENTION_SECONDS = 24 * 60 * 60
+FINISHED_STATUSES = ('completed', 'failed')
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def _won(value):
+    """원 단위 반올림 Decimal"""
+    return Decimal(int(round(value)))
+
+
+def compute_payroll_row(employee_id, base_salary, overtime_hours, work_days):
+    """직원 1명의 급여 항목 계산 (순수 함수)"""
+    base_salary = float(base_salary or 0)
+    overtime_hours = float(overtime_hours or 0)
+
+    hourly_wage = base_salary / MONTHLY_STANDARD_HOURS
+    overtime_pay = hourly_wage * OVERTIME_RATE * overtime_hours
+    gross_pay = base_salary + overtime_pay
+
+    amounts = calculate_tax_and_insurance_amounts(base_salary, overtime_pay, gross_pay)
+
+    row = {
+        'employee_id': employee_id,
+        'base_salary': _won(base_salary),
+        'overtime_pay': _won(overtime_pay),
+        'income_tax': _won(max(amounts['income_tax'], 0)),
+        'resident_tax': _won(max(amounts['local_tax'], 0)),
+        'national_pension': _won(amounts['national_pension']),
+        'health_insurance': _won(amounts['health_insurance']),
+        'employment_insurance': _won(amounts['employment_insurance']),
+        'long_term_care': _won(amounts['long_term_care']),
+        'work_days': work_days,
+        'overtime_hours': Decimal(str(round(overtime_hours, 2)))
+    }
+
+    row['total_payment'] = row['base_salary'] + row['overtime_pay']
+    row['total_deductions'] = (
+        row['income_tax'] + row['resident_tax'] + row['national_pension'] +
+        row['health_insurance'] + row['employment_insurance'] + row['long_term_care']
+    )
+    row['net_pay'] = row['total_payment'] - row['total_deductions']
+    return row
+
+
+def compute_payroll_chunk(payloads):
+    """직원 묶음 급여 계산 (프로세스 풀 작업 단위)"""
+    return [compute_payroll_row(*payload) for payload in payloads]
+
+
+def load_payroll_inputs(year, month):
+    """급여 미생성 재직 직원의 계산 입력값 조회 (쿼리 3회)"""
+    from ..models.employee import Employee
+    from ..models.payroll import Payroll
+
+    # 연장근무시간 / 근무일수 (월별 출퇴근 집계)
+    attendance = monthly_payroll_attendance(year, month)
+
+    existing = {
+        row.employee_id for row in db.session.query(Payroll.employee_id).filter_by(year=year, month=month)
+    }
+
+    payloads = []
+    skipped = 0
+    for employee in db.session.query(Employee.id, Employee.salary).filter_by(status='active').order_by(Employee.id):
+        if employee.id in existing:
+            skipped += 1
+            continue
+        overtime_hours, work_days = attendance.get(employee.id, (0, 0))
+        payloads.append((employee.id, employee.salary, overtime_hours, int(work_days or 0)))
+
+    return payloads, skipped
+
+
+def _update_job(job_id, **fields):
+    with _jobs_lock:
+        _jobs[job_id].update(fields)
+
+
+def _finish_job(job_id, status, **fields):
+    _update_job(job_id, status=status, finished_at=datetime.utcnow().isoformat(), finished_ts=time.time(), **fields)
+
+
+def _public(job):
+    """응답용 작업 정보 (내부 필드 제외)"""
+    return {key: value for key, value in job.items() if key != 'finished_ts'}
+
+
+def evict_jobs(retention=DEFAULT_JOB_RETENTION_SECONDS):
+    """보관 기간이 지난 완료/실패 작업을 레지스트리에서 제거"""
+    now = time.time()
+    with _jobs_lock:
+        expired = [
+            job_id for job_id, job in _jobs.items()
+            if job['status'] in FINISHED_STATUSES and now - job['finished_ts'] > retention
+        ]
+        for job_id in expired:
+            del _jobs[job_id]
+    return len(expired)
+
+
+def get_job(job_id):
+    """작업 상태 조회"""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return _public(job) if job else None
+
+
+def start_payroll_batch(app, year, month, created_by):
+    """급여 일괄 생성 작업 시작 (동일 연월 작업 진행 중이면 기존 작업 반환)"""
+    evict_jobs(app.config.get('PAYROLL_BATCH_JOB_RETENTION_SECONDS', DEFAULT_JOB_RETENTION_SECONDS))
+
+    with _jobs_lock:
+        for job in _jobs.values():
+            if job['year'] == year and job['month'] == month and job['status'] in ('queued', 'running'):
+                return _public(job), False
+
+        job_id = uuid.uuid4().hex
+        _jobs[job_id] = {
+            'id': job_id,
+            'year': year,
+            'month': month,
+            'status': 'queued',
+            'total': 0,
+            'computed': 0,
+            'written': 0,
+            'skipped': 0,
+            'error': None,
+            'created_by': created_by,
+            'created_at': datetime.utcnow().isoformat(),
+            'finished_at': None
+        }
+        job = _public(_jobs[job_id])
+
+    thread = threading.Thread(
+        target=_run_payroll_batch, args=(app, job_id, year, month, created_by), daemon=True
+    )
+    thread.start()
+    return job, True
+
+
+def _compute_all(payloads, workers, chunk_size, parallel_min_rows):
+    """계산 결과를 청크 단위로 순서대로 생성 (대상이 적으면 현재 프로세스에서 계산)"""
+    chunks = list(iter_chunks(payloads, chunk_size))
+    # 프로세스 기동 비용(약 1~2초)보다 계산량이 적으면 병렬화하지 않음
+    if workers <= 1 or len(chunks) <= 1 or len(payloads) < parallel_min_rows:
+        for chunk in chunks:
+            yield compute_payroll_chunk(chunk)
+        return
+
+    # 스레드가 있는 서버 프로세스에서 fork 대신 spawn 사용
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as executor:
+        for rows in executor.map(compute_payroll_chunk, chunks):
+            yield rows
+
+
+def _run_payroll_batch(app, job_id, year, month, created_by):
+    """급여 일괄 생성 실행 (백그라운드 스레드)"""
+    from ..models.payroll import Payroll
+    from .audit import log_action
+    from .dashboard_overview import invalidate_dashboard_overview
+
+    with app.app_context():
+        try:
+            _update_job(job_id, status='running')
+
+            payloads, skipped = load_payroll_inputs(year, month)
+            _update_job(job_id, total=len(payloads), skipped=skipped)
+
+            # 현재 세율 규칙은 계산량이 작아 기본은 현재 프로세스 계산 (규칙이 무거워지면 워커 수 조정)
+            workers = app.config.get('PAYROLL_BATCH_WORKERS', 1)
+            chunk_size = app.config.get('PAYROLL_BATCH_CHUNK_SIZE', 1000)
+            parallel_min_rows = app.config.get('PAYROLL_BATCH_PARALLEL_MIN_ROWS', 50000)
+
+            computed = 0
+            written = 0
+            for rows in _compute_all(payloads, workers, chunk_size, parallel_min_rows):
+                computed += len(rows)
+                _update_job(job_id, computed=computed)
+
+                for row in rows:
+                    row.update(year=year, month=month, created_by=created_by,
+                               memo=f'{year}년 {month}월 일괄 생성')
+
+                # 청크 단위 트랜잭션
+                written += bulk_insert(Payroll, rows)
+                db.session.commit()
+                _update_job(job_id, written=written)
+
+            if written:
+                invalidate_dashboard_overview(year, month)
+                log_action(
+                    user_id=created_by,
+                    action_type='CREATE',
+                    entity_type='payroll',
+                    entity_id=None,
+                    message=f"급여명세서 일괄 생성 배치: {year}-{month:02d} {written}건 (기존 {skipped}건 제외)"
+                )
+
+            _finish_job(job_id, 'completed')
+
+        except Exception as e:
+            db.session.rollback()
+            traceback.print_exc()
+            _finish_job(job_id, 'failed', error=str(e))
+        finally:
+            db.session.remove()
+
+    evict_jobs(app.config.get('PAYROLL_BATCH_JOB_RETENTION_SECONDS', DEFAULT_JOB_RETENTION_SECONDS))
@@ -0,0 +1,150 @@
+"""
+급여명세서 일괄 PDF 생성
+- 해당 연월 급여(payrolls) 전체를 1회 조회하여 직렬화 가능한 dict로 변환
+- 단일 PDF(직원별 페이지) 또는 직원별 PDF ZIP으로 출력
+- ZIP 모드는 프로세스 풀에서 병렬 렌더링, 스타일/폰트는 워커당 1회 초기화
+"""
+
+import multiprocessing
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+from ..database import db
+from .bulk_write import iter_chunks
+from .pdf_generator import get_payroll_pdf_generator
+
+DEFAULT_CHUNK_SIZE = 50
+
+# 급여명세서 PDF 항목 <- payrolls 컬럼
+PAYSLIP_FIELD_MAP = {
+    'basic_salary': 'base_salary',
+    'position_allowance': 'position_allowance',
+    'meal_allowance': 'meal_allowance',
+    'transport_allowance': 'transport_allowance',
+    'overtime_allowance': 'overtime_pay',
+    'night_allowance': 'night_pay',
+    'holiday_allowance': 'holiday_pay',
+    'other_allowances': 'other_allowances',
+    'performance_bonus': 'bonus',
+    'gross_pay': 'total_payment',
+    'national_pension': 'national_pension',
+    'health_insurance': 'health_insurance',
+    'employment_insurance': 'employment_insurance',
+    'long_term_care': 'long_term_care',
+    'income_tax': 'income_tax',
+    'local_tax': 'resident_tax',
+    'other_deductions': 'other_deductions',
+    'total_deductions': 'total_deductions',
+    'net_pay': 'net_pay',
+    'overtime_hours': 'overtime_hours',
+    'night_hours': 'night_hours',
+    'holiday_hours': 'holiday_hours'
+}
+
+# payrolls 테이블에 없는 항목
+PAYSLIP_ZERO_FIELDS = (
+    'family_allowance', 'annual_bonus', 'special_bonus', 'union_fee',
+    'annual_leave_used', 'annual_leave_remaining'
+)
+
+
+def load_payslip_records(year, month):
+    """해당 연월 급여명세서 데이터 조회 (조인 쿼리 1회)"""
+    from ..models.payroll import Payroll
+    from ..models.employee import Employee
+    from ..models.department import Department
+
+    columns = [getattr(Payroll, column).label(field) for field, column in PAYSLIP_FIELD_MAP.items()]
+    rows = db.session.query(
+        Payroll.work_days,
+        Payroll.memo,
+        Employee.name.label('employee_name'),
+        Employee.employee_number,
+        Employee.position,
+        Department.name.label('department_name'),
+        *columns
+    ).join(
+        Employee, Payroll.employee_id == Employee.id
+    ).outerjoin(
+        Department, Employee.department_id == Department.id
+    ).filter(
+        Payroll.year == year,
+        Payroll.month == month
+    ).order_by(Employee.employee_number).all()
+
+    records = []
+    for row in rows:
+        record = {field: float(getattr(row, field) or 0) for field in PAYSLIP_FIELD_MAP}
+        record.update({field: 0 for field in PAYSLIP_ZERO_FIELDS})
+        record.update(
+            period=f"{year}-{month:02d}",
+            work_days=row.work_days or 0,
+            memo=row.memo,
+            is_final=False,
+            employee={
+                'name': row.employee_name,
+                'employee_number': row.employee_number,
+                'position': row.position or '-',
+                'department': {'name': row.department_name} if row.department_name else None
+            }
+        )
+        records.append(record)
+    return records
+
+
+def payslip_view(record):
+    """PDF 생성기가 읽는 속성 형태로 변환"""
+    employee = dict(record['employee'])
+    employee['department'] = SimpleNamespace(**employee['department']) if employee['department'] else None
+    return SimpleNamespace(**{**record, 'employee': SimpleNamespace(**employee)})
+
+
+def payslip_filename(record):
+    """직원별 PDF 파일명"""
+    return f"payslip_{record['period'].replace('-', '')}_{record['employee']['employee_number']}.pdf"
+
+
+def _init_worker():
+    """워커 초기화 (스타일 1회 구성)"""
+    get_payroll_pdf_generator()
+
+
+def render_payslip_chunk(records):
+    """직원별 PDF 렌더링 (프로세스 풀 작업 단위)"""
+    generator = get_payroll_pdf_generator()
+    return [
+        (payslip_filename(record), generator.generate_payroll_pdf(payslip_view(record)).getvalue())
+        for record in records
+    ]
+
+
+def render_payslips_pdf(records, path):
+    """전체 급여명세서를 단일 PDF로 저장"""
+    buffer = get_payroll_pdf_generator().generate_bulk_payroll_pdf(
+        [payslip_view(record) for record in records]
+    )
+    with open(path, 'wb') as f:
+        f.write(buffer.getvalue())
+    return len(records)
+
+
+def render_payslips_zip(records, path, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """직원별 급여명세서 PDF를 ZIP으로 저장 (워커 2개 이상이면 프로세스 풀 사용)"""
+    chunks = list(iter_chunks(records, chunk_size))
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        if workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                for filename, content in render_payslip_chunk(chunk):
+                    archive.writestr(filename, content)
+        else:
+            # 스레드가 있는 서버 프로세스에서 fork 대신 spawn 사용
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context,
+                                     initializer=_init_worker) as executor:
+                for files in executor.map(render_payslip_chunk, chunks):
+                    for filename, content in files:
+                        archive.writestr(filename, content)
+
+    return len(records)
@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
 from reportlab.pdfbase import pdfmetrics
@@ -56,12 +56,9 @@ class PayrollPDFGenerator:
             alignment=TA_RIGHT
         )
     
-    def generate_payroll_pdf(self, payroll_record):
-        """급여명세서 PDF 생성"""
-        buffer = io.BytesIO()
-        
-        # PDF 문서 생성
-        doc = SimpleDocTemplate(
+    def _create_document(self, buffer):
+        """A4 문서 템플릿 생성"""
+        return SimpleDocTemplate(
             buffer,
             pagesize=A4,
             rightMargin=72,
@@ -69,8 +66,34 @@ class PayrollPDFGenerator:
             topMargin=72,
             bottomMargin=18
         )
+    
+    def generate_payroll_pdf(self, payroll_record):
+        """급여명세서 PDF 생성"""
+        buffer = io.BytesIO()
+        
+        # PDF 빌드
+        self._create_document(buffer).build(self.build_payroll_story(payroll_record))
         
-        # 문서 내용 구성
+        buffer.seek(0)
+        return buffer
+    
+    def generate_bulk_payroll_pdf(self, payroll_records):
+        """여러 급여명세서를 한 PDF로 생성 (직원별 페이지 구분)"""
+        buffer = io.BytesIO()
+        
+        story = []
+        for index, payroll_record in enumerate(payroll_records):
+            if index:
+                story.append(PageBreak())
+            story.extend(self.build_payroll_story(payroll_record))
+        
+        self._create_document(buffer).build(story)
+        
+        buffer.seek(0)
+        return buffer
+    
+    def build_payroll_story(self, payroll_record):
+        """급여명세서 1건의 문서 요소 구성"""
         story = []
         
         # 헤더 추가
@@ -91,11 +114,7 @@ class PayrollPDFGenerator:
         # 푸터 추가
         story.extend(self._create_footer(payroll_record))
         
-        # PDF 빌드
-        doc.build(story)
-        
-        buffer.seek(0)
-        return buffer
+        return story
     
     def _create_header(self, payroll_record):
         """헤더 생성"""
@@ -380,3 +399,12 @@ class PayrollPDFGenerator:
         
         return file_path
 
+
+_shared_generator = None
+
+def get_payroll_pdf_generator():
+    """프로세스 공용 급여명세서 PDF 생성기 (스타일은 프로세스당 1회 구성)"""
+    global _shared_generator
+    if _shared_generator is None:
+        _shared_generator = PayrollPDFGenerator()
+    return _shared_generator
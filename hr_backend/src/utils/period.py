@@ -0,0 +1,68 @@
+"""
+기간 계산 공용 헬퍼
+- 연/월/분기/임의 기간을 반열린 구간 [start, end)로 변환
+- 날짜 컬럼에 extract/strftime 함수를 씌우지 않고 범위 조건으로 비교하여 인덱스 탐색 가능
+"""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, tuple_, DateTime
+
+
+def month_range(year, month):
+    """해당 월의 [시작일, 다음달 시작일) 범위"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def year_range(year):
+    """해당 연도의 [시작일, 다음해 시작일) 범위"""
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def quarter_range(year, quarter):
+    """해당 분기(1~4)의 [시작일, 다음 분기 시작일) 범위"""
+    if not 1 <= quarter <= 4:
+        raise ValueError(f"분기는 1~4 사이여야 합니다: {quarter}")
+    start = date(year, (quarter - 1) * 3 + 1, 1)
+    end = date(year + 1, 1, 1) if quarter == 4 else date(year, quarter * 3 + 1, 1)
+    return start, end
+
+
+def date_span(start_date, end_date):
+    """종료일을 포함하는 기간 [start_date, end_date]를 [start_date, end_date + 1일)로 변환"""
+    return start_date, end_date + timedelta(days=1)
+
+
+def period_range(year, month=None, quarter=None):
+    """연도 + 월 또는 분기로 기간 범위 계산 (둘 다 없으면 연간)"""
+    if month:
+        return month_range(year, month)
+    if quarter:
+        return quarter_range(year, quarter)
+    return year_range(year)
+
+
+def _as_datetime(value):
+    if isinstance(value, datetime) or not isinstance(value, date):
+        return value
+    return datetime.combine(value, datetime.min.time())
+
+
+def in_range(column, start, end):
+    """column이 [start, end) 범위에 있는 조건 (DateTime 컬럼은 날짜를 자정 시각으로 변환)"""
+    if isinstance(column.type, DateTime):
+        start, end = _as_datetime(start), _as_datetime(end)
+    return and_(column >= start, column < end)
+
+
+def sql_range_params(start, end):
+    """원시 SQL용 범위 파라미터 (ISO 문자열, `col >= ? AND col < ?`와 함께 사용)"""
+    return start.isoformat(), end.isoformat()
+
+
+def year_month_between(year_column, month_column, start, end):
+    """(연, 월) 컬럼 쌍이 start ~ end 월(양끝 포함)에 있는 조건 (행 값 비교로 인덱스 사용)"""
+    columns = tuple_(year_column, month_column)
+    return and_(columns >= (start.year, start.month), columns <= (end.year, end.month))
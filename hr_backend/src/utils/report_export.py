@@ -0,0 +1,125 @@
+"""
+리포트 CSV 스트리밍 내보내기
+- 서버 측 커서(yield_per)로 행을 나누어 읽고 CSV 청크 단위로 yield
+- 전체 파일을 메모리에 만들지 않으므로 기간이 길어도 메모리 사용량 일정
+"""
+
+import csv
+import io
+from datetime import date, datetime
+
+from ..database import db
+from ..models.employee import Employee
+from ..models.department import Department
+from ..models.attendance import AttendanceRecord
+from ..models.payroll import Payroll
+from .period import in_range, date_span, year_month_between
+from .department_tree import subtree_filter
+
+DEFAULT_YIELD_PER = 1000
+
+EXPORT_TYPES = ('attendance', 'payroll')
+
+
+def _format(value):
+    """CSV 셀 값 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if hasattr(value, 'isoformat'):  # time
+        return value.strftime('%H:%M')
+    return value
+
+
+def _attendance_query(start_date, end_date):
+    """기간 내 출퇴근 기록 (ORM 객체 대신 컬럼 튜플 조회)"""
+    return db.session.query(
+        AttendanceRecord.date,
+        Employee.employee_number,
+        Employee.name,
+        Department.name,
+        AttendanceRecord.check_in_time,
+        AttendanceRecord.check_out_time,
+        AttendanceRecord.status,
+        AttendanceRecord.work_hours,
+        AttendanceRecord.overtime_hours,
+        AttendanceRecord.notes
+    ).join(
+        Employee, AttendanceRecord.employee_id == Employee.id
+    ).outerjoin(
+        Department, Employee.department_id == Department.id
+    ).filter(
+        in_range(AttendanceRecord.date, *date_span(start_date, end_date))
+    ).order_by(AttendanceRecord.date, Employee.employee_number)
+
+
+def _payroll_query(start_date, end_date):
+    """기간(연월 기준) 내 급여명세서"""
+    return db.session.query(
+        Payroll.year,
+        Payroll.month,
+        Employee.employee_number,
+        Employee.name,
+        Department.name,
+        Payroll.base_salary,
+        Payroll.overtime_pay,
+        Payroll.total_payment,
+        Payroll.total_deductions,
+        Payroll.net_pay,
+        Payroll.work_days,
+        Payroll.overtime_hours
+    ).join(
+        Employee, Payroll.employee_id == Employee.id
+    ).outerjoin(
+        Department, Employee.department_id == Department.id
+    ).filter(
+        year_month_between(Payroll.year, Payroll.month, start_date, end_date)
+    ).order_by(Payroll.year, Payroll.month, Employee.employee_number)
+
+
+EXPORTS = {
+    'attendance': (
+        '출근 현황 리포트',
+        ['날짜', '사번', '이름', '부서', '출근시간', '퇴근시간', '상태', '근무시간', '연장근무시간', '비고'],
+        _attendance_query
+    ),
+    'payroll': (
+        '급여 현황 리포트',
+        ['연도', '월', '사번', '이름', '부서', '기본급', '연장근무수당', '총지급액', '총공제액', '실수령액', '근무일수', '연장근무시간'],
+        _payroll_query
+    )
+}
+
+
+def stream_report_csv(report_type, start_date, end_date, yield_per=DEFAULT_YIELD_PER, department_id=None):
+    """리포트 CSV를 yield_per 행 단위 청크로 생성 (department_id 지정 시 하위 부서 포함 직원만)"""
+    if report_type not in EXPORTS:
+        raise ValueError(f"지원하지 않는 리포트 타입: {report_type}")
+
+    title, columns, build_query = EXPORTS[report_type]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    writer.writerow([title])
+    writer.writerow([f'기간: {start_date.isoformat()} ~ {end_date.isoformat()}'])
+    writer.writerow([f'생성일: {datetime.now().strftime("%Y-%m-%d %H:%M")}'])
+    writer.writerow([])
+    writer.writerow(columns)
+    yield flush()
+
+    query = build_query(start_date, end_date)
+    if department_id:
+        query = query.filter(subtree_filter(Employee.department_id, department_id))
+    statement = query.statement
+    result = db.session.execute(statement, execution_options={'yield_per': yield_per})
+    for partition in result.partitions():
+        writer.writerows([_format(value) for value in row] for row in partition)
+        yield flush()
@@ -10,19 +10,30 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
-class ReportGenerator:
-    """리포트 생성 유틸리티 클래스"""
-    
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
+KOREAN_FONT_PATH = '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'
+
+_korean_font = None
+
+def register_korean_font():
+    """한글 폰트 등록 (프로세스당 1회, 실패 시 기본 폰트)"""
+    global _korean_font
+    if _korean_font is None:
         # 한글 폰트 설정 (시스템에 설치된 폰트 사용)
         try:
             # 나눔고딕 폰트 등록 시도
-            pdfmetrics.registerFont(TTFont('NanumGothic', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'))
-            self.korean_font = 'NanumGothic'
+            pdfmetrics.registerFont(TTFont('NanumGothic', KOREAN_FONT_PATH))
+            _korean_font = 'NanumGothic'
         except:
             # 폰트가 없으면 기본 폰트 사용
-            self.korean_font = 'Helvetica'
+            _korean_font = 'Helvetica'
+    return _korean_font
+
+class ReportGenerator:
+    """리포트 생성 유틸리티 클래스"""
+    
+    def __init__(self):
+        self.styles = getSampleStyleSheet()
+        self.korean_font = register_korean_font()
         
         # 커스텀 스타일 생성
         self.title_style = ParagraphStyle(
@@ -0,0 +1,254 @@
+"""
+리포트 비동기 작업 큐
+- 요청 스레드는 작업 등록만 하고 즉시 반환, 렌더링은 워커 스레드에서 수행
+- 대기열 크기 제한 (가득 차면 등록 거부)
+- 결과물은 디스크에 저장하고 보관 기간/최대 개수 초과 시 오래된 순으로 삭제
+"""
+
+import os
+import queue
+import threading
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta
+
+from ..database import db
+from .period import period_range
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_RETENTION_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ARTIFACTS = 100
+
+FINISHED_STATUSES = ('completed', 'failed')
+
+MIMETYPES = {
+    'pdf': 'application/pdf',
+    'csv': 'text/csv; charset=utf-8',
+    'zip': 'application/zip'
+}
+
+
+class ReportQueueFullError(Exception):
+    """대기열이 가득 찬 경우"""
+
+
+def _render_report(params, path):
+    """리포트(종합/출근/급여/평가) PDF 또는 CSV 생성"""
+    from .report_generator import ReportGenerator
+    from .report_export import stream_report_csv, EXPORT_TYPES
+    from .dashboard_overview import overview_engine
+
+    report_type = params['report_type']
+    format_type = params['format']
+    year = params['year']
+    month = params.get('month')
+    period_name = f"{year}년 {month}월" if month else f"{year}년"
+
+    if format_type == 'csv' and report_type in EXPORT_TYPES:
+        start_date, end = period_range(year, month)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for chunk in stream_report_csv(report_type, start_date, end - timedelta(days=1)):
+                f.write(chunk)
+    else:
+        report_data = overview_engine.summary_report(year, month) if report_type == 'summary' else {}
+        generator = ReportGenerator()
+        if format_type == 'csv':
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(generator.generate_csv_report(report_data, report_type, period_name))
+        else:
+            buffer = generator.generate_pdf_report(report_data, report_type, period_name)
+            with open(path, 'wb') as f:
+                f.write(buffer.getvalue())
+
+    filename = f"hr_report_{report_type}_{year}"
+    if month:
+        filename += f"_{month:02d}"
+    return f"{filename}.{format_type}"
+
+
+def _render_payslips(params, path):
+    """해당 연월 급여명세서 일괄 생성 (단일 PDF 또는 직원별 PDF ZIP)"""
+    from flask import current_app
+    from .payslip_bulk import load_payslip_records, render_payslips_pdf, render_payslips_zip
+
+    year = params['year']
+    month = params['month']
+    records = load_payslip_records(year, month)
+    if not records:
+        raise ValueError(f"{year}년 {month}월 급여명세서가 없습니다.")
+
+    if params['format'] == 'zip':
+        render_payslips_zip(
+            records,
+            path,
+            workers=current_app.config.get('PAYSLIP_RENDER_WORKERS', min(4, os.cpu_count() or 1)),
+            chunk_size=current_app.config.get('PAYSLIP_RENDER_CHUNK_SIZE', 50)
+        )
+    else:
+        render_payslips_pdf(records, path)
+
+    return f"payslips_{year}_{month:02d}.{params['format']}"
+
+
+# 작업 종류별 렌더러: (params, 결과 파일 경로) -> 다운로드 파일명
+JOB_HANDLERS = {
+    'report': _render_report,
+    'payslips': _render_payslips
+}
+
+
+class ReportJobQueue:
+    """워커 스레드 기반 리포트 작업 큐"""
+
+    def __init__(self):
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._queue = None
+        self._workers = []
+        self._app = None
+
+    def _ensure_started(self, app):
+        """첫 작업 등록 시 대기열/워커 생성"""
+        with self._lock:
+            if self._queue is not None:
+                return
+            self._app = app
+            self._queue = queue.Queue(maxsize=app.config.get('REPORT_JOB_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+            os.makedirs(self.artifact_dir, exist_ok=True)
+            for index in range(app.config.get('REPORT_JOB_WORKERS', DEFAULT_WORKERS)):
+                worker = threading.Thread(target=self._worker, name=f'report-job-{index}', daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    @property
+    def artifact_dir(self):
+        """결과물 저장 디렉토리"""
+        return self._app.config.get('REPORT_JOB_DIR') or os.path.join(self._app.instance_path, 'report_jobs')
+
+    def submit(self, app, kind, params, created_by):
+        """작업 등록 (대기열이 가득 차면 ReportQueueFullError)"""
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"지원하지 않는 작업 종류: {kind}")
+
+        self._ensure_started(app)
+        self.evict()
+
+        job_id = uuid.uuid4().hex
+        job = {
+            'id': job_id,
+            'kind': kind,
+            'params': params,
+            'status': 'queued',
+            'error': None,
+            'filename': None,
+            'size': None,
+            'created_by': created_by,
+            'created_at': datetime.utcnow().isoformat(),
+            'started_at': None,
+            'finished_at': None
+        }
+
+        with self._lock:
+            self._jobs[job_id] = job
+            try:
+                self._queue.put_nowait(job_id)
+            except queue.Full:
+                del self._jobs[job_id]
+                raise ReportQueueFullError('리포트 작업 대기열이 가득 찼습니다.')
+            return dict(job)
+
+    def get(self, job_id):
+        """작업 상태 조회"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def artifact_path(self, job_id):
+        """작업 결과 파일 경로"""
+        return os.path.join(self.artifact_dir, job_id)
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _worker(self):
+        """대기열에서 작업을 꺼내 렌더링"""
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return
+
+        path = self.artifact_path(job_id)
+        with self._app.app_context():
+            try:
+                self._update(job_id, status='running', started_at=datetime.utcnow().isoformat())
+                filename = JOB_HANDLERS[job['kind']](job['params'], path)
+                self._update(
+                    job_id,
+                    status='completed',
+                    filename=filename,
+                    size=os.path.getsize(path),
+                    finished_at=datetime.utcnow().isoformat(),
+                    finished_ts=time.time()
+                )
+            except Exception as e:
+                traceback.print_exc()
+                if os.path.exists(path):
+                    os.remove(path)
+                self._update(
+                    job_id,
+                    status='failed',
+                    error=str(e),
+                    finished_at=datetime.utcnow().isoformat(),
+                    finished_ts=time.time()
+                )
+            finally:
+                db.session.remove()
+
+        self.evict()
+
+    def evict(self):
+        """보관 기간 초과 및 최대 개수 초과 결과물 삭제"""
+        if self._app is None:
+            return
+
+        retention = self._app.config.get('REPORT_JOB_RETENTION_SECONDS', DEFAULT_RETENTION_SECONDS)
+        max_artifacts = self._app.config.get('REPORT_JOB_MAX_ARTIFACTS', DEFAULT_MAX_ARTIFACTS)
+        now = time.time()
+
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job['status'] in FINISHED_STATUSES),
+                key=lambda job: job['finished_ts']
+            )
+            overflow = len(finished) - max_artifacts
+            expired = [
+                job['id'] for index, job in enumerate(finished)
+                if index < overflow or now - job['finished_ts'] > retention
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+        for job_id in expired:
+            path = self.artifact_path(job_id)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# 프로세스 공용 작업 큐
+report_job_queue = ReportJobQueue()
+
+
+def public_job(job):
+    """응답용 작업 정보 (내부 필드 제외)"""
+    return {key: value for key, value in job.items() if key != 'finished_ts'}
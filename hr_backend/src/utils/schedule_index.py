@@ -0,0 +1,104 @@
+"""
+직원별 주간 근무시간 인덱스 (메모리)
+- work_schedules 전체를 1회 적재하여 employee_id -> 요일별 7칸 (시작, 종료, 근무일 여부)로 보관
+- 출퇴근 상태 판정(단건/일괄/가져오기)은 행마다 DB를 조회하지 않고 이 인덱스만 사용
+- 근무시간 설정 변경 시 refresh(employee_id)로 해당 직원만 재조회, 다른 프로세스 변경은 WORK_SCHEDULE_INDEX_TTL 주기로 전체 재적재
+"""
+
+import threading
+import time as _time
+from collections import namedtuple
+from datetime import time
+
+from flask import current_app, has_app_context
+
+from ..database import db
+
+DEFAULT_INDEX_TTL = 300  # 초
+
+# 근무시간 미설정 직원/요일의 기본 근무시간 (09:00-18:00, 월~금)
+STANDARD_START = time(9, 0)
+STANDARD_END = time(18, 0)
+
+ScheduleSlot = namedtuple('ScheduleSlot', 'start end is_working_day')
+
+DEFAULT_WEEK = tuple(ScheduleSlot(STANDARD_START, STANDARD_END, day_of_week < 5) for day_of_week in range(7))
+
+
+def _build_week(rows):
+    """(요일, 시작, 종료, 근무일 여부) 행 -> 7칸 주간 근무시간
+
+    설정이 있는 직원의 빠진 요일은 비근무일 (일괄 설정은 비근무일 행을 만들지 않음)
+    """
+    week = [ScheduleSlot(STANDARD_START, STANDARD_END, False)] * 7
+    for day_of_week, start_time, end_time, is_working_day in rows:
+        if 0 <= day_of_week <= 6:
+            week[day_of_week] = ScheduleSlot(start_time, end_time, bool(is_working_day))
+    return tuple(week)
+
+
+class WorkScheduleIndex:
+    """직원별 주간 근무시간 인덱스"""
+
+    def __init__(self):
+        self._weeks = {}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def _ttl(self):
+        if has_app_context():
+            return current_app.config.get('WORK_SCHEDULE_INDEX_TTL', DEFAULT_INDEX_TTL)
+        return DEFAULT_INDEX_TTL
+
+    def _query(self, employee_id=None):
+        from ..models.attendance import WorkSchedule
+
+        query = db.session.query(
+            WorkSchedule.employee_id, WorkSchedule.day_of_week,
+            WorkSchedule.start_time, WorkSchedule.end_time, WorkSchedule.is_working_day
+        )
+        if employee_id is not None:
+            query = query.filter(WorkSchedule.employee_id == employee_id)
+        rows = {}
+        for row_employee_id, *slot in query:
+            rows.setdefault(row_employee_id, []).append(slot)
+        return rows
+
+    def _load(self):
+        """전체 근무시간 적재 (쿼리 1회)"""
+        self._weeks = {employee_id: _build_week(rows) for employee_id, rows in self._query().items()}
+        self._loaded_at = _time.monotonic()
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None or _time.monotonic() - self._loaded_at >= self._ttl():
+            self._load()
+
+    def invalidate(self):
+        """인덱스 무효화 (다음 조회 시 전체 재적재)"""
+        with self._lock:
+            self._weeks = {}
+            self._loaded_at = None
+
+    def refresh(self, employee_id):
+        """직원 1명의 근무시간 재조회 (근무시간 설정 커밋 후 호출, 적재 전이면 무시)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            rows = self._query(employee_id).get(employee_id)
+            if rows:
+                self._weeks[employee_id] = _build_week(rows)
+            else:
+                self._weeks.pop(employee_id, None)
+
+    def week(self, employee_id):
+        """직원의 요일별 7칸 근무시간 (설정 없으면 기본 근무시간)"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._weeks.get(employee_id, DEFAULT_WEEK)
+
+    def slot(self, employee_id, day):
+        """직원의 해당 날짜 근무시간"""
+        return self.week(employee_id)[day.weekday()]
+
+
+schedule_index = WorkScheduleIndex()
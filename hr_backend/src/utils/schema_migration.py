@@ -0,0 +1,135 @@
+"""
+기존 데이터베이스 인덱스 보정
+- db.create_all()은 이미 존재하는 테이블에 새로 선언된 인덱스를 추가하지 않음
+- 모델에 선언된 인덱스 중 누락된 것을 생성
+- 모델이 없는 원시 SQL 테이블은 RAW_INDEXES로 관리
+- sqlite_autoincrement를 선언한 모델의 기존 테이블이 AUTOINCREMENT 없이 생성되어 있으면 재생성 (SQLite)
+"""
+
+from sqlalchemy import inspect, text
+
+from ..database import db
+
+# 모델이 없는 테이블의 인덱스: (테이블, 인덱스명, 컬럼)
+RAW_INDEXES = (
+    ('monthly_evaluations', 'idx_monthly_evaluations_year_employee', ('year', 'employee_id')),
+)
+
+# AUTOINCREMENT 시퀀스 하한: (테이블, 하한을 조회할 테이블, 컬럼)
+# 감사 로그 ID는 집계 워터마크보다 커야 새 로그가 집계됨
+AUTOINCREMENT_FLOORS = (
+    ('audit_logs', 'audit_rollup_state', 'last_log_id'),
+)
+
+
+def _existing_index_names(inspector, table_name):
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def missing_indexes(engine=None):
+    """누락된 인덱스 목록 [(테이블, 인덱스명)] (존재하지 않는 테이블은 제외)"""
+    engine = engine or db.engine
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    missing = []
+
+    for table in db.metadata.tables.values():
+        if table.name not in tables:
+            continue
+        existing = _existing_index_names(inspector, table.name)
+        missing.extend((table.name, index.name) for index in table.indexes if index.name not in existing)
+
+    for table_name, index_name, _ in RAW_INDEXES:
+        if table_name in tables and index_name not in _existing_index_names(inspector, table_name):
+            missing.append((table_name, index_name))
+
+    return missing
+
+
+def ensure_indexes(engine=None):
+    """누락된 인덱스 생성 후 생성한 인덱스명 목록 반환"""
+    engine = engine or db.engine
+    missing = set(missing_indexes(engine))
+    if not missing:
+        return []
+
+    created = []
+    with engine.begin() as connection:
+        for table in db.metadata.tables.values():
+            for index in table.indexes:
+                if (table.name, index.name) in missing:
+                    index.create(connection, checkfirst=True)
+                    created.append(index.name)
+
+        for table_name, index_name, columns in RAW_INDEXES:
+            if (table_name, index_name) in missing:
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)})"
+                ))
+                created.append(index_name)
+
+        # 새 인덱스 기준으로 쿼리 플래너 통계 갱신
+        if engine.dialect.name == 'sqlite':
+            connection.execute(text('ANALYZE'))
+
+    return created
+
+
+def _autoincrement_tables():
+    return [table for table in db.metadata.tables.values() if table.dialect_options['sqlite'].get('autoincrement')]
+
+
+def missing_autoincrement(engine=None):
+    """AUTOINCREMENT 없이 생성된 기존 테이블명 목록 (SQLite 외에는 빈 목록)"""
+    engine = engine or db.engine
+    if engine.dialect.name != 'sqlite':
+        return []
+
+    missing = []
+    with engine.connect() as connection:
+        for table in _autoincrement_tables():
+            sql = connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {'name': table.name}
+            ).scalar()
+            if sql and 'AUTOINCREMENT' not in sql.upper():
+                missing.append(table.name)
+    return missing
+
+
+def ensure_autoincrement(engine=None):
+    """AUTOINCREMENT 없는 기존 테이블을 모델 정의로 재생성(데이터 복사) 후 재생성한 테이블명 목록 반환"""
+    engine = engine or db.engine
+    missing = missing_autoincrement(engine)
+    if not missing:
+        return []
+
+    with engine.begin() as connection:
+        existing = set(inspect(connection).get_table_names())
+        for table in _autoincrement_tables():
+            if table.name not in missing:
+                continue
+            legacy = f'{table.name}_legacy'
+            connection.execute(text(f'ALTER TABLE {table.name} RENAME TO {legacy}'))
+            # 인덱스명이 같으므로 새 테이블 생성 전에 기존 인덱스 제거
+            for index in inspect(connection).get_indexes(legacy):
+                connection.execute(text(f'DROP INDEX IF EXISTS {index["name"]}'))
+            table.create(connection)
+
+            legacy_columns = {column['name'] for column in inspect(connection).get_columns(legacy)}
+            columns = ', '.join(column.name for column in table.columns if column.name in legacy_columns)
+            connection.execute(text(f'INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {legacy}'))
+            connection.execute(text(f'DROP TABLE {legacy}'))
+
+            for table_name, floor_table, floor_column in AUTOINCREMENT_FLOORS:
+                if table_name != table.name or floor_table not in existing:
+                    continue
+                floor = connection.execute(text(f'SELECT MAX({floor_column}) FROM {floor_table}')).scalar() or 0
+                connection.execute(text("DELETE FROM sqlite_sequence WHERE name = :name"), {'name': table.name})
+                connection.execute(
+                    text(f"INSERT INTO sqlite_sequence (name, seq) "
+                         f"SELECT :name, MAX(:floor, COALESCE(MAX(id), 0)) FROM {table.name}"),
+                    {'name': table.name, 'floor': floor}
+                )
+
+    return missing
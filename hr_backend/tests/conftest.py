@@ -0,0 +1,54 @@
+"""
+테스트 공용 fixture
+- 테스트마다 임시 SQLite 파일에 바인딩한 앱 생성 (운영 DB(src/database/app.db) 미사용)
+- 실행: hr_backend 디렉터리에서 python -m pytest -q
+"""
+
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.main  # noqa: E402,F401  (모델 등록)
+from src.database import db  # noqa: E402
+from src.routes import register_blueprints  # noqa: E402
+from src.utils.db_connection import init_app as init_db_connection  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    """임시 DB 앱 (테이블 생성 완료, 앱 컨텍스트 활성)"""
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SECRET_KEY='test',
+        JWT_SECRET_KEY='test-jwt',
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False
+    )
+    db.init_app(app)
+    init_db_connection(app)
+    register_blueprints(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_header(app):
+    """역할별 Authorization 헤더 생성 함수"""
+    from src.utils.jwt_helper import create_access_token
+
+    def make(user_id=1, role='admin', username='admin'):
+        return {'Authorization': f'Bearer {create_access_token(user_id, role, username)}'}
+    return make
@@ -0,0 +1,216 @@
+"""
+연도별 성과급 계산 회귀 테스트
+- 기존 직원별 쿼리 방식(legacy_calculate_annual_bonus)과 일괄 집계 방식(calculate_annual_bonus)의
+  응답 JSON이 동일한지 시드 데이터로 비교
+"""
+
+import json
+import random
+from datetime import datetime
+
+import pytest
+from flask import jsonify
+
+from src.routes.annual_bonus import calculate_annual_bonus
+from src.utils.business_calendar import working_months_in_year
+from src.utils.db_connection import get_db_connection
+
+YEAR = 2025
+EMPLOYEE_COUNT = 120
+
+# 원시 SQL 라우트가 사용하는 테이블 (bonus_policies는 컬럼 위치 기준으로 조회하므로 레거시 순서로 생성)
+RAW_SCHEMA = """
+DROP TABLE IF EXISTS bonus_policies;
+CREATE TABLE bonus_policies (
+    id INTEGER PRIMARY KEY, name TEXT, description TEXT, calculation_method TEXT,
+    ratio_base REAL, ratio_team REAL, ratio_personal REAL, ratio_company REAL, total_ratio REAL,
+    min_performance_score REAL, max_bonus_multiplier REAL, is_active INTEGER
+);
+CREATE TABLE monthly_evaluations (
+    id INTEGER PRIMARY KEY, employee_id TEXT, year INTEGER, month INTEGER,
+    company_score REAL, team_score REAL, individual_score REAL, total_score REAL, status TEXT
+);
+CREATE TABLE evaluation_exclusions (
+    id INTEGER PRIMARY KEY, employee_id TEXT, year INTEGER, month INTEGER, exclusion_reason TEXT
+);
+CREATE TABLE bonus_budgets (
+    id INTEGER PRIMARY KEY, year INTEGER, total_budget INTEGER, allocated_budget INTEGER, used_budget INTEGER
+);
+"""
+
+
+def legacy_calculate_annual_bonus(cursor, year, policy_id):
+    """기존 구현 (직원마다 월별 평가/제외 월 쿼리 2회)"""
+    cursor.execute('SELECT * FROM bonus_policies WHERE id = ? AND is_active = 1', (policy_id,))
+    policy = cursor.fetchone()
+    cursor.execute('SELECT total_budget, allocated_budget, used_budget FROM bonus_budgets WHERE year = ?', (year,))
+    budget_info = cursor.fetchone()
+
+    cursor.execute('''
+    SELECT employee_number, name, position, hire_date, department_id
+    FROM employees WHERE employee_number != 'EMP001'
+    ''')
+    employees = cursor.fetchall()
+
+    calculations = []
+    total_calculated_bonus = 0
+
+    for emp in employees:
+        employee_id = emp[0]
+        employee_name = emp[1]
+        hire_date = datetime.strptime(emp[3], '%Y-%m-%d').date() if emp[3] else None
+
+        cursor.execute('''
+        SELECT month, company_score, team_score, individual_score, total_score
+        FROM monthly_evaluations
+        WHERE employee_id = ? AND year = ? AND status = 'completed'
+        ORDER BY month
+        ''', (employee_id, year))
+        monthly_scores = cursor.fetchall()
+
+        cursor.execute('SELECT month FROM evaluation_exclusions WHERE employee_id = ? AND year = ?', (employee_id, year))
+        excluded_months = [row[0] for row in cursor.fetchall()]
+
+        working_months = working_months_in_year(hire_date, year)
+        expected_evaluations = working_months - len(excluded_months)
+
+        if len(monthly_scores) == 0 or expected_evaluations <= 0:
+            calculation = {
+                'employee_id': employee_id,
+                'employee_name': employee_name,
+                'working_months': working_months,
+                'excluded_months': len(excluded_months),
+                'evaluated_months': 0,
+                'annual_score': 0,
+                'calculated_bonus': 0,
+                'final_bonus': 0,
+                'reason': '평가 데이터 없음 또는 근무개월 부족'
+            }
+        else:
+            evaluated_months = len(monthly_scores)
+            avg_company = sum(score[1] for score in monthly_scores) / evaluated_months
+            avg_team = sum(score[2] for score in monthly_scores) / evaluated_months
+            avg_individual = sum(score[3] for score in monthly_scores) / evaluated_months
+            avg_total = sum(score[4] for score in monthly_scores) / evaluated_months
+
+            ratio_base = float(policy[4]) / 100 if policy[4] else 0
+            ratio_team = float(policy[5]) / 100 if policy[5] else 0
+            ratio_personal = float(policy[6]) / 100 if policy[6] else 0
+            ratio_company = float(policy[7]) / 100 if policy[7] else 0
+
+            weighted_score = (
+                avg_company * ratio_company +
+                avg_team * ratio_team +
+                avg_individual * ratio_personal
+            ) + (ratio_base * 100)
+
+            min_score = float(policy[9]) if policy[9] else 0
+            max_multiplier = float(policy[10]) if policy[10] else 2.0
+            if weighted_score < min_score:
+                calculated_bonus = 0
+                reason = f'최소 성과 점수({min_score}) 미달'
+            else:
+                base_bonus = 1000000
+                performance_multiplier = min(weighted_score / 100, max_multiplier)
+                calculated_bonus = base_bonus * performance_multiplier
+                if working_months < 12:
+                    calculated_bonus = calculated_bonus * (working_months / 12)
+                    reason = f'신규입사자 근무개월 수 반영 ({working_months}개월)'
+                else:
+                    reason = '정상 계산'
+
+            calculation = {
+                'employee_id': employee_id,
+                'employee_name': employee_name,
+                'working_months': working_months,
+                'excluded_months': len(excluded_months),
+                'evaluated_months': evaluated_months,
+                'monthly_scores': {
+                    'avg_company': round(avg_company, 1),
+                    'avg_team': round(avg_team, 1),
+                    'avg_individual': round(avg_individual, 1),
+                    'avg_total': round(avg_total, 1)
+                },
+                'weighted_score': round(weighted_score, 1),
+                'annual_score': round(avg_total, 1),
+                'calculated_bonus': round(calculated_bonus),
+                'final_bonus': round(calculated_bonus),
+                'reason': reason
+            }
+
+        calculations.append(calculation)
+        total_calculated_bonus += calculation['final_bonus']
+
+    available_budget = budget_info[1] - budget_info[2]
+    budget_ratio = total_calculated_bonus / available_budget if available_budget > 0 else 0
+
+    return jsonify({
+        'success': True,
+        'data': {
+            'year': year,
+            'policy_id': policy_id,
+            'calculations': calculations,
+            'summary': {
+                'total_employees': len(calculations),
+                'total_calculated_bonus': total_calculated_bonus,
+                'available_budget': available_budget,
+                'budget_ratio': round(budget_ratio, 2),
+                'budget_exceeded': total_calculated_bonus > available_budget
+            }
+        }
+    })
+
+
+def seed(conn, min_score):
+    """입사일/제외 월/미완료 평가가 섞인 1년치 월별 평가 데이터"""
+    rnd = random.Random(7)
+    conn.executescript(RAW_SCHEMA)
+    conn.execute('INSERT INTO bonus_policies VALUES (1, ?, NULL, ?, 10, 30, 40, 20, 100, ?, 1.8, 1)',
+                 ('기본 정책', 'weighted', min_score))
+    conn.execute('INSERT INTO bonus_budgets VALUES (1, ?, 900000000, 800000000, 1000)', (YEAR,))
+    conn.execute(
+        "INSERT INTO employees (id, user_id, employee_number, name, email, hire_date, status, created_at) "
+        "VALUES (1, 1, 'EMP001', '관리자', 'admin@company.com', '2019-01-01', 'active', '2020-01-01')"
+    )
+    hire_dates = ['2018-03-01', '2025-01-01', '2025-05-10', '2025-11-02', '2026-01-01']
+    for index in range(2, EMPLOYEE_COUNT + 2):
+        employee_number = f'E{index:05d}'
+        conn.execute(
+            "INSERT INTO employees (id, user_id, employee_number, name, email, hire_date, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, 'active', '2020-01-01')",
+            (index, index, employee_number, f'직원{index}', f'e{index}@company.com', rnd.choice(hire_dates))
+        )
+        for month in range(1, 13):
+            draw = rnd.random()
+            if draw < 0.8:
+                conn.execute(
+                    "INSERT INTO monthly_evaluations (employee_id, year, month, company_score, team_score, "
+                    "individual_score, total_score, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (employee_number, YEAR, month, rnd.uniform(40, 100), rnd.randint(40, 100),
+                     rnd.uniform(20, 100), rnd.uniform(30, 100), 'completed' if rnd.random() < 0.9 else 'draft')
+                )
+            elif draw < 0.85:
+                conn.execute('INSERT INTO evaluation_exclusions (employee_id, year, month) VALUES (?, ?, ?)',
+                             (employee_number, YEAR, month))
+    conn.commit()
+
+
+@pytest.mark.parametrize('min_score', [0, 60])
+def test_set_based_matches_legacy(app, min_score):
+    conn = get_db_connection()
+    seed(conn, min_score)
+
+    with app.test_request_context(method='POST', json={'policy_id': 1}):
+        legacy = legacy_calculate_annual_bonus(get_db_connection().cursor(), YEAR, 1)
+        current = calculate_annual_bonus(YEAR)
+
+    current = current[0] if isinstance(current, tuple) else current
+    assert current.status_code == 200
+    assert current.get_data(as_text=True) == legacy.get_data(as_text=True)
+
+    data = json.loads(current.get_data(as_text=True))['data']
+    assert data['summary']['total_employees'] == EMPLOYEE_COUNT
+    reasons = {calc['reason'] for calc in data['calculations']}
+    assert '정상 계산' in reasons
+    assert any(reason.startswith('신규입사자') for reason in reasons)
+    assert '평가 데이터 없음 또는 근무개월 부족' in reasons
@@ -0,0 +1,60 @@
+"""
+일일 출퇴근 마감 테스트
+- 기본 마감 날짜는 전날, 당일은 퇴근 예정 시각 이후에만 마감
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from src.database import db
+from src.models.attendance import AttendanceRecord, WorkSchedule
+from src.models.employee import Employee
+from src.utils.attendance_close import close_attendance_day
+from src.utils.schedule_index import schedule_index
+
+
+@pytest.fixture
+def employee(app):
+    """매일 09:00-18:00 근무하는 직원"""
+    employee = Employee(
+        user_id=20, employee_number='E00020', name='마감', email='close@company.com',
+        hire_date=date(2020, 1, 1), status='active'
+    )
+    db.session.add(employee)
+    db.session.flush()
+    db.session.add_all(
+        WorkSchedule(employee_id=employee.id, day_of_week=day, start_time=time(9), end_time=time(18))
+        for day in range(7)
+    )
+    db.session.commit()
+    schedule_index.invalidate()
+    yield employee
+    schedule_index.invalidate()
+
+
+def test_close_day_defaults_to_yesterday(client, auth_header, employee):
+    response = client.post('/api/attendance/close-day', headers=auth_header(), json={})
+
+    assert response.status_code == 200
+    yesterday = date.today() - timedelta(days=1)
+    assert response.get_json()['date'] == yesterday.isoformat()
+    assert AttendanceRecord.query.filter_by(employee_id=employee.id, date=yesterday).one().status == 'absent'
+    assert AttendanceRecord.query.filter_by(date=date.today()).count() == 0
+
+
+def test_same_day_close_refused_during_working_hours(client, auth_header, employee):
+    today = date.today()
+    with pytest.raises(ValueError):
+        close_attendance_day(today, now=datetime.combine(today, time(10)))
+    assert AttendanceRecord.query.count() == 0
+
+    # 마감 시도 후에도 당일 출근 기록 등록 가능
+    response = client.post('/api/attendance/records', headers=auth_header(), json={
+        'employee_id': employee.id, 'date': today.isoformat(), 'check_in_time': '09:00'
+    })
+    assert response.status_code == 201, response.get_json()
+
+    result = close_attendance_day(today, now=datetime.combine(today, time(18, 30)))
+    assert result['created'] == 0
+    assert result['recorded_count'] == 1
@@ -0,0 +1,104 @@
+"""
+감사 로그 일별 집계 테스트
+- 증분 집계 워터마크(audit_rollup_state.last_log_id)가 ID 재사용에도 멈추지 않는지 확인
+"""
+
+from sqlalchemy import func
+
+from src.database import db
+from src.models.audit_log import AuditLog, AuditLogDailyRollup, AuditRollupState
+from src.utils.audit_rollup import refresh_audit_rollups, STATE_ID
+
+
+def _add_logs(count, user_id=1):
+    for _ in range(count):
+        AuditLog.log_action(user_id=user_id, action_type='CREATE', entity_type='employee',
+                            entity_id=None, message='테스트')
+    db.session.commit()
+
+
+def _rollup_total():
+    return db.session.query(func.sum(AuditLogDailyRollup.count)).scalar() or 0
+
+
+def test_refresh_is_incremental(app):
+    _add_logs(3)
+    assert refresh_audit_rollups() == 3
+    assert refresh_audit_rollups() == 0
+
+    _add_logs(2)
+    assert refresh_audit_rollups() == 2
+    assert _rollup_total() == 5
+
+
+def test_watermark_resets_when_max_id_drops_below_it(app):
+    _add_logs(3)
+    assert refresh_audit_rollups() == 3
+
+    # 워터마크가 현재 최대 ID보다 앞선 상태 (ID 재사용)
+    db.session.query(AuditRollupState).filter_by(id=STATE_ID).update({'last_log_id': 10})
+    db.session.commit()
+
+    assert refresh_audit_rollups() == 0
+    db.session.expire_all()
+    assert db.session.get(AuditRollupState, STATE_ID).last_log_id == 3
+
+    _add_logs(1)
+    assert refresh_audit_rollups() == 1
+    assert _rollup_total() == 4
+
+
+def test_rollup_counts_logs_inserted_after_archiving_everything(app, tmp_path):
+    """전체 아카이브 후에도 새 로그 ID가 워터마크를 넘어 집계에 반영됨 (AUTOINCREMENT)"""
+    from datetime import date, timedelta
+    from src.utils.audit_archive import archive_audit_logs
+
+    app.config['AUDIT_ARCHIVE_DIR'] = str(tmp_path / 'archive')
+    _add_logs(3)
+    assert refresh_audit_rollups() == 3
+
+    archived = archive_audit_logs(app, date.today() + timedelta(days=1))
+    assert sum(archived.values()) == 3
+    assert AuditLog.query.count() == 0
+
+    _add_logs(2)
+    assert min(log.id for log in AuditLog.query) > 3
+    assert refresh_audit_rollups() == 2
+    assert _rollup_total() == 5
+
+
+def test_ensure_autoincrement_rebuilds_legacy_table(app):
+    """AUTOINCREMENT 없이 생성된 기존 audit_logs를 데이터/인덱스 유지한 채 재생성"""
+    from sqlalchemy import inspect, text
+    from src.utils.schema_migration import ensure_autoincrement, missing_autoincrement, missing_indexes
+
+    _add_logs(3)
+    assert refresh_audit_rollups() == 3
+    with db.engine.begin() as connection:
+        connection.execute(text('ALTER TABLE audit_logs RENAME TO audit_logs_old'))
+        for index in ('idx_audit_logs_created_at', 'idx_audit_logs_user_created', 'idx_audit_logs_entity_created'):
+            connection.execute(text(f'DROP INDEX {index}'))
+        connection.execute(text(
+            'CREATE TABLE audit_logs (id INTEGER NOT NULL PRIMARY KEY, user_id INTEGER NOT NULL, '
+            'action_type VARCHAR(50) NOT NULL, entity_type VARCHAR(50) NOT NULL, entity_id INTEGER, '
+            'old_values TEXT, new_values TEXT, ip_address VARCHAR(45), user_agent VARCHAR(500), '
+            'message TEXT NOT NULL, created_at DATETIME NOT NULL)'
+        ))
+        connection.execute(text('CREATE INDEX idx_audit_logs_created_at ON audit_logs (created_at)'))
+        connection.execute(text('INSERT INTO audit_logs SELECT * FROM audit_logs_old'))
+        connection.execute(text('DROP TABLE audit_logs_old'))
+    db.session.remove()
+
+    assert missing_autoincrement() == ['audit_logs']
+    assert ensure_autoincrement() == ['audit_logs']
+    assert missing_autoincrement() == []
+    assert ('audit_logs', 'idx_audit_logs_created_at') not in missing_indexes()
+    assert 'audit_logs_legacy' not in inspect(db.engine).get_table_names()
+    assert AuditLog.query.count() == 3
+
+    # 최대 ID 행을 지워도 재사용되지 않음
+    AuditLog.query.filter(AuditLog.id == 3).delete()
+    db.session.commit()
+    _add_logs(1)
+    assert db.session.query(func.max(AuditLog.id)).scalar() == 4
+    assert refresh_audit_rollups() == 1
@@ -0,0 +1,57 @@
+"""
+휴가 신청 겹침 확인 테스트
+- 메모리 인덱스가 오래되어도(다른 프로세스 저장) 저장 경로는 DB 재확인으로 중복을 찾는지 확인
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+
+from src.database import db
+from src.utils.db_connection import get_db_connection
+from src.utils.leave_index import leave_index, OVERLAP_SQL
+
+START, END = date(2025, 3, 10), date(2025, 3, 12)
+
+
+def _insert_from_other_process():
+    """인덱스를 거치지 않고 저장된 신청 (다른 프로세스)"""
+    conn = get_db_connection()
+    conn.execute(
+        "INSERT INTO leave_requests (employee_id, type, start_date, end_date, days_requested, status) "
+        "VALUES (1, '병가', '2025-03-11', '2025-03-13', 3, '대기')"
+    )
+    conn.commit()
+    return conn.execute('SELECT MAX(id) FROM leave_requests').fetchone()[0]
+
+
+def test_write_check_finds_overlap_missing_from_index(app):
+    leave_index.invalidate()
+    assert leave_index.find_overlap(1, START, END) is None
+    request_id = _insert_from_other_process()
+
+    # 인덱스는 TTL 전까지 모름
+    assert leave_index.find_overlap(1, START, END) is None
+
+    found = leave_index.find_overlap_for_write(1, START, END)
+    assert (found.source, found.request_id) == ('leave', request_id)
+    assert (found.start, found.end) == (date(2025, 3, 11), date(2025, 3, 13))
+
+    cursor = get_db_connection().cursor()
+    assert leave_index.find_overlap_for_write(1, START, END, cursor=cursor).request_id == request_id
+
+    # 수정 중인 신청 자신 / 겹치지 않는 기간 / 다른 직원은 제외
+    assert leave_index.find_overlap_for_write(1, START, END, exclude=('leave', request_id)) is None
+    assert leave_index.find_overlap_for_write(1, date(2025, 3, 14), date(2025, 3, 20)) is None
+    assert leave_index.find_overlap_for_write(2, START, END) is None
+    leave_index.invalidate()
+
+
+def test_overlap_query_uses_index(app):
+    plan = [row[-1] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {OVERLAP_SQL}'), {
+        'employee_id': 1, 'start': START.isoformat(), 'end': END.isoformat(),
+        'exclude_source': '', 'exclude_id': 0
+    })]
+    assert any('idx_annual_leave_requests_employee_dates' in step for step in plan), plan
+    assert any('idx_leave_requests_employee_dates' in step for step in plan), plan
+    assert not any(step.startswith('SCAN') for step in plan), plan
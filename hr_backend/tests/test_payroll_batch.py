@@ -0,0 +1,90 @@
+"""
+급여 일괄 생성 작업 레지스트리 테스트
+"""
+
+import time
+
+from src.utils import payroll_batch
+from src.utils.payroll_batch import start_payroll_batch, get_job, evict_jobs
+
+
+def _wait(job_id, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = get_job(job_id)
+        if job['status'] in ('completed', 'failed'):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f'작업이 끝나지 않았습니다: {get_job(job_id)}')
+
+
+def test_finished_jobs_are_evicted_after_retention(app):
+    job, created = start_payroll_batch(app, 2025, 1, created_by=1)
+    assert created
+    finished = _wait(job['id'])
+    assert finished['status'] == 'completed'
+    assert 'finished_ts' not in finished
+
+    # 보관 기간 내에는 유지
+    assert evict_jobs(retention=3600) == 0
+    assert get_job(job['id']) is not None
+
+    # 보관 기간이 지나면 제거
+    assert evict_jobs(retention=0) >= 1
+    assert get_job(job['id']) is None
+    assert job['id'] not in payroll_batch._jobs
+
+
+
+def test_mid_month_hire_gets_full_base_salary(app):
+    """일괄 생성도 개별/벌크 생성과 같이 기본급 전액 지급 (일할 계산 없음)"""
+    from datetime import date
+    from src.database import db
+    from src.models.employee import Employee
+    from src.models.payroll import Payroll
+
+    db.session.add(Employee(
+        user_id=10, employee_number='E00010', name='중도입사', email='mid@company.com',
+        hire_date=date(2025, 4, 17), salary=3000000, status='active'
+    ))
+    db.session.commit()
+
+    job, _ = start_payroll_batch(app, 2025, 4, created_by=1)
+    assert _wait(job['id'])['status'] == 'completed'
+
+    payroll = Payroll.query.filter_by(year=2025, month=4).one()
+    assert payroll.base_salary == 3000000
+
+
+def test_bulk_create_reports_invalid_fields_per_row(app, client, auth_header):
+    """employee_id/year/month 형식 오류는 500 대신 행별 오류로 보고, 숫자 문자열은 정수로 변환"""
+    from datetime import date
+    from src.database import db
+    from src.models.employee import Employee
+    from src.models.payroll import Payroll
+
+    employee = Employee(
+        user_id=11, employee_number='E00011', name='일괄', email='bulk@company.com',
+        hire_date=date(2020, 1, 1), salary=3000000, status='active'
+    )
+    db.session.add(employee)
+    db.session.commit()
+
+    response = client.post('/api/payrolls/bulk', headers=auth_header(), json={'payrolls': [
+        {'employee_id': str(employee.id), 'year': '2025', 'month': '5', 'base_salary': 3000000},
+        {'employee_id': [employee.id], 'year': 2025, 'month': 6, 'base_salary': 3000000},
+        {'employee_id': employee.id, 'year': 'abc', 'month': 6, 'base_salary': 3000000},
+        {'employee_id': employee.id, 'year': 2025, 'month': 13, 'base_salary': 3000000},
+        {'employee_id': {'id': 1}, 'year': 2025, 'month': 7, 'base_salary': 3000000},
+    ]})
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['created'] == 1
+    assert [error['index'] for error in body['errors']] == [1, 2, 3, 4]
+    assert body['errors'][0]['error'].startswith('employee_id')
+    assert body['errors'][1]['error'].startswith('year')
+    assert body['errors'][2]['error'].startswith('month')
+
+    payroll = Payroll.query.one()
+    assert (payroll.employee_id, payroll.year, payroll.month) == (employee.id, 2025, 5)
@@ -0,0 +1,80 @@
+"""
+기간 조회 실행 계획 테스트
+- period 헬퍼의 반열린 범위 조건이 날짜 컬럼 인덱스를 사용하는지 EXPLAIN QUERY PLAN으로 확인
+- 날짜 컬럼에 extract()/strftime()을 다시 씌우면 SCAN으로 바뀌어 실패
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select, extract, text
+
+from src.database import db
+from src.models.attendance import AttendanceRecord
+from src.models.annual_leave_usage import AnnualLeaveUsage
+from src.models.audit_log import AuditLog
+from src.utils.period import in_range, month_range, year_range, date_span, sql_range_params
+
+
+def query_plan(statement, params=None):
+    """EXPLAIN QUERY PLAN 상세 문자열 목록 (ORM 구문은 값까지 SQL에 포함하여 컴파일)"""
+    if not isinstance(statement, str):
+        statement = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+    rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {statement}'), params or {}).fetchall()
+    return [row[-1] for row in rows]
+
+
+def assert_index_search(plan, table, index):
+    assert any(step.startswith(f'SEARCH {table} USING') and index in step for step in plan), plan
+    assert not any(step.startswith(f'SCAN {table}') for step in plan), plan
+
+
+@pytest.mark.parametrize('statement, index', [
+    # 대시보드 개요/월별 집계: 전사 월간 범위
+    (select(AttendanceRecord.id).where(in_range(AttendanceRecord.date, *month_range(2025, 3))),
+     'idx_attendance_date_status'),
+    # 리포트 내보내기: 임의 기간(종료일 포함)
+    (select(AttendanceRecord.id).where(in_range(AttendanceRecord.date, *date_span(date(2025, 1, 1), date(2025, 1, 31)))),
+     'idx_attendance_date_status'),
+    # 직원별 월간 기록
+    (select(AttendanceRecord.id).where(
+        AttendanceRecord.employee_id == 1, in_range(AttendanceRecord.date, *month_range(2025, 3))),
+     'idx_attendance_employee_date'),
+])
+def test_attendance_range_uses_index(app, statement, index):
+    assert_index_search(query_plan(statement), 'attendance_records', index)
+
+
+def test_annual_leave_usage_year_range_uses_index(app):
+    # 대시보드 연간 연차 사용 통계
+    statement = select(AnnualLeaveUsage.used_days).where(in_range(AnnualLeaveUsage.usage_date, *year_range(2025)))
+    assert_index_search(query_plan(statement), 'annual_leave_usages', 'idx_annual_leave_usages_usage_date')
+
+
+def test_annual_leave_usage_employee_year_raw_sql_uses_index(app):
+    # /my-annual-leave 원시 SQL
+    start, end = sql_range_params(*year_range(2025))
+    plan = query_plan(
+        'SELECT * FROM annual_leave_usages WHERE employee_id = :employee_id '
+        'AND usage_date >= :start AND usage_date < :end ORDER BY usage_date DESC',
+        {'employee_id': 1, 'start': start, 'end': end}
+    )
+    assert_index_search(plan, 'annual_leave_usages', 'idx_annual_leave_usages_employee_date')
+
+
+@pytest.mark.parametrize('statement, index', [
+    (select(AuditLog.id).where(in_range(AuditLog.created_at, *month_range(2025, 3))),
+     'idx_audit_logs_created_at'),
+    (select(AuditLog.id).where(AuditLog.user_id == 1, in_range(AuditLog.created_at, *date_span(date(2025, 3, 1), date(2025, 3, 31)))),
+     'idx_audit_logs_user_created'),
+    (select(AuditLog.id).where(AuditLog.entity_type == 'employee', in_range(AuditLog.created_at, *year_range(2025))),
+     'idx_audit_logs_entity_created'),
+])
+def test_audit_log_range_uses_index(app, statement, index):
+    assert_index_search(query_plan(statement), 'audit_logs', index)
+
+
+def test_extract_predicate_scans(app):
+    """비교 기준: 날짜 컬럼에 함수를 씌우면 인덱스를 쓰지 못함"""
+    statement = select(AnnualLeaveUsage.used_days).where(extract('year', AnnualLeaveUsage.usage_date) == 2025)
+    assert any(step.startswith('SCAN annual_leave_usages') for step in query_plan(statement))
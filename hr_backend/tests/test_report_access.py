@@ -0,0 +1,35 @@
+"""
+리포트 다운로드/내보내기 권한 테스트 (직원별 출근/급여 상세는 관리자만)
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize('method, url, body', [
+    ('post', '/api/dashboard/reports/download', {'report_type': 'payroll', 'format': 'csv', 'year': 2025, 'month': 1}),
+    ('post', '/api/dashboard/reports/download', {'report_type': 'attendance', 'format': 'csv', 'year': 2025, 'month': 1}),
+    ('get', '/api/dashboard/reports/export?report_type=payroll', None),
+    ('get', '/api/dashboard/reports/export?report_type=attendance&department_id=1', None),
+])
+def test_detailed_reports_require_admin(client, auth_header, method, url, body):
+    user_headers = auth_header(user_id=2, role='user', username='user')
+    response = getattr(client, method)(url, json=body, headers=user_headers)
+    assert response.status_code == 403
+
+    response = getattr(client, method)(url, json=body, headers=auth_header())
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+
+
+@pytest.mark.parametrize('report_type, format_type', [
+    ('summary', 'pdf'),
+    ('attendance', 'csv'),
+    ('payroll', 'csv'),
+    ('payroll', 'pdf'),
+    ('evaluation', 'csv'),
+    ('payslips', 'zip'),
+])
+def test_report_jobs_require_admin(client, auth_header, report_type, format_type):
+    body = {'report_type': report_type, 'format': format_type, 'year': 2025, 'month': 1}
+    response = client.post('/api/reports/jobs', json=body, headers=auth_header(user_id=2, role='user', username='user'))
+    assert response.status_code == 403